@@ -4,7 +4,7 @@ from enum import Enum
 
 from PyQt5.QtCore import QLocale
 from qfluentwidgets import (qconfig, QConfig, ConfigItem, OptionsConfigItem, BoolValidator,
-                            OptionsValidator, Theme, FolderValidator, ConfigSerializer)
+                            OptionsValidator, Theme, FolderValidator, ConfigSerializer, ConfigValidator)
 
 from .setting import CONFIG_FILE
 
@@ -27,6 +27,23 @@ class LanguageSerializer(ConfigSerializer):
         return Language(QLocale(value)) if value != "Auto" else Language.AUTO
 
 
+class HeuristicValidator(ConfigValidator):
+    """ Solver heuristic spec validator, falls back to auto
+
+    Only the shape of the spec is checked when the config loads, so loading it does not import
+    the solver; the heuristic names are checked by Config.heuristicFor when a solve starts.
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def validate(self, value):
+        return isinstance(value, str) and bool(value.strip())
+
+    def correct(self, value):
+        return value if self.validate(value) else "auto"
+
+
 def isWin11():
     return sys.platform == 'win32' and sys.getwindowsversion().build >= 22000
 
@@ -36,6 +53,19 @@ class Config(QConfig):
 
     # TODO: ADD YOUR CONFIG GROUP HERE
 
+    # solver heuristic per grid size, e.g. "walking_distance" or "max:linear_conflict,walking_distance"
+    heuristic3x3 = ConfigItem("Solver", "Heuristic3x3", "auto", HeuristicValidator(3))
+    heuristic4x4 = ConfigItem("Solver", "Heuristic4x4", "auto", HeuristicValidator(4))
+    heuristic5x5 = ConfigItem("Solver", "Heuristic5x5", "auto", HeuristicValidator(5))
+
+    # game settings (shown in the setting interface)
+    soundEnabled = ConfigItem("setting", "sound", True, BoolValidator())
+    timerEnabled = ConfigItem("setting", "timer", True, BoolValidator())
+    themeIndex = OptionsConfigItem("setting", "theme", 0, OptionsValidator([0, 1, 2]))
+
+    # background music, an empty folder plays the bundled track
+    musicFolder = ConfigItem("Music", "Folder", "")
+    musicShuffle = ConfigItem("Music", "Shuffle", False, BoolValidator())
 
     # main window
     micaEnabled = ConfigItem("MainWindow", "MicaEnabled", isWin11(), BoolValidator())
@@ -47,6 +77,15 @@ class Config(QConfig):
     # software update
     checkUpdateAtStartUp = ConfigItem("Update", "CheckUpdateAtStartUp", True, BoolValidator())
 
+    def heuristicFor(self, size):
+        """ heuristic spec configured for the grid size """
+        item = getattr(self, f"heuristic{size}x{size}", None)
+        if item is None:
+            return "auto"
+        from ..core.heuristics import isValidSpec
+        spec = self.get(item)
+        return spec if isValidSpec(spec, size) else "auto"
+
 
 cfg = Config()
 cfg.themeMode.value = Theme.AUTO
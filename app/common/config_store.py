@@ -0,0 +1,95 @@
+# coding: utf-8
+import json
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from qfluentwidgets import Theme
+
+from app.common.config import cfg
+from app.components.autosave import AutoSaver
+
+"""
+配置服务
+
+config.json 只在启动时由 qconfig.load 读取一次，之后所有读写都走内存中的 cfg。
+修改配置只更新内存并标记脏，合并一段时间内的修改后在后台线程原子写盘
+（先写临时文件再重命名），界面线程不做任何磁盘 I/O。
+"""
+
+# 配置修改后延迟写盘的时间（毫秒），期间的多次修改合并为一次写入
+CONFIG_SAVE_DELAY = 500
+
+# 设置页面主题下拉框的下标 -> 主题
+THEMES = (Theme.LIGHT, Theme.DARK, Theme.AUTO)
+
+
+class ConfigStore(QObject):
+    """ In-memory config service with coalesced background writes """
+
+    soundChanged = pyqtSignal(bool)
+    timerChanged = pyqtSignal(bool)
+    themeChanged = pyqtSignal(int)
+    musicFolderChanged = pyqtSignal(str)
+    musicShuffleChanged = pyqtSignal(bool)
+
+    def __init__(self, config=cfg, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.saver = AutoSaver(config.file, self.snapshot, CONFIG_SAVE_DELAY, self)
+        # valueChanged 的参数类型是 object，不能直接连接到带类型的信号，转换后再发出
+        config.soundEnabled.valueChanged.connect(lambda value: self.soundChanged.emit(bool(value)))
+        config.timerEnabled.valueChanged.connect(lambda value: self.timerChanged.emit(bool(value)))
+        config.themeIndex.valueChanged.connect(lambda value: self.themeChanged.emit(int(value)))
+        config.musicFolder.valueChanged.connect(lambda value: self.musicFolderChanged.emit(str(value or "")))
+        config.musicShuffle.valueChanged.connect(lambda value: self.musicShuffleChanged.emit(bool(value)))
+
+    def soundEnabled(self):
+        return bool(self.config.get(self.config.soundEnabled))
+
+    def timerEnabled(self):
+        return bool(self.config.get(self.config.timerEnabled))
+
+    def themeIndex(self):
+        return int(self.config.get(self.config.themeIndex))
+
+    def theme(self):
+        return THEMES[self.themeIndex()]
+
+    def musicFolder(self):
+        """音乐文件夹，为空时播放自带的音乐"""
+        return str(self.config.get(self.config.musicFolder) or "")
+
+    def musicShuffle(self):
+        return bool(self.config.get(self.config.musicShuffle))
+
+    def setSoundEnabled(self, enabled):
+        self.set(self.config.soundEnabled, enabled)
+
+    def setTimerEnabled(self, enabled):
+        self.set(self.config.timerEnabled, enabled)
+
+    def setThemeIndex(self, index):
+        self.set(self.config.themeIndex, index)
+
+    def setMusicFolder(self, folder):
+        self.set(self.config.musicFolder, folder)
+
+    def setMusicShuffle(self, shuffle):
+        self.set(self.config.musicShuffle, shuffle)
+
+    def set(self, item, value):
+        """修改配置项（发出该项的变化信号），稍后在后台写盘"""
+        if self.config.get(item) == value:
+            return
+        self.config.set(item, value, save=False)
+        self.saver.markDirty()
+
+    def snapshot(self):
+        """在界面线程中序列化当前配置"""
+        return json.dumps(self.config.toDict(), ensure_ascii=False, indent=4).encode("utf-8")
+
+    def flush(self):
+        """立即写入未保存的修改并等待完成（退出时使用）"""
+        self.saver.flush()
+
+
+configStore = ConfigStore()
@@ -0,0 +1,33 @@
+# coding: utf-8
+import os
+from pathlib import Path
+
+"""
+文件工具
+
+所有写入 AppData 的数据文件都先写到同目录下的临时文件，再用 os.replace 原子替换，
+程序中途退出或崩溃时不会留下只写了一半的文件。
+"""
+
+
+def atomicWrite(path, data):
+    """
+    原子写入文件，必要时创建上级目录
+
+    data 为 bytes 类对象，或由若干 bytes 类对象组成的 list/tuple（依次写入，避免拼接大块数据）。
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    chunks = data if isinstance(data, (list, tuple)) else (data,)
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
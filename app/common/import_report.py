@@ -0,0 +1,58 @@
+# coding: utf-8
+import argparse
+import subprocess
+import sys
+
+"""
+导入耗时报告
+
+在子进程中以 python -X importtime 导入启动路径上的模块，解析 stderr，
+按累计耗时（或自身耗时）列出最慢的导入。
+
+用法：python main.py --import-report [--top 30] [--sort self] [--module app.view.main_window]
+"""
+
+DEFAULT_MODULE = "app.view.main_window"
+
+
+def collectImportTimes(module=DEFAULT_MODULE):
+    """返回 [(自身微秒, 累计微秒, 模块名)]"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "导入失败")
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py --import-report", description="列出启动路径上最慢的导入")
+    parser.add_argument("--top", type=int, default=25, help="显示的条数")
+    parser.add_argument("--sort", choices=("cumulative", "self"), default="cumulative", help="排序依据")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="要分析的模块")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = collectImportTimes(args.module)
+    except RuntimeError as e:
+        print(f"导入 {args.module} 失败: {e}", file=sys.stderr)
+        return 1
+    key = 1 if args.sort == "cumulative" else 0
+    total = next((row[1] for row in rows if row[2] == args.module), 0)
+
+    print(f"导入 {args.module} 共 {total / 1000:.1f} ms，{len(rows)} 个模块")
+    print(f"{'自身(ms)':>10} {'累计(ms)':>10}  模块")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: row[key], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>10.1f}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# coding: utf-8
+import sys
+import time
+
+"""
+启动耗时跟踪
+
+模块第一次被导入时记为起点（main.py 最先导入它），之后用 mark() 记录各个阶段，
+以 --trace-startup 启动时在首帧绘制和后台页面构建完成后把时间线打印到 stderr。
+"""
+
+_START = time.perf_counter()
+
+
+class StartupTrace:
+    """ Startup timeline """
+
+    def __init__(self):
+        self.enabled = "--trace-startup" in sys.argv
+        self.marks = []
+
+    def elapsed(self):
+        """距起点的毫秒数"""
+        return (time.perf_counter() - _START) * 1000
+
+    def mark(self, name, duration=None):
+        """记录一个阶段，duration 为该阶段自身耗时（毫秒，可选）"""
+        self.marks.append((self.elapsed(), name, duration))
+
+    def report(self, title="启动时间线"):
+        if not self.enabled:
+            return
+        lines = [f"[{title}]"]
+        for at, name, duration in self.marks:
+            extra = f"  (耗时 {duration:.1f} ms)" if duration is not None else ""
+            lines.append(f"  {at:9.1f} ms  {name}{extra}")
+        print("\n".join(lines), file=sys.stderr)
+
+
+trace = StartupTrace()
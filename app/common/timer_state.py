@@ -0,0 +1,21 @@
+# coding: utf-8
+
+"""
+全局计时器开关
+
+放在不依赖界面和求解器的轻量模块里，主窗口在首帧之前就能设置，而不必导入拼图界面。
+"""
+
+# 控制计时器是否启用
+timerEnabled = True
+
+
+def setTimerEnabled(enabled):
+    """设置全局计时器启用状态"""
+    global timerEnabled
+    timerEnabled = enabled
+
+
+def getTimerEnabled():
+    """获取全局计时器启用状态"""
+    return timerEnabled
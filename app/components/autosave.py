@@ -0,0 +1,79 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer
+import threading
+
+from app.core.save_game import deleteSave, writeSave
+
+"""
+节流的后台自动存档
+
+界面只调用 markDirty()，它只是记一个版本号并（必要时）启动定时器，不做任何 I/O。
+定时器到期后在 GUI 线程里取一次快照（几十 KB 以内的字节拷贝），
+编码好的数据交给单线程的线程池写盘，写入顺序与快照顺序一致。
+"""
+
+# 两次写盘之间的最短间隔（毫秒）
+AUTOSAVE_INTERVAL = 2000
+
+
+class _WriteTask(QRunnable):
+    def __init__(self, saver, data):
+        super().__init__()
+        self.saver = saver
+        self.data = data
+
+    def run(self):
+        self.saver.writeNow(self.data)
+
+
+class AutoSaver(QObject):
+    """
+    自动存档
+
+    snapshot() 在 GUI 线程中调用，返回编码后的存档字节，返回 None 表示删除存档。
+    """
+
+    def __init__(self, path, snapshot, interval=AUTOSAVE_INTERVAL, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.snapshot = snapshot
+        self.version = 0          # 状态每变化一次加一
+        self.saved_version = 0    # 已经写盘的版本
+        self._lock = threading.Lock()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.save)
+
+    def markDirty(self):
+        """记录状态已变化，最迟 interval 毫秒后保存"""
+        self.version += 1
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def isDirty(self):
+        return self.version != self.saved_version
+
+    def save(self):
+        """取快照并交给后台线程写盘，状态没有变化时什么也不做"""
+        if not self.isDirty():
+            return
+        self._pool.start(_WriteTask(self, self.snapshot()))
+        self.saved_version = self.version
+
+    def flush(self):
+        """立即保存并等待写盘完成（关闭窗口时使用）"""
+        self._timer.stop()
+        self.save()
+        self._pool.waitForDone()
+
+    def writeNow(self, data):
+        with self._lock:
+            try:
+                if data is None:
+                    deleteSave(self.path)
+                else:
+                    writeSave(self.path, data)
+            except OSError:
+                pass  # 存档失败不影响游戏，下次状态变化时会重新写入
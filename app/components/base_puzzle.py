@@ -1,64 +1,36 @@
 from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout,
-                             QGridLayout, QSizePolicy, QFileDialog)
-from PyQt5.QtCore import Qt, QSize, QUrl, pyqtSignal, QTimer
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPainterPath, QColor, QFont
+                             QSizePolicy, QFileDialog, QShortcut)
+from PyQt5.QtCore import Qt, QSize, QUrl, QTimer
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QPainterPath, QColor, QFont, QKeySequence
 from qfluentwidgets import (PushButton, ComboBox, FluentIcon as FIF,
                             PrimaryPushButton, setFont, FluentIcon,
-                            MessageBox, MessageBoxBase, SubtitleLabel)
+                            MessageBox, MessageBoxBase, SubtitleLabel,
+                            InfoBar, InfoBarPosition, StateToolTip, Slider,
+                            BodyLabel, ToolButton)
 from qfluentwidgets import StrongBodyLabel, TitleLabel, CardWidget
-import random
+from app.core.board import PuzzleBoard, DIRECTION_NAMES, stepTable
+from app.core.history import MoveHistory
+from app.core.save_game import SaveGame, encodeSave, imageIdentity, readSave, saveFile
+from app.core.replay import REPLAY_FOLDER, ReplayRecorder, loadReplay, saveReplay
+from app.core.solver import movesToPositions
+from app.core.generator import randomSolvable
+from app.core.level_pack import DIFFICULTY_TIERS, loadLevelPack
+from app.components.solver_worker import SolverWorker
+from app.components.solution_player import SolutionPlayer
+from app.components.puzzle_board_widget import PuzzleBoardWidget
+from app.components.image_loader import ImageLoader
+from app.components.autosave import AutoSaver
+from app.components.replay_viewer import ReplayViewerBox
+from app.common.config import cfg
 import os
+import random
+
+from app.common.timer_state import getTimerEnabled
 
 """
 拼图基类，子类通过继承基类并设置 grid_size 来控制拼图难度
 """
 
-# 控制计时器是否启用
-timerEnabled = True
-
-def setTimerEnabled(enabled):
-    """设置全局计时器启用状态"""
-    global timerEnabled
-    timerEnabled = enabled
-
-def getTimerEnabled():
-    """获取全局计时器启用状态"""
-    return timerEnabled
-
-class ClickableLabel(QLabel):
-    """可点击的标签，用于拼图块构造"""
-    clicked = pyqtSignal(int)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAlignment(Qt.AlignCenter)
-        self.index = -1
-        self.empty = False
-        self.setStyleSheet("""
-            ClickableLabel {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-            }
-            ClickableLabel:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-            }
-        """)
-
-    def mousePressEvent(self, event):
-        if not self.empty:
-            self.clicked.emit(self.index)
-
-
-class PuzzleGridWidget(QWidget):
-    """拼图网格容器"""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.layout = QGridLayout(self)
-        self.layout.setSpacing(2)
-        self.setLayout(self.layout)
-
-
 class ImagePreviewBox(MessageBoxBase):
     """原图预览对话框"""
     def __init__(self, image: QPixmap, parent=None):
@@ -97,10 +69,13 @@ class BasePuzzleInterface(QWidget):
         self.empty_piece_index = self.total_pieces - 1  # 最后一块为空白块
         self.object_name = object_name  # 存储对象名称，子类如果不覆盖可能会导致 PyQt5 管理对象时出现问题
         
-        self.labels = []
         self.current_image = None
-        self.piece_pixmaps = []
-        self.current_positions = list(range(self.total_pieces))
+        self.board_pixmap = None  # 缩放到棋盘大小的整张图片，拼图块按源矩形从中绘制
+        self.board = PuzzleBoard(grid_size)  # 拼图状态引擎，tiles[位置] = 拼图块编号
+        self.history = MoveHistory(grid_size)  # 本局走子记录，支持撤销/重做
+        self.dirty_positions = set()         # 等待重绘的位置
+        self.tile_update_count = 0           # 累计重绘的拼图块数量
+        self.last_update_count = 0           # 最近一次刷新重绘的拼图块数量
         self.moving = False
         self.timer = QTimer()
         self.timer.timeout.connect(self.updateTimer)
@@ -110,38 +85,66 @@ class BasePuzzleInterface(QWidget):
         # 拼图区域的基础大小设置
         self.puzzle_area_width = 600
         self.puzzle_area_height = 600
+
+        # 求解预算，超出后退化为加权搜索；求解在后台进程中进行，不会阻塞界面
+        self.solver_max_nodes = None
+        self.solver_time_limit = 10.0
+        self.hint_time_limit = 3.0
+        self.solver_worker = None
+        self.stateTooltip = None
+
+        # 解法回放
+        self.player = SolutionPlayer(self)
+        self.player.stepped.connect(self.playbackStep)
+        self.player.progressChanged.connect(self.onPlaybackProgress)
+        self.player.pausedChanged.connect(self.onPlaybackPaused)
+        self.player.finished.connect(self.onPlaybackFinished)
+        self.solve_info = ""
+
+        # 后台图片加载
+        self.image_loader = ImageLoader(self)
+        self.image_loader.loaded.connect(self.onImageLoaded)
+        self.image_loader.failed.connect(self.onImageLoadFailed)
+        self.image_path = None
+        self.image_identity = (0, 0)
+
+        # 自动存档：状态变化时节流写盘，启动时恢复未完成的对局
+        self.autosaver = AutoSaver(saveFile(grid_size), self.snapshotGame, parent=self)
+        self.pending_save = None
+
+        # 对局录像：打乱时开始，完成或放弃时写入 AppData/replays
+        self.recorder = None
         
         self.initUI()
 
+        # 撤销/重做快捷键，只在当前显示的界面上生效
+        QShortcut(QKeySequence("Ctrl+Z"), self, self.undoMove)
+        QShortcut(QKeySequence("Ctrl+Y"), self, self.redoMove)
+        QShortcut(QKeySequence("Ctrl+Shift+Z"), self, self.redoMove)
+
+        self.restoreGame()
+
+    @property
+    def current_positions(self):
+        """当前排列（只读副本），状态由 self.board 维护"""
+        return self.board.positions()
+
     def initUI(self):
         mainLayout = QHBoxLayout(self)
 
         puzzleLayout = QVBoxLayout()
         puzzleLayout.setAlignment(Qt.AlignTop)
 
-        self.puzzleGridWidget = PuzzleGridWidget(self)
-        self.gridLayout = self.puzzleGridWidget.layout
-
         # 根据网格大小计算每个拼图块的大小
         self.piece_size = min(self.puzzle_area_width, self.puzzle_area_height) // self.grid_size
-        
-        # 创建拼图标签
-        for i in range(self.total_pieces):
-            label = ClickableLabel(self.puzzleGridWidget)
-            label.setFixedSize(self.piece_size, self.piece_size)
-            label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            label.index = i
-            label.clicked.connect(self.labelClicked)
-            self.labels.append(label)
-            self.gridLayout.addWidget(label, i // self.grid_size, i % self.grid_size)
-
-        # 设置拼图网格大小
-        self.puzzleGridWidget.setFixedSize(
-            self.piece_size * self.grid_size + 2 * (self.grid_size - 1),
-            self.piece_size * self.grid_size + 2 * (self.grid_size - 1)
-        )
 
-        puzzleLayout.addWidget(self.puzzleGridWidget)
+        # 整个棋盘由一个自绘控件完成，拼图块之间保留 2px 间隙
+        self.boardWidget = PuzzleBoardWidget(self.grid_size, self.piece_size, spacing=2, parent=self)
+        self.boardWidget.setBoard(self.board)
+        self.boardWidget.clicked.connect(self.labelClicked)
+        self.boardWidget.directionPressed.connect(self.moveByKey)
+
+        puzzleLayout.addWidget(self.boardWidget)
 
         # 控制面板
         controlLayout = QVBoxLayout()
@@ -168,6 +171,14 @@ class BasePuzzleInterface(QWidget):
         self.levelComboBox.currentIndexChanged.connect(self.onLevelChanged)
         controlLayout.addWidget(self.levelComboBox)
 
+        # 子关卡：按预生成关卡包中的步数分级，打乱时直接取包中的棋盘
+        self.tierComboBox = ComboBox(self)
+        self.tierComboBox.addItems(["随机打乱"] + [
+            f"{name}（约 {min_moves}-{max_moves} 步）"
+            for name, min_moves, max_moves in DIFFICULTY_TIERS.get(self.grid_size, ())
+        ])
+        controlLayout.addWidget(self.tierComboBox)
+
         self.fileButton = PushButton(FIF.FOLDER, "选择图片", self)
         self.fileButton.clicked.connect(self.selectImage)
         self.fileButton.hide()
@@ -181,10 +192,47 @@ class BasePuzzleInterface(QWidget):
         self.solveButton.clicked.connect(self.solvePuzzle)
         controlLayout.addWidget(self.solveButton)
 
+        self.hintButton = PushButton(FIF.HELP, "提示", self)
+        self.hintButton.clicked.connect(self.showHint)
+        controlLayout.addWidget(self.hintButton)
+
+        # 回放控制面板，仅在自动通关回放时显示
+        self.playbackPanel = QWidget(self)
+        playbackLayout = QVBoxLayout(self.playbackPanel)
+        playbackLayout.setContentsMargins(0, 0, 0, 0)
+        playbackButtonLayout = QHBoxLayout()
+        self.pauseButton = ToolButton(FIF.PAUSE, self.playbackPanel)
+        self.pauseButton.setToolTip("暂停/继续")
+        self.pauseButton.clicked.connect(self.player.togglePause)
+        self.stepButton = ToolButton(FIF.CHEVRON_RIGHT, self.playbackPanel)
+        self.stepButton.setToolTip("单步")
+        self.stepButton.clicked.connect(self.player.step)
+        self.stopButton = ToolButton(FIF.CANCEL, self.playbackPanel)
+        self.stopButton.setToolTip("停止回放")
+        self.stopButton.clicked.connect(self.player.cancel)
+        self.playbackLabel = BodyLabel("0 / 0", self.playbackPanel)
+        playbackButtonLayout.addWidget(self.pauseButton)
+        playbackButtonLayout.addWidget(self.stepButton)
+        playbackButtonLayout.addWidget(self.stopButton)
+        playbackButtonLayout.addWidget(self.playbackLabel, 1, Qt.AlignRight)
+        self.speedSlider = Slider(Qt.Horizontal, self.playbackPanel)
+        self.speedSlider.setRange(1, 200)
+        self.speedSlider.setValue(self.player.speed)
+        self.speedSlider.setToolTip("回放速度（步/秒）")
+        self.speedSlider.valueChanged.connect(self.player.setSpeed)
+        playbackLayout.addLayout(playbackButtonLayout)
+        playbackLayout.addWidget(self.speedSlider)
+        self.playbackPanel.hide()
+        controlLayout.addWidget(self.playbackPanel)
+
         self.showImageButton = PushButton(FluentIcon.PHOTO, "查看原图", self)
         self.showImageButton.clicked.connect(self.showOriginalImage)
         controlLayout.addWidget(self.showImageButton)
 
+        self.replayButton = PushButton(FIF.HISTORY, "查看回放", self)
+        self.replayButton.clicked.connect(self.openReplay)
+        controlLayout.addWidget(self.replayButton)
+
         # 添加空白间距
         spacer = QWidget()
         spacer.setFixedHeight(30)
@@ -273,19 +321,38 @@ class BasePuzzleInterface(QWidget):
         if fileName:
             self.loadImage(fileName)
 
-    def loadImage(self, image_path):
-        """加载图片并分割成拼图块"""
+    def loadImage(self, image_path, save=None):
+        """
+        在后台线程中解码并裁剪图片，完成前棋盘显示占位提示
+
+        save 为解码完成后要恢复的存档；必须在 load 之前记下，命中缓存时 loaded 会同步发出
+        """
+        self.player.cancel()
+        self.stopSolver()
+        self.pending_save = save
+        self.image_path = image_path
+        self.board_pixmap = None
+        self.boardWidget.setAtlas(None)
+        self.boardWidget.setPlaceholderText("图片加载中…")
+        # 解码时直接缩放到棋盘大小
+        self.image_loader.load(image_path, self.grid_size, self.piece_size)
+
+    def onImageLoaded(self, request_id, image_path, image, elapsed):
+        """图片解码完成（GUI 线程）"""
+        if not self.image_loader.isCurrent(request_id):
+            return  # 已经选择了其他图片
         try:
-            self.current_image = QPixmap(image_path)
-            # 将图片裁剪成正方形
-            size = min(self.current_image.width(), self.current_image.height())
-            self.current_image = self.current_image.copy(
-                (self.current_image.width() - size) // 2,
-                (self.current_image.height() - size) // 2,
-                size, size
-            )
+            self.current_image = QPixmap.fromImage(image)
             self.splitImage()
-            self.current_positions = list(range(self.total_pieces))
+            self.image_identity = imageIdentity(image_path)
+            save, self.pending_save = self.pending_save, None
+            if save is not None and save.image_path == image_path:
+                self.restoreBoard(save)
+            else:
+                self.finishRecording()
+                self.resetBoard()
+                self.autosaver.markDirty()
+            self.boardWidget.setPlaceholderText("")
             self.updateDisplay()
             
             # 更新关卡显示
@@ -295,79 +362,98 @@ class BasePuzzleInterface(QWidget):
                     '\u4e00' <= char <= '\u9fff' for char in file_name) else file_name[:6] + '...'
             # self.levelLabel.setText(f"关卡：{file_name}")
         except Exception as e:
-            MessageBox(
-                "错误",
-                f"加载图片时出错: {str(e)}",
-                self
-            ).exec()
+            self.onImageLoadFailed(request_id, image_path, str(e))
+
+    def onImageLoadFailed(self, request_id, image_path, error):
+        if not self.image_loader.isCurrent(request_id):
+            return
+        self.boardWidget.setPlaceholderText("")
+        MessageBox(
+            "错误",
+            f"加载图片时出错: {error}",
+            self
+        ).exec()
 
     def splitImage(self):
-        """将图片分割成拼图块"""
+        """将图片缩放为整块棋盘大小的贴图，拼图块直接按源矩形绘制，不再逐块复制和缩放"""
         if not self.current_image:
             return
 
-        self.piece_pixmaps = []
-        piece_image_size = self.current_image.width() // self.grid_size
-        
-        for i in range(self.total_pieces):
-            row = i // self.grid_size
-            col = i % self.grid_size
-            piece = self.current_image.copy(
-                col * piece_image_size,
-                row * piece_image_size,
-                piece_image_size,
-                piece_image_size
-            )
-            # 缩放到标签大小
-            piece = piece.scaled(self.piece_size, self.piece_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.piece_pixmaps.append(piece)
+        board_pixels = self.piece_size * self.grid_size
+        if self.current_image.width() == board_pixels and self.current_image.height() == board_pixels:
+            # 后台解码时已经缩放到棋盘大小
+            self.board_pixmap = self.current_image
+        else:
+            self.board_pixmap = self.current_image.scaled(
+                board_pixels, board_pixels, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.boardWidget.setAtlas(self.board_pixmap)
+
+    def markDirty(self, *positions):
+        """标记需要重绘的位置，实际绘制推迟到 flushDisplay"""
+        self.dirty_positions.update(positions)
+
+    def flushDisplay(self):
+        """只重绘被标记的拼图块"""
+        if self.board_pixmap is None:
+            self.dirty_positions.clear()
+            return
 
-    def updateDisplay(self):
-        """更新拼图显示"""
-        if not self.piece_pixmaps:
+        self.updatePieces(self.dirty_positions)
+        self.dirty_positions.clear()
+
+    def updatePieces(self, positions):
+        """重绘指定位置的拼图块，并统计重绘数量"""
+        if self.board_pixmap is None:
             return
 
-        for i, label in enumerate(self.labels):
-            current_piece = self.current_positions[i]
-            if current_piece == self.empty_piece_index:
-                label.clear()
-                label.empty = True
-            else:
-                label.setPixmap(self.piece_pixmaps[current_piece])
-                label.empty = False
+        count = self.boardWidget.updateTiles(positions)
+        self.tile_update_count += count
+        self.last_update_count = count
+
+    def updateDisplay(self):
+        """全量刷新拼图显示，仅在加载图片、打乱和复原时使用"""
+        self.dirty_positions.clear()
+        self.boardWidget.setBlankVisible(False)
+        self.updatePieces(range(self.total_pieces))
 
     def shufflePuzzle(self):
         """打乱拼图"""
-        if not self.piece_pixmaps or self.moving:
+        if self.board_pixmap is None or self.moving or self.solver_worker is not None or self.player.isActive():
             return
 
         self.resetTimer()
 
-        empty_index = self.current_positions.index(self.empty_piece_index)
-        current_empty = empty_index
-
-        # 通过随机移动来打乱拼图
-        for _ in range(1000):  # 增加打乱次数确保充分混乱
-            possible_moves = []
-            row = current_empty // self.grid_size
-            col = current_empty % self.grid_size
-
-            # 找到可以移动的位置
-            if row > 0: possible_moves.append(current_empty - self.grid_size)
-            if row < self.grid_size - 1: possible_moves.append(current_empty + self.grid_size)
-            if col > 0: possible_moves.append(current_empty - 1)
-            if col < self.grid_size - 1: possible_moves.append(current_empty + 1)
-
-            next_empty = random.choice(possible_moves)
-            self.current_positions[current_empty], self.current_positions[next_empty] = \
-                self.current_positions[next_empty], self.current_positions[current_empty]
-            current_empty = next_empty
+        # 记录种子，录像可以据此重现打乱结果
+        seed = random.getrandbits(32)
+        self.resetBoard(self.pickShuffledTiles(random.Random(seed)))
+        self.startRecording(seed)
 
         self.updateDisplay()
+        # 打乱后直接可以用方向键操作
+        self.boardWidget.setFocus()
+        self.autosaver.markDirty()
+
+    def resetBoard(self, tiles=None):
+        """重置棋盘（默认完成状态），并以新局面开始新的走子记录"""
+        self.board.reset(tiles)
+        self.history.reset(self.board.tiles)
+
+    def pickShuffledTiles(self, rng=random):
+        """按所选子关卡从关卡包中取棋盘，随机打乱或关卡包不可用时均匀采样一个可解的排列"""
+        tier = self.tierComboBox.currentIndex() - 1
+        tiers = DIFFICULTY_TIERS.get(self.grid_size, ())
+        if 0 <= tier < len(tiers):
+            pack = loadLevelPack(self.grid_size)
+            if pack is not None:
+                _, min_moves, max_moves = tiers[tier]
+                level = pack.pick(min_moves, max_moves, rng)
+                if level is not None:
+                    return level[0]
+        return randomSolvable(self.grid_size, rng)
 
     def labelClicked(self, clicked_index):
-        """处理拼图块点击事件"""
-        if not self.piece_pixmaps or self.moving:
+        """处理拼图块点击事件：与空白块同一行/列的整排拼图块一起滑动，只更新一次状态和重绘"""
+        if self.board_pixmap is None or self.moving or self.isSolving() or self.player.isActive():
             return
 
         # 开始计时（仅在启用时）
@@ -377,52 +463,331 @@ class BasePuzzleInterface(QWidget):
 
         self.moving = True
         try:
-            empty_index = self.current_positions.index(self.empty_piece_index)
-            row1, col1 = clicked_index // self.grid_size, clicked_index % self.grid_size
-            row2, col2 = empty_index // self.grid_size, empty_index % self.grid_size
-
-            # 检查是否相邻
-            if abs(row1 - row2) + abs(col1 - col2) == 1:
-                self.current_positions[clicked_index], self.current_positions[empty_index] = \
-                    self.current_positions[empty_index], self.current_positions[clicked_index]
-                self.updateDisplay()
+            old_blank = self.board.blank
+            directions = self.board.slideTo(clicked_index)
+            if directions:
+                for direction in directions:
+                    self.recordMove(direction)
+                # 只有原空白块到被点击位置之间的一排发生变化
+                step = (clicked_index - old_blank) // len(directions)
+                self.markDirty(*range(old_blank, clicked_index + step, step))
+                self.flushDisplay()
+                self.autosaver.markDirty()
                 self.checkCompletion()
         finally:
             self.moving = False
 
+    def moveByKey(self, direction):
+        """方向键/WASD：把空白块旁边对应方向的拼图块移入空白处"""
+        target = stepTable(self.grid_size)[self.board.blank][direction]
+        if target >= 0:
+            self.labelClicked(target)
+
+    def recordMove(self, direction):
+        """把一步新的空白块移动写入走子记录和录像"""
+        self.history.push(direction)
+        if self.recorder is not None:
+            self.recorder.record(direction)
+
+    def canEditHistory(self):
+        return self.board_pixmap is not None and not self.moving and not self.isSolving() \
+            and not self.player.isActive()
+
+    def undoMove(self):
+        """撤销一步（Ctrl+Z）"""
+        if not self.canEditHistory():
+            return
+        direction = self.history.undo()
+        if direction is not None:
+            self.applyHistoryMove(direction)
+            # 从完成状态撤销时重新隐藏最后一块
+            self.boardWidget.setBlankVisible(False)
+
+    def redoMove(self):
+        """重做一步（Ctrl+Y / Ctrl+Shift+Z）"""
+        if not self.canEditHistory():
+            return
+        direction = self.history.redo()
+        if direction is not None:
+            self.applyHistoryMove(direction)
+            self.checkCompletion()
+
+    def applyHistoryMove(self, direction):
+        old_blank = self.board.blank
+        self.board.moveBlank(direction)
+        if self.recorder is not None:
+            self.recorder.record(direction)
+        self.markDirty(old_blank, self.board.blank)
+        self.flushDisplay()
+        self.autosaver.markDirty()
+
     def checkCompletion(self):
         """检查是否完成拼图"""
-        if self.current_positions == list(range(self.total_pieces)):
+        if self.board.isSolved():
             # 显示最后一块拼图
-            self.labels[self.empty_piece_index].setPixmap(self.piece_pixmaps[self.empty_piece_index])
-            self.labels[self.empty_piece_index].empty = False
+            self.boardWidget.setBlankVisible(True)
             self.timer.stop()
             self.timer_running = False
+            self.finishRecording(completed=True)
             MessageBox(
                 "恭喜",
                 f"恭喜你完成拼图！\n用时：{self.elapsed_time//60:02d}:{self.elapsed_time%60:02d}",
                 self
             ).exec()
 
+    def isSolving(self):
+        """一键通关的后台求解是否正在进行"""
+        return self.solver_worker is not None and self.solver_worker.purpose == "solve"
+
+    def startSolver(self, purpose, time_limit):
+        """启动后台求解，purpose 为 solve 或 hint"""
+        worker = SolverWorker(self.board.tiles, self.grid_size, max_nodes=self.solver_max_nodes,
+                              time_limit=time_limit, heuristic=cfg.heuristicFor(self.grid_size), parent=self)
+        worker.purpose = purpose
+        worker.start_tiles = bytes(self.board.tiles)
+        worker.progressChanged.connect(self.onSolverProgress)
+        worker.resultReady.connect(self.onSolverResult)
+        worker.finished.connect(worker.deleteLater)
+        self.solver_worker = worker
+
+        title = "正在求解" if purpose == "solve" else "正在计算提示"
+        self.stateTooltip = StateToolTip(title, "已扩展 0 个节点", self.window())
+        self.stateTooltip.closedSignal.connect(self.cancelSolver)
+        self.stateTooltip.move(self.stateTooltip.getSuitablePos())
+        self.stateTooltip.show()
+        worker.start()
+
+    def cancelSolver(self):
+        """取消后台求解"""
+        if self.solver_worker is not None:
+            self.solver_worker.cancel()
+        self.stateTooltip = None
+
+    def stopSolver(self):
+        """取消后台求解并等待线程结束（加载新图片、关闭窗口时调用）"""
+        worker = self.solver_worker
+        if worker is None:
+            return
+        self.solver_worker = None  # 之后到达的 resultReady 直接忽略
+        worker.stop()
+        if self.stateTooltip is not None:
+            self.stateTooltip.setContent("已取消")
+            self.stateTooltip.setState(True)
+            self.stateTooltip = None
+
+    def onSolverProgress(self, nodes, bound):
+        if self.sender() is self.solver_worker and self.stateTooltip is not None:
+            self.stateTooltip.setContent(f"已扩展 {nodes:,} 个节点，当前阈值 {bound:g}")
+
+    def onSolverResult(self, result):
+        worker = self.sender()
+        if worker is not self.solver_worker:
+            return  # 已被取消或替换的求解，迟到的结果不能影响当前的求解
+        self.solver_worker = None
+        if self.stateTooltip is not None:
+            self.stateTooltip.setContent("求解完成" if result.solved else "未找到解")
+            self.stateTooltip.setState(True)
+            self.stateTooltip = None
+        if result.reason == "cancelled":
+            return
+        # 求解期间棋盘已经变化（移动了拼图块或切换了图片），结果作废
+        if bytes(self.board.tiles) != worker.start_tiles:
+            return
+        if worker.purpose == "hint":
+            self.onHintResult(result)
+        else:
+            self.onSolveResult(result)
+
+    def showHint(self):
+        """计算下一步提示"""
+        if self.board_pixmap is None or self.solver_worker is not None or self.player.isActive() \
+                or self.board.isSolved():
+            return
+        self.startSolver("hint", self.hint_time_limit)
+
+    def onHintResult(self, result):
+        """提示的求解结果"""
+        if not result.solved or not result.moves:
+            InfoBar.warning(
+                title="提示",
+                content="暂时没有找到提示，请稍后再试",
+                orient=Qt.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=2000,
+                parent=self
+            )
+            return
+        target = movesToPositions(self.grid_size, self.board.blank, result.moves[:1])[0]
+        row, col = divmod(target, self.grid_size)
+        # 拼图块的移动方向与空白块相反
+        direction = DIRECTION_NAMES[result.moves[0] ^ 1]
+        InfoBar.info(
+            title="提示",
+            content=f"将第 {row + 1} 行第 {col + 1} 列的拼图块向{direction}移动（还需约 {result.length} 步）",
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=3000,
+            parent=self
+        )
+
     def solvePuzzle(self):
         """一键通关"""
-        if not self.piece_pixmaps or self.moving:
+        if self.board_pixmap is None or self.moving or self.solver_worker is not None or self.player.isActive():
             return
 
         self.timer.stop()
         self.timer_running = False
+        self.startSolver("solve", self.solver_time_limit)
+
+    def onSolveResult(self, result):
+        """一键通关的求解结果，找到解时逐步回放"""
+        if result.solved:
+            self.solve_info = f"求解步数：{result.length}（扩展 {result.nodes} 个节点，耗时 {result.elapsed:.2f}s）"
+            self.playbackPanel.show()
+            self.player.start(result.moves, self.speedSlider.value())
+            return
 
-        self.current_positions = list(range(self.total_pieces))
+        # 预算内没有找到解，直接复原
+        if self.recorder is not None:
+            self.recorder.markAssisted()
+        self.finishRecording()
+        self.resetBoard()
+        self.autosaver.markDirty()
+        self.solve_info = f"求解器在预算内未找到解（扩展 {result.nodes} 个节点）"
         self.updateDisplay()
-        self.labels[self.empty_piece_index].setPixmap(self.piece_pixmaps[self.empty_piece_index])
-        self.labels[self.empty_piece_index].empty = False
+        self.showCompletedWithCheat()
+
+    def playbackStep(self, direction):
+        """回放一步，只标记空白块前后两个位置，由 onPlaybackProgress 统一刷新"""
+        old_blank = self.board.blank
+        if self.board.moveBlank(direction):
+            if self.recorder is not None:
+                self.recorder.markAssisted()
+            self.recordMove(direction)
+            self.markDirty(old_blank, self.board.blank)
+
+    def onPlaybackProgress(self, done, total):
+        # 每次定时器触发可能执行了多步，合并为一次重绘
+        self.flushDisplay()
+        self.autosaver.markDirty()
+        self.playbackLabel.setText(f"{done} / {total}")
+
+    def onPlaybackPaused(self, paused):
+        self.pauseButton.setIcon(FIF.PLAY if paused else FIF.PAUSE)
+
+    def onPlaybackFinished(self, completed):
+        self.playbackPanel.hide()
+        self.pauseButton.setIcon(FIF.PAUSE)
+        if completed and self.board.isSolved():
+            self.finishRecording(completed=True)
+            self.showCompletedWithCheat()
+
+    def showCompletedWithCheat(self):
+        """显示最后一块并提示通过作弊完成"""
+        self.boardWidget.setBlankVisible(True)
 
         MessageBox(
             "恭喜",
-            f"恭喜你完成拼图！\n用时：{self.elapsed_time // 60:02d}:{self.elapsed_time % 60:02d}\n*此成绩经由作弊功能获得",
+            f"恭喜你完成拼图！\n用时：{self.elapsed_time // 60:02d}:{self.elapsed_time % 60:02d}\n{self.solve_info}\n*此成绩经由作弊功能获得",
             self
         ).exec()
 
+    def snapshotGame(self):
+        """自动存档的快照（GUI 线程），没有进行中的对局时返回 None 以删除存档"""
+        if self.board_pixmap is None or not self.image_path or self.board.isSolved():
+            return None
+        mtime_ns, file_size = self.image_identity
+        return encodeSave(SaveGame(
+            size=self.grid_size,
+            tiles=bytes(self.board.tiles),
+            elapsed=self.elapsed_time,
+            image_path=self.image_path,
+            image_mtime_ns=mtime_ns,
+            image_size=file_size,
+            level_index=self.levelComboBox.currentIndex(),
+            tier_index=self.tierComboBox.currentIndex(),
+            history=self.history.toBytes(),
+        ))
+
+    def saveGame(self):
+        """立即保存并等待写盘完成（关闭窗口时调用）"""
+        self.autosaver.markDirty()
+        self.autosaver.flush()
+        self.finishRecording()
+
+    def restoreGame(self):
+        """读取存档，图片仍然存在且未被修改时加载图片，解码完成后恢复棋盘"""
+        save = readSave(saveFile(self.grid_size))
+        if save is None or save.size != self.grid_size or not save.imageMatches():
+            return
+        # 只恢复选择，不触发 onLevelChanged 重新加载
+        self.levelComboBox.blockSignals(True)
+        self.levelComboBox.setCurrentIndex(save.level_index)
+        self.levelComboBox.blockSignals(False)
+        self.fileButton.setVisible(save.level_index == self.levelComboBox.count() - 1)
+        if 0 <= save.tier_index < self.tierComboBox.count():
+            self.tierComboBox.setCurrentIndex(save.tier_index)
+        self.loadImage(save.image_path, save)
+
+    def restoreBoard(self, save):
+        """用存档中的排列、走子记录和用时恢复对局"""
+        self.board.reset(save.tiles)
+        try:
+            history = MoveHistory.fromBytes(save.history)
+            # 记录必须能还原存档中的排列，否则撤销/重做会和棋盘对不上
+            if history.size != self.grid_size or bytes(history.currentTiles()) != bytes(save.tiles):
+                history = None
+        except ValueError:
+            history = None
+        if history is not None:
+            self.history = history
+        else:
+            self.history.reset(self.board.tiles)
+        self.resetTimer()
+        self.elapsed_time = save.elapsed
+        self.timerLabel.setText(f"⏱️ 用时：{self.elapsed_time // 60:02d}:{self.elapsed_time % 60:02d}")
+        # 恢复的对局从当前局面开始新的录像
+        self.startRecording(0)
+
+    def startRecording(self, seed):
+        """以当前局面开始录像，之前未结束的录像先保存"""
+        self.finishRecording()
+        self.recorder = ReplayRecorder(self.grid_size, self.board.tiles, seed,
+                                       max(0, self.tierComboBox.currentIndex()), self.image_path or "")
+
+    def finishRecording(self, completed=False):
+        """结束录像，有走子时写入文件"""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None or recorder.count == 0:
+            return
+        if completed:
+            recorder.markCompleted()
+        try:
+            saveReplay(recorder)
+        except OSError:
+            pass  # 录像写入失败不影响游戏
+
+    def openReplay(self):
+        """选择并播放录像"""
+        fileName, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择回放",
+            str(REPLAY_FOLDER),
+            "回放文件 (*.pzr)"
+        )
+        if not fileName:
+            return
+        try:
+            replay = loadReplay(fileName)
+        except (OSError, ValueError) as e:
+            MessageBox("错误", f"无法读取回放: {e}", self).exec()
+            return
+        # 同一张图片时直接复用对局中的贴图
+        atlas = self.board_pixmap if replay.image_path == self.image_path else None
+        ReplayViewerBox(replay, atlas, self).exec()
+
     def showOriginalImage(self):
         """显示原图预览"""
         if not self.current_image:
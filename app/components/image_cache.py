@@ -0,0 +1,83 @@
+from collections import OrderedDict
+import os
+import threading
+
+"""
+进程内共享的已解码图片缓存
+
+以 (绝对路径, 修改时间, 文件大小, 目标尺寸) 为键缓存裁剪缩放后的 QImage，
+按字节预算做 LRU 淘汰。三个难度界面的棋盘像素大小相同，切换难度或重复选择关卡时可直接复用。
+解码线程和 GUI 线程都会访问，内部加锁。
+"""
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ImageCache:
+    """按字节预算淘汰的 LRU 图片缓存"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (image, bytes)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def makeKey(path, target_size):
+        """文件不存在时返回 None；文件被修改后键随之变化，旧条目自然失效"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, target_size)
+
+    def get(self, path, target_size):
+        key = self.makeKey(path, target_size)
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, path, target_size, image):
+        key = self.makeKey(path, target_size)
+        if key is None:
+            return
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (image, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+imageCache = ImageCache()
@@ -0,0 +1,93 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
+import time
+
+from app.components.image_cache import imageCache
+from app.components.tile_cache import tileCache
+
+"""
+后台图片加载
+
+在线程池中用 QImageReader 解码：只解码居中的正方形区域，并直接按棋盘大小缩放解码
+（JPEG 可利用 DCT 缩放，不必先解出整张大图），得到的 QImage 再交给 GUI 线程转换为 QPixmap。
+解码结果放入进程内共享的 imageCache，命中时不再启动解码任务；
+同时写入磁盘上的 tileCache，下次启动或切换关卡时只需读取一次原始像素。
+"""
+
+
+def decodeSquareImage(path, target_size):
+    """解码图片中居中的正方形区域并缩放到不超过 target_size，可在任意线程调用"""
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        side = min(size.width(), size.height())
+        reader.setClipRect(QRect((size.width() - side) // 2, (size.height() - side) // 2, side, side))
+        if side > target_size:
+            reader.setScaledSize(QSize(target_size, target_size))
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(reader.errorString())
+
+    # 部分格式的解码器不支持裁剪/缩放，读出后再补一次
+    if image.width() != image.height():
+        side = min(image.width(), image.height())
+        image = image.copy((image.width() - side) // 2, (image.height() - side) // 2, side, side)
+    if image.width() > target_size:
+        image = image.scaled(target_size, target_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, loader, request_id, path, grid_size, piece_size):
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.path = path
+        self.grid_size = grid_size
+        self.piece_size = piece_size
+        self.target_size = grid_size * piece_size
+
+    def run(self):
+        start = time.perf_counter()
+        image = tileCache.get(self.path, self.target_size)
+        if image is None:
+            try:
+                image = decodeSquareImage(self.path, self.target_size)
+            except Exception as e:
+                self.loader.failed.emit(self.request_id, self.path, str(e))
+                return
+            try:
+                tileCache.put(self.path, self.target_size, image)
+            except OSError:
+                pass  # 磁盘缓存写入失败不影响游戏
+        imageCache.put(self.path, self.target_size, image)
+        self.loader.loaded.emit(self.request_id, self.path, image, time.perf_counter() - start)
+
+
+class ImageLoader(QObject):
+    """
+    图片加载器，每次 load 返回一个请求编号
+
+    信号在 GUI 线程中处理；只有编号等于最新请求的结果才应被使用，以丢弃过期的加载。
+    """
+
+    loaded = pyqtSignal(int, str, QImage, float)  # 请求编号, 路径, 图片, 耗时(秒)
+    failed = pyqtSignal(int, str, str)            # 请求编号, 路径, 错误信息
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.request_id = 0
+
+    def load(self, path, grid_size, piece_size):
+        """加载图片并缩放到 grid_size * piece_size 的正方形"""
+        self.request_id += 1
+        image = imageCache.get(path, grid_size * piece_size)
+        if image is not None:
+            # 内存缓存命中，直接交付
+            self.loaded.emit(self.request_id, path, image, 0.0)
+        else:
+            QThreadPool.globalInstance().start(_DecodeTask(self, self.request_id, path, grid_size, piece_size))
+        return self.request_id
+
+    def isCurrent(self, request_id):
+        return request_id == self.request_id
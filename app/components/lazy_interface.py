@@ -0,0 +1,47 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import pyqtSignal
+import time
+
+from app.common.startup_trace import trace
+
+"""
+延迟构建的子界面
+
+导航栏只需要一个有 objectName 的控件，真正的界面在第一次显示（或空闲时）才构建，
+构建完成后放进占位控件的布局里，对导航栏和堆叠窗口透明。
+"""
+
+
+class LazyInterface(QWidget):
+    """子界面占位控件，factory() 返回真正的界面"""
+
+    materialized = pyqtSignal(QWidget)
+
+    def __init__(self, factory, object_name, parent=None):
+        super().__init__(parent)
+        self.setObjectName(object_name)
+        self.factory = factory
+        self._widget = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def widget(self):
+        """已构建的界面，尚未构建时返回 None"""
+        return self._widget
+
+    def isMaterialized(self):
+        return self._widget is not None
+
+    def materialize(self):
+        """构建真正的界面（只构建一次）并返回"""
+        if self._widget is None:
+            start = time.perf_counter()
+            self._widget = self.factory()
+            self.layout().addWidget(self._widget)
+            trace.mark(f"构建界面 {self.objectName()}", (time.perf_counter() - start) * 1000)
+            self.materialized.emit(self._widget)
+        return self._widget
+
+    def showEvent(self, event):
+        self.materialize()
+        super().showEvent(event)
@@ -0,0 +1,274 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
+from PyQt5.QtGui import QPixmap
+from qfluentwidgets.multimedia import SimpleMediaPlayBar
+from qfluentwidgets import TransparentToolButton, TransparentToggleToolButton, BodyLabel
+from qfluentwidgets import FluentIcon as FIF
+from PyQt5.QtCore import QUrl
+from PyQt5.QtMultimedia import QMediaPlayer
+from pathlib import Path
+
+from app.common.config_store import configStore
+from app.components.music_metadata import musicMetadataCache
+from app.core.playlist import Playlist
+
+"""
+音乐播放卡片
+
+依赖 qfluentwidgets.multimedia（会加载 QtMultimedia），只在第一次开启音乐时由 MusicManager 导入；
+标签和封面缩略图从 musicMetadataCache 读取，只有文件变化后才用 mutagen 重新解析。
+没有设置音乐文件夹时循环播放自带的音乐；设置后由 MusicLibrary 扫描得到的曲目组成播放列表，
+一首播完立即在 mediaStatusChanged 中切到下一首，支持顺序和随机播放。
+"""
+
+class MusicCard(SimpleMediaPlayBar):
+    """音乐播放卡片"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("MusicCard")
+        
+        # 自带的音乐，没有设置音乐文件夹（或文件夹中没有音乐）时播放
+        self.music_path = Path("app/resource/music.mp3")
+        self.default_track = musicMetadataCache.trackInfo(self.music_path)
+        self.playlist = Playlist([self.default_track], shuffle=configStore.musicShuffle())
+        self.failed_tracks = 0  # 连续无法播放的曲目数，全部失败时停止切歌
+        self.player.mediaStatusChanged.connect(self.on_media_status_changed)
+        self.set_track_source(self.default_track)
+        
+        # 读取音乐元数据，用于显示
+        self.music_metadata = self.load_music_metadata()
+        
+        # 添加音乐信息显示
+        self.setup_music_info()
+        
+        # 下一首
+        self.next_button = TransparentToolButton(FIF.CHEVRON_RIGHT, self)
+        self.next_button.setToolTip("下一首")
+        self.next_button.clicked.connect(self.play_next)
+        self.layout().addWidget(self.next_button)
+
+        # 随机播放
+        self.shuffle_button = TransparentToggleToolButton(FIF.SYNC, self)
+        self.shuffle_button.setToolTip("随机播放")
+        self.shuffle_button.setChecked(self.playlist.shuffle)
+        self.shuffle_button.toggled.connect(self.set_shuffle)
+        self.layout().addWidget(self.shuffle_button)
+        
+        # 隐藏按钮
+        self.hide_button = TransparentToolButton(FIF.PAGE_RIGHT, self)
+        self.hide_button.setToolTip("收起音乐栏")
+        self.hide_button.clicked.connect(self.hide_card)
+        self.layout().addWidget(self.hide_button)
+
+        # 显示按钮
+        self.show_button = TransparentToolButton(FIF.PAGE_LEFT, self)
+        self.show_button.setToolTip("展开音乐栏")
+        self.show_button.clicked.connect(self.show_card)
+        self.show_button.hide()
+        self.layout().addWidget(self.show_button)
+        
+        # 记录原始大小
+        self.original_size = (460, 60)
+        self.collapsed_size = (40, 40)
+    
+    def load_music_metadata(self):
+        """当前曲目的元数据（命中缓存时不解析文件）"""
+        info = self.playlist.current()
+        return {
+            'title': info.title,
+            'artist': info.artist,
+            'album': info.album,
+            'cover_path': info.cover_path
+        }
+    
+    def setup_music_info(self):
+        """设置音乐信息显示"""
+        # 创建音乐信息容器
+        self.music_info_widget = QWidget()
+        self.music_info_layout = QHBoxLayout(self.music_info_widget)
+        self.music_info_layout.setContentsMargins(5, 5, 5, 5)
+        
+        # 音乐封面图片
+        self.album_cover = QLabel()
+        self.album_cover.setFixedSize(40, 40)
+        self.album_cover.setScaledContents(True)
+        self.album_cover.setStyleSheet("""
+            QLabel {
+                border-radius: 5px;
+                background-color: #f0f0f0;
+                border: 1px solid #d0d0d0;
+            }
+        """)
+        
+        # 设置专辑封面
+        self.set_album_cover()
+        
+        # 音乐名称
+        self.music_title = BodyLabel(self.music_metadata['title'])
+        self.music_title.setStyleSheet("color: #333; font-weight: bold;")
+        
+        # Artist
+        self.artist_name = BodyLabel(self.music_metadata['artist'])
+        self.artist_name.setStyleSheet("color: #666; font-size: 11px;")
+        
+        # 文本信息布局
+        text_layout = QVBoxLayout()
+        text_layout.setContentsMargins(0, 0, 0, 0)
+        text_layout.setSpacing(2)
+        text_layout.addWidget(self.music_title)
+        text_layout.addWidget(self.artist_name)
+        
+        text_widget = QWidget()
+        text_widget.setLayout(text_layout)
+        
+        # 添加到音乐信息布局
+        self.music_info_layout.addWidget(self.album_cover)
+        self.music_info_layout.addWidget(text_widget)
+        self.music_info_layout.addStretch()
+        
+        # 将音乐信息插入到最前面
+        self.layout().insertWidget(0, self.music_info_widget)
+    
+    def set_album_cover(self):
+        """设置专辑封面"""
+        # 首先尝试使用MP3文件中的封面（缓存中已缩放好的缩略图）
+        if self.music_metadata['cover_path']:
+            pixmap = QPixmap(self.music_metadata['cover_path'])
+            if not pixmap.isNull():
+                self.album_cover.setPixmap(pixmap)
+                # print("使用MP3文件中的专辑封面")
+                return
+        
+        # 如果MP3中没有封面，使用头像图片
+        cover_path = Path("app/resource/images/avatar.jpg")
+        if cover_path.exists():
+            pixmap = QPixmap(str(cover_path))
+            self.album_cover.setPixmap(pixmap)
+            # print("使用默认头像作为封面")
+        else:
+            # 使用默认图标
+            self.album_cover.setText("♪")
+            self.album_cover.setAlignment(Qt.AlignCenter)
+            self.album_cover.setStyleSheet("""
+                QLabel {
+                    border-radius: 5px;
+                    background-color: #e3f2fd;
+                    border: 1px solid #bbdefb;
+                    color: #1976d2;
+                    font-size: 18px;
+                    font-weight: bold;
+                }
+            """)
+            # print("使用默认音乐图标")
+
+    def set_track_source(self, info):
+        self.player.setSource(QUrl.fromLocalFile(info.path))
+
+    def set_playlist(self, tracks):
+        """替换播放列表；当前曲目仍在新列表中时继续播放，否则切到新列表的第一首"""
+        tracks = tracks or [self.default_track]
+        current = self.playlist.current()
+        paths = [info.path for info in tracks]
+        keep = paths.index(current.path) if current is not None and current.path in paths else None
+        self.playlist.setTracks(tracks, keep)
+        self.failed_tracks = 0
+        if keep is None:
+            self.play_track(self.playlist.current(), self.player.isPlaying())
+        else:
+            # 标签可能已更新
+            self.show_track_info()
+
+    def play_track(self, info, autoplay=True):
+        self.set_track_source(info)
+        self.show_track_info()
+        if autoplay:
+            self.play()
+
+    def show_track_info(self):
+        self.music_metadata = self.load_music_metadata()
+        self.update_music_info(self.music_metadata['title'], self.music_metadata['artist'])
+        self.set_album_cover()
+
+    def play_next(self):
+        """切到下一首（播放中则继续播放）"""
+        autoplay = self.player.isPlaying() or self.player.mediaStatus() == QMediaPlayer.EndOfMedia
+        self.play_track(self.playlist.next(), autoplay)
+
+    def set_shuffle(self, shuffle):
+        self.playlist.setShuffle(shuffle)
+        configStore.setMusicShuffle(shuffle)
+
+    def on_media_status_changed(self, status):
+        """一首播完立即播放下一首；无法播放的文件直接跳过"""
+        if status == QMediaPlayer.EndOfMedia:
+            self.failed_tracks = 0
+            self.play_track(self.playlist.next())
+        elif status == QMediaPlayer.InvalidMedia:
+            self.failed_tracks += 1
+            if self.failed_tracks < len(self.playlist):
+                self.play_track(self.playlist.next())
+
+    def set_volume(self, volume):
+        """设置音量"""
+        self.player.setVolume(int(volume))  # 确保传入整数，不然会报错
+        # print(f"音乐音量已设置为: {volume}%")
+
+    def show_card(self):
+        """展开音乐栏"""
+        # 显示所有控件，除了展开按钮
+        for i in range(self.layout().count()):
+            widget = self.layout().itemAt(i).widget()
+            if widget and widget != self.show_button:
+                widget.show()
+        
+        # 隐藏展开按钮
+        self.show_button.hide()
+        
+        # 恢复原始大小
+        self.setFixedSize(*self.original_size)
+        
+        # 计算并移动卡片到右下角
+        window_width = self.parent().width()
+        window_height = self.parent().height()
+        card_width = self.width()
+        card_height = self.height()
+        
+        x = window_width - card_width - 10
+        y = window_height - card_height - 10
+        self.move(x, y)
+
+    def hide_card(self):
+        """收起音乐栏"""
+        # 隐藏所有控件，除了展开按钮
+        for i in range(self.layout().count()):
+            widget = self.layout().itemAt(i).widget()
+            if widget and widget != self.show_button:
+                widget.hide()
+        
+        # 显示展开按钮
+        self.show_button.show()
+
+        # 调整为收起大小
+        self.setFixedSize(*self.collapsed_size)
+
+        # 计算并移动卡片到右下角
+        window_width = self.parent().width()
+        window_height = self.parent().height()
+        card_width = self.width()
+        card_height = self.height()
+
+        x = window_width - card_width - 20 # 坐标不一样是为了对齐图标
+        y = window_height - card_height - 20
+        self.move(x, y)
+    
+    def update_music_info(self, title="Music", artist="Unknown Artist"):
+        """更新音乐信息"""
+        self.music_title.setText(title)
+        self.artist_name.setText(artist)
+
+        # self._reposition()
+    
+    # def _reposition(self):
+    #     """重新定位卡片"""
+    #     self.parent().music_manager.reposition_music_card()
@@ -0,0 +1,134 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import os
+import threading
+
+from app.components.music_metadata import musicMetadataCache
+
+"""
+音乐文件夹扫描
+
+扫描任务在后台线程中遍历文件夹，对每个音频文件只做一次 stat：签名与缓存一致的直接使用缓存，
+只有新增或修改过的文件才交给线程池用 mutagen 解析，已删除文件的条目从缓存中移除。
+全部完成后保存一次缓存索引，按路径排序的曲目列表通过 scanFinished 发回 GUI 线程。
+每次 scan() 递增扫描代号，过期扫描的结果直接丢弃。
+"""
+
+AUDIO_EXTENSIONS = {".mp3", ".flac", ".ogg", ".m4a", ".wav", ".wma", ".aac"}
+SCAN_THREADS = 4
+
+
+def listAudioFiles(folder):
+    """递归列出文件夹中的音频文件"""
+    files = []
+    stack = [folder]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                files.append(os.path.abspath(entry.path))
+    return files
+
+
+class _ScanState:
+    """一次扫描中待解析文件的计数和结果"""
+
+    def __init__(self, generation, folder, tracks, pending):
+        self.generation = generation
+        self.folder = folder
+        self.tracks = tracks
+        self.pending = pending
+        self.lock = threading.Lock()
+
+
+class _ExtractTask(QRunnable):
+    def __init__(self, library, state, path):
+        super().__init__()
+        self.library = library
+        self.state = state
+        self.path = path
+
+    def run(self):
+        if self.state.generation != self.library.generation:
+            info = None  # 已经开始了新的扫描
+        else:
+            info = musicMetadataCache.extract(self.path, save=False)
+        with self.state.lock:
+            if info is not None:
+                self.state.tracks.append(info)
+            self.state.pending -= 1
+            done = self.state.pending == 0
+        if done:
+            self.library._finish(self.state)
+
+
+class _ScanTask(QRunnable):
+    def __init__(self, library, generation, folder):
+        super().__init__()
+        self.library = library
+        self.generation = generation
+        self.folder = folder
+
+    def run(self):
+        files = listAudioFiles(self.folder)
+        present = set(files)
+        musicMetadataCache.forget(path for path in musicMetadataCache.cachedPaths(self.folder)
+                                  if path not in present)
+        tracks = []
+        changed = []
+        for path in files:
+            info = musicMetadataCache.get(path)
+            if info is None:
+                changed.append(path)
+            else:
+                tracks.append(info)
+        state = _ScanState(self.generation, self.folder, tracks, len(changed))
+        if not changed:
+            self.library._finish(state)
+            return
+        for path in changed:
+            self.library.pool.start(_ExtractTask(self.library, state, path))
+
+
+class MusicLibrary(QObject):
+    """后台扫描音乐文件夹，得到 TrackInfo 列表"""
+
+    scanFinished = pyqtSignal(str, list)  # 文件夹, 按路径排序的曲目
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.folder = ""
+        self.tracks = []
+        self.scanning = False
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(SCAN_THREADS)
+        self.scanFinished.connect(self._onScanFinished)
+
+    def scan(self, folder):
+        """开始扫描（立即返回），之前未完成的扫描作废"""
+        self.generation += 1
+        self.folder = folder
+        self.scanning = True
+        self.pool.start(_ScanTask(self, self.generation, folder))
+
+    def _finish(self, state):
+        """在工作线程中调用：保存缓存索引并把结果发回 GUI 线程"""
+        musicMetadataCache.save()
+        if state.generation == self.generation:
+            tracks = sorted(state.tracks, key=lambda info: info.path.lower())
+            self.scanFinished.emit(state.folder, tracks)
+
+    def _onScanFinished(self, folder, tracks):
+        if folder == self.folder:
+            self.tracks = tracks
+            self.scanning = False
+
+    def wait(self):
+        """等待后台任务结束（退出时使用）"""
+        self.generation += 1
+        self.pool.waitForDone()
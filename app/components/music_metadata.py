@@ -0,0 +1,192 @@
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import threading
+
+from app.common.file_utils import atomicWrite
+from app.common.setting import CONFIG_FOLDER
+
+"""
+音乐元数据缓存
+
+用 mutagen 解析标签和封面比较慢（封面常有几百 KB），结果以 (路径, 修改时间, 文件大小) 为键
+缓存在 AppData/music 下：index.json 记录标签，封面缩放成 40x40 的 PNG 缩略图单独保存，
+文件名取缩略图内容的哈希，同一专辑的多首歌共用一张。文件变化后签名不匹配，下次读取时重新解析。
+解析可以在任意线程进行，内部加锁。
+"""
+
+MUSIC_CACHE_FOLDER = CONFIG_FOLDER / "music"
+COVER_SIZE = 40
+CACHE_VERSION = 1
+
+
+@dataclass
+class TrackInfo:
+    """一首歌的标签，cover_path 为缩略图路径（没有封面时为空）"""
+    path: str
+    title: str
+    artist: str = "Unknown Artist"
+    album: str = "Game Music"
+    cover_path: str = ""
+
+
+def readTags(path):
+    """用 mutagen 读取标签，返回 (标题, 艺术家, 专辑, 封面字节)，缺失的项为 None"""
+    from mutagen import File
+    audio_file = File(str(path))
+    if audio_file is None:
+        return None, None, None, None
+
+    def first(*keys):
+        for key in keys:
+            if key in audio_file:
+                value = audio_file[key]
+                # ID3 帧直接转字符串，Vorbis/MP4 标签是列表
+                return str(value[0] if isinstance(value, list) else value)
+        return None
+
+    cover_data = None
+    if 'APIC:Cover' in audio_file:
+        cover_data = audio_file['APIC:Cover'].data
+    elif 'APIC:' in audio_file:
+        cover_data = audio_file['APIC:'].data
+    elif hasattr(audio_file, 'pictures') and audio_file.pictures:
+        cover_data = audio_file.pictures[0].data
+    else:
+        # 其他描述的 APIC 帧
+        frames = [audio_file[key] for key in audio_file.keys() if key.startswith('APIC')]
+        if frames:
+            cover_data = frames[0].data
+    return first('TIT2', 'TITLE'), first('TPE1', 'ARTIST'), first('TALB', 'ALBUM'), cover_data
+
+
+def makeThumbnail(cover_data, size=COVER_SIZE):
+    """把封面裁剪成居中的正方形并缩放到 size，返回 PNG 字节，无法解码时返回 None"""
+    image = QImage.fromData(cover_data)
+    if image.isNull():
+        return None
+    side = min(image.width(), image.height())
+    image = image.copy((image.width() - side) // 2, (image.height() - side) // 2, side, side)
+    image = image.scaled(size, size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+
+class MusicMetadataCache:
+    """音乐标签和封面缩略图的磁盘缓存"""
+
+    def __init__(self, folder=MUSIC_CACHE_FOLDER):
+        self.folder = folder
+        self.cover_folder = folder / "covers"
+        self.index_file = folder / "index.json"
+        self._index = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(path):
+        """文件不存在时返回 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _loadIndex(self):
+        if self._index is None:
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._index = data["tracks"] if data.get("version") == CACHE_VERSION else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._index = {}
+        return self._index
+
+    def get(self, path):
+        """缓存中与文件当前签名一致的 TrackInfo，没有或已过期时返回 None"""
+        path = os.path.abspath(path)
+        signature = self.signature(path)
+        with self._lock:
+            entry = self._loadIndex().get(path)
+        if entry is None or signature is None or (entry["mtime_ns"], entry["size"]) != signature:
+            return None
+        cover_path = str(self.cover_folder / entry["cover"]) if entry.get("cover") else ""
+        return TrackInfo(path, entry["title"], entry["artist"], entry["album"], cover_path)
+
+    def extract(self, path, save=True):
+        """解析文件并写入缓存（不检查缓存）。save=False 时只更新内存中的索引，由调用方稍后 save()"""
+        path = os.path.abspath(path)
+        signature = self.signature(path)
+        try:
+            title, artist, album, cover_data = readTags(path)
+        except Exception:
+            # mutagen 缺失或文件损坏时只显示文件名
+            title = artist = album = cover_data = None
+        info = TrackInfo(path, title or os.path.splitext(os.path.basename(path))[0])
+        if artist:
+            info.artist = artist
+        if album:
+            info.album = album
+
+        cover_name = ""
+        thumbnail = makeThumbnail(cover_data) if cover_data else None
+        if thumbnail is not None:
+            cover_name = hashlib.sha1(thumbnail).hexdigest() + ".png"
+            cover_file = self.cover_folder / cover_name
+            try:
+                if not cover_file.exists():
+                    atomicWrite(cover_file, thumbnail)
+                info.cover_path = str(cover_file)
+            except OSError:
+                cover_name = ""
+
+        if signature is not None:
+            with self._lock:
+                self._loadIndex()[path] = {
+                    "mtime_ns": signature[0], "size": signature[1],
+                    "title": info.title, "artist": info.artist, "album": info.album, "cover": cover_name,
+                }
+                self._dirty = True
+            if save:
+                self.save()
+        return info
+
+    def trackInfo(self, path):
+        """先查缓存，未命中时解析并保存"""
+        return self.get(path) or self.extract(path)
+
+    def cachedPaths(self, folder):
+        """缓存中位于 folder 下的所有文件路径"""
+        prefix = os.path.join(os.path.abspath(folder), "")
+        with self._lock:
+            return [path for path in self._loadIndex() if path.startswith(prefix)]
+
+    def forget(self, paths):
+        """删除已经不存在的文件的条目"""
+        with self._lock:
+            index = self._loadIndex()
+            for path in paths:
+                if index.pop(os.path.abspath(path), None) is not None:
+                    self._dirty = True
+
+    def save(self):
+        """原子写入索引，没有修改时什么也不做"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({"version": CACHE_VERSION, "tracks": self._index}, ensure_ascii=False)
+            self._dirty = False
+            try:
+                atomicWrite(self.index_file, data.encode("utf-8"))
+            except OSError:
+                self._dirty = True  # 下次再试
+
+
+musicMetadataCache = MusicMetadataCache()
@@ -0,0 +1,186 @@
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QRect, QRectF, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPen
+
+from app.core.board import UP, DOWN, LEFT, RIGHT
+
+"""
+自绘拼图棋盘
+
+整个棋盘只有一个控件，在 paintEvent 中按棋盘状态绘制全部拼图块，
+点击位置通过坐标运算换算成拼图块位置，因此控件数量与网格大小无关，
+也支持 10x10 等任意尺寸。
+拼图块不单独保存，而是从一张缩放到棋盘大小的贴图（atlas）中按源矩形绘制。
+按住左键拖过的每个拼图块都会发出 clicked，方向键/WASD 发出 directionPressed。
+"""
+
+# 按键 -> 空白块方向：按键表示拼图块的移动方向，空白块朝相反方向移动
+KEY_DIRECTIONS = {
+    Qt.Key_Up: DOWN, Qt.Key_W: DOWN,
+    Qt.Key_Down: UP, Qt.Key_S: UP,
+    Qt.Key_Left: RIGHT, Qt.Key_A: RIGHT,
+    Qt.Key_Right: LEFT, Qt.Key_D: LEFT,
+}
+
+
+class PuzzleBoardWidget(QWidget):
+    """单控件自绘的拼图棋盘"""
+    clicked = pyqtSignal(int)
+    directionPressed = pyqtSignal(int)  # 空白块方向
+
+    # 与原 ClickableLabel 样式保持一致
+    TILE_BACKGROUND = QColor(255, 255, 255)
+    TILE_BORDER = QColor(0xdd, 0xdd, 0xdd)
+    HOVER_OVERLAY = QColor(0, 0, 0, 25)
+    PLACEHOLDER_COLOR = QColor(0x60, 0x60, 0x60)
+    TILE_RADIUS = 8
+
+    def __init__(self, grid_size, piece_size, spacing=2, parent=None):
+        super().__init__(parent)
+        self.grid_size = grid_size
+        self.piece_size = piece_size
+        self.spacing = spacing
+        self.board = None
+        self.atlas = None
+        self.blank_visible = False  # 完成后显示最后一块
+        self.placeholder_text = ""  # 非空时在棋盘中央显示（如图片加载中）
+        self.numbers_visible = False  # 没有贴图时用编号代替图片
+        self.hover_position = -1
+        self.drag_position = -1  # 拖动中最近一次发出 clicked 的位置
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        side = piece_size * grid_size + spacing * (grid_size - 1)
+        self.setFixedSize(side, side)
+
+    def setBoard(self, board):
+        self.board = board
+        self.update()
+
+    def setAtlas(self, pixmap):
+        """设置整板贴图，尺寸应为 piece_size * grid_size"""
+        self.atlas = pixmap
+        self.update()
+
+    def setPlaceholderText(self, text):
+        if text != self.placeholder_text:
+            self.placeholder_text = text
+            self.update()
+
+    def setNumbersVisible(self, visible):
+        if visible != self.numbers_visible:
+            self.numbers_visible = visible
+            self.update()
+
+    def pieceSourceRect(self, piece):
+        """拼图块在贴图中的源矩形，四周各留 1px 对应边框"""
+        row, col = divmod(piece, self.grid_size)
+        size = self.piece_size
+        return QRect(col * size + 1, row * size + 1, size - 2, size - 2)
+
+    def setBlankVisible(self, visible):
+        """是否在空白位置绘制最后一块（拼图完成时使用）"""
+        if visible != self.blank_visible:
+            self.blank_visible = visible
+            if self.board is not None:
+                self.updateTiles((self.board.blank,))
+
+    def tileRect(self, pos):
+        row, col = divmod(pos, self.grid_size)
+        step = self.piece_size + self.spacing
+        return QRect(col * step, row * step, self.piece_size, self.piece_size)
+
+    def positionAt(self, point):
+        """坐标 -> 拼图块位置，落在间隙或棋盘外时返回 -1"""
+        step = self.piece_size + self.spacing
+        x, y = point.x(), point.y()
+        if x < 0 or y < 0:
+            return -1
+        col, dx = divmod(x, step)
+        row, dy = divmod(y, step)
+        if col >= self.grid_size or row >= self.grid_size or dx >= self.piece_size or dy >= self.piece_size:
+            return -1
+        return row * self.grid_size + col
+
+    def updateTiles(self, positions):
+        """只请求重绘指定位置，返回请求的拼图块数量"""
+        count = 0
+        for pos in positions:
+            self.update(self.tileRect(pos))
+            count += 1
+        return count
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        exposed = event.rect()
+        tiles = self.board.tiles if self.board is not None else None
+        blank_piece = self.grid_size * self.grid_size - 1
+        pen = QPen(self.TILE_BORDER)
+        pen.setWidth(1)
+
+        for pos in range(self.grid_size * self.grid_size):
+            rect = self.tileRect(pos)
+            if not rect.intersects(exposed):
+                continue
+            painter.setPen(pen)
+            painter.setBrush(self.TILE_BACKGROUND)
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), self.TILE_RADIUS, self.TILE_RADIUS)
+
+            piece = tiles[pos] if tiles is not None else -1
+            empty = piece < 0 or (piece == blank_piece and not self.blank_visible)
+            if not empty and self.atlas is not None:
+                # 留出 1px 边框，与原标签的内容区域一致
+                painter.drawPixmap(rect.adjusted(1, 1, -1, -1), self.atlas, self.pieceSourceRect(piece))
+            elif not empty and self.numbers_visible:
+                painter.setPen(self.PLACEHOLDER_COLOR)
+                painter.drawText(rect, Qt.AlignCenter, str(piece + 1))
+
+            if pos == self.hover_position and not empty:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self.HOVER_OVERLAY)
+                painter.drawRoundedRect(QRectF(rect), self.TILE_RADIUS, self.TILE_RADIUS)
+
+        if self.placeholder_text:
+            painter.setPen(self.PLACEHOLDER_COLOR)
+            painter.drawText(self.rect(), Qt.AlignCenter, self.placeholder_text)
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return
+        pos = self.positionAt(event.pos())
+        self.drag_position = pos
+        if pos >= 0 and self.board is not None and pos != self.board.blank:
+            self.clicked.emit(pos)
+
+    def mouseMoveEvent(self, event):
+        pos = self.positionAt(event.pos())
+        self._setHover(pos)
+        # 拖动经过新的拼图块时继续滑动
+        if event.buttons() & Qt.LeftButton and pos >= 0 and pos != self.drag_position:
+            self.drag_position = pos
+            if self.board is not None and pos != self.board.blank:
+                self.clicked.emit(pos)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_position = -1
+
+    def keyPressEvent(self, event):
+        direction = KEY_DIRECTIONS.get(event.key())
+        if direction is None or event.modifiers() & (Qt.ControlModifier | Qt.AltModifier):
+            super().keyPressEvent(event)
+            return
+        self.directionPressed.emit(direction)
+
+    def leaveEvent(self, event):
+        self._setHover(-1)
+        super().leaveEvent(event)
+
+    def _setHover(self, pos):
+        if pos == self.hover_position:
+            return
+        old = self.hover_position
+        self.hover_position = pos
+        self.updateTiles(p for p in (old, pos) if p >= 0)
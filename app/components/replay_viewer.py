@@ -0,0 +1,155 @@
+from PyQt5.QtWidgets import QHBoxLayout
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer
+from PyQt5.QtGui import QPixmap
+from qfluentwidgets import (MessageBoxBase, SubtitleLabel, BodyLabel, ComboBox, Slider, ToolButton,
+                            FluentIcon as FIF)
+
+from app.core.replay import KEYFRAME_INTERVAL
+from app.components.image_loader import decodeSquareImage
+from app.components.puzzle_board_widget import PuzzleBoardWidget
+from app.components.solution_player import MIN_INTERVAL
+
+"""
+对局录像查看器
+
+按录像中的时间戳以 1x~64x 播放，每帧把这段时间内的所有步合并为一次重绘；
+拖动进度条时直接从最近的关键帧恢复棋盘，任意位置都可以立即跳转。
+"""
+
+SPEEDS = (1, 2, 4, 8, 16, 32, 64)
+BOARD_PIXELS = 360
+
+
+def formatTime(ms):
+    seconds = ms // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}.{ms % 1000 // 100}"
+
+
+class ReplayViewerBox(MessageBoxBase):
+    """录像查看对话框，atlas 为已经缩放好的整板贴图（可选）"""
+
+    def __init__(self, replay, atlas=None, parent=None):
+        super().__init__(parent)
+        self.replay = replay
+        self.index = 0
+        self.clock = 0.0  # 录像时间（毫秒）
+        self.speed = 1
+        self.board = replay.boardAt(0)
+        self.timer = QTimer(self)
+        self.timer.setInterval(MIN_INTERVAL)
+        self.timer.timeout.connect(self.onTick)
+        self.elapsed = QElapsedTimer()
+
+        size = replay.size
+        self.titleLabel = SubtitleLabel("对局回放")
+        status = "已完成" if replay.completed else "未完成"
+        if replay.assisted:
+            status += "（使用了自动求解）"
+        self.infoLabel = BodyLabel(
+            f"{size}x{size} · {len(replay)} 步 · 用时 {formatTime(replay.duration)} · {status}")
+
+        piece_size = BOARD_PIXELS // size
+        self.boardWidget = PuzzleBoardWidget(size, piece_size, spacing=2, parent=self)
+        self.boardWidget.setBoard(self.board)
+        self.setAtlas(atlas, piece_size * size)
+
+        self.playButton = ToolButton(FIF.PLAY, self)
+        self.playButton.setToolTip("播放/暂停")
+        self.playButton.clicked.connect(self.togglePlay)
+        self.seekSlider = Slider(Qt.Horizontal, self)
+        self.seekSlider.setRange(0, len(replay))
+        self.seekSlider.valueChanged.connect(self.seek)
+        self.speedComboBox = ComboBox(self)
+        self.speedComboBox.addItems([f"{speed}x" for speed in SPEEDS])
+        self.speedComboBox.currentIndexChanged.connect(self.onSpeedChanged)
+        self.positionLabel = BodyLabel(self)
+
+        controlLayout = QHBoxLayout()
+        controlLayout.addWidget(self.playButton)
+        controlLayout.addWidget(self.seekSlider, 1)
+        controlLayout.addWidget(self.speedComboBox)
+
+        self.viewLayout.addWidget(self.titleLabel)
+        self.viewLayout.addWidget(self.infoLabel)
+        self.viewLayout.addWidget(self.boardWidget, 0, Qt.AlignHCenter)
+        self.viewLayout.addLayout(controlLayout)
+        self.viewLayout.addWidget(self.positionLabel)
+
+        self.cancelButton.hide()
+        self.yesButton.setText("关闭")
+        self.widget.setMinimumWidth(BOARD_PIXELS + 80)
+        self.updatePosition()
+
+    def setAtlas(self, atlas, pixels):
+        """使用对局中的贴图；没有时从录像记录的图片路径解码，仍然失败就显示编号"""
+        if atlas is None and self.replay.image_path:
+            try:
+                atlas = QPixmap.fromImage(decodeSquareImage(self.replay.image_path, pixels))
+            except ValueError:
+                atlas = None
+        if atlas is not None and (atlas.width() != pixels or atlas.height() != pixels):
+            atlas = atlas.scaled(pixels, pixels, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        self.boardWidget.setAtlas(atlas)
+        self.boardWidget.setNumbersVisible(atlas is None)
+
+    def togglePlay(self):
+        if self.timer.isActive():
+            self.pause()
+            return
+        if self.index >= len(self.replay):
+            self.seek(0)
+        self.elapsed.start()
+        self.timer.start()
+        self.playButton.setIcon(FIF.PAUSE)
+
+    def pause(self):
+        self.timer.stop()
+        self.playButton.setIcon(FIF.PLAY)
+
+    def onSpeedChanged(self, index):
+        self.speed = SPEEDS[index]
+
+    def onTick(self):
+        self.clock += self.elapsed.restart() * self.speed
+        target = min(self.replay.indexAtTime(int(self.clock)), len(self.replay))
+        if target - self.index > KEYFRAME_INTERVAL:
+            # 落后太多（例如长时间停顿后的高倍速），直接跳到关键帧
+            self.jumpTo(target)
+        elif target > self.index:
+            dirty = set()
+            directions = self.replay.directions
+            for i in range(self.index, target):
+                old_blank = self.board.blank
+                self.board.moveBlank(directions[i])
+                dirty.add(old_blank)
+                dirty.add(self.board.blank)
+            self.index = target
+            self.boardWidget.updateTiles(dirty)
+        self.updatePosition()
+        if self.index >= len(self.replay):
+            self.pause()
+
+    def seek(self, index):
+        """拖动进度条：跳到第 index 步，并把播放时钟对齐到该步"""
+        if index == self.index:
+            return
+        self.jumpTo(index)
+        self.clock = self.replay.timeAt(self.index)
+        self.updatePosition()
+
+    def jumpTo(self, index):
+        self.board.reset(self.replay.boardAt(index).tiles)
+        self.index = index
+        self.boardWidget.update()
+
+    def updatePosition(self):
+        self.seekSlider.blockSignals(True)
+        self.seekSlider.setValue(self.index)
+        self.seekSlider.blockSignals(False)
+        self.boardWidget.setBlankVisible(self.board.isSolved())
+        self.positionLabel.setText(
+            f"第 {self.index} / {len(self.replay)} 步 · {formatTime(self.replay.timeAt(self.index))}")
+
+    def done(self, code):
+        self.timer.stop()
+        super().done(code)
@@ -0,0 +1,111 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import math
+
+"""
+求解结果的逐步回放
+
+按设定速度（步/秒）通过 QTimer 逐步发出空白块移动方向，支持暂停、单步和取消。
+速度超过定时器精度时，每次触发合并执行多步，保证 100+ 步/秒也能跟上。
+"""
+
+# 定时器最短间隔（毫秒），约等于一帧
+MIN_INTERVAL = 16
+
+
+class SolutionPlayer(QObject):
+    """解法回放控制器，只负责节奏，实际移动由 stepped 信号的接收方完成"""
+
+    stepped = pyqtSignal(int)          # 空白块移动方向
+    progressChanged = pyqtSignal(int, int)  # 已完成步数, 总步数
+    finished = pyqtSignal(bool)        # True 表示播放完毕，False 表示被取消
+    pausedChanged = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.moves = []
+        self.index = 0
+        self.speed = 10
+        self.paused = False
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._onTimeout)
+
+    def start(self, moves, speed=None):
+        """开始播放一串空白块移动方向"""
+        self.timer.stop()
+        self.moves = list(moves)
+        self.index = 0
+        if speed is not None:
+            self.speed = speed
+        self.paused = False
+        self._applySpeed()
+        self.timer.start()
+        self.progressChanged.emit(0, len(self.moves))
+
+    def isActive(self):
+        return self.index < len(self.moves)
+
+    def remaining(self):
+        return len(self.moves) - self.index
+
+    def setSpeed(self, moves_per_second):
+        """设置播放速度（步/秒）"""
+        self.speed = max(1, moves_per_second)
+        self._applySpeed()
+
+    def _applySpeed(self):
+        interval = 1000 / self.speed
+        if interval >= MIN_INTERVAL:
+            self.batch = 1
+            self.timer.setInterval(int(interval))
+        else:
+            self.batch = math.ceil(self.speed * MIN_INTERVAL / 1000)
+            self.timer.setInterval(MIN_INTERVAL)
+
+    def setPaused(self, paused):
+        if not self.isActive() or paused == self.paused:
+            return
+        self.paused = paused
+        if paused:
+            self.timer.stop()
+        else:
+            self.timer.start()
+        self.pausedChanged.emit(paused)
+
+    def togglePause(self):
+        self.setPaused(not self.paused)
+
+    def step(self):
+        """暂停状态下前进一步"""
+        if not self.isActive():
+            return
+        self.setPaused(True)
+        self._advance(1)
+
+    def cancel(self):
+        """停止播放，已执行的步骤保留"""
+        if not self.isActive():
+            return
+        self.timer.stop()
+        self.moves = []
+        self.index = 0
+        self.paused = False
+        self.finished.emit(False)
+
+    def _onTimeout(self):
+        self._advance(self.batch)
+
+    def _advance(self, count):
+        end = min(self.index + count, len(self.moves))
+        while self.index < end:
+            direction = self.moves[self.index]
+            self.index += 1
+            self.stepped.emit(direction)
+            if not self.moves:  # 接收方在回调中取消了播放
+                return
+        self.progressChanged.emit(self.index, len(self.moves))
+        if self.index >= len(self.moves):
+            self.timer.stop()
+            self.moves = []
+            self.index = 0
+            self.paused = False
+            self.finished.emit(True)
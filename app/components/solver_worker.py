@@ -0,0 +1,94 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import multiprocessing
+import queue
+import time
+
+from app.core.heuristics import makeHeuristic
+from app.core.solver import SolveResult, solveAnytime
+
+"""
+后台求解器
+
+求解在独立进程中进行（纯 Python 搜索会长时间占用 GIL，放在线程里同样会拖慢界面），
+QThread 只负责转发子进程的进度和结果，因此搜索期间 Qt 事件循环不受影响。
+"""
+
+# 子进程上报进度的最小间隔（秒）
+PROGRESS_INTERVAL = 0.1
+
+
+def _solveEntry(tiles, size, heuristic, options, messages, cancel_event):
+    """子进程入口，heuristic 为启发函数描述串（在子进程里构造，表只在子进程中加载）"""
+    last_report = 0.0
+
+    def progress(nodes, bound):
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            messages.put(("progress", nodes, float(bound)))
+
+    try:
+        result = solveAnytime(tiles, size, heuristic=makeHeuristic(heuristic, size), progress=progress,
+                              should_stop=cancel_event.is_set, **options)
+    except Exception as e:
+        result = SolveResult(False, reason=f"error: {e}")
+    messages.put(("result", result))
+
+
+class SolverWorker(QThread):
+    """在子进程中运行求解器，并以信号形式报告进度和结果"""
+
+    progressChanged = pyqtSignal(int, float)  # 已扩展节点数, 当前阈值
+    resultReady = pyqtSignal(object)          # SolveResult
+
+    def __init__(self, tiles, size, max_nodes=None, time_limit=None, heuristic="auto", parent=None):
+        super().__init__(parent)
+        self.tiles = bytes(tiles)
+        self.size = size
+        self.heuristic = heuristic
+        self.options = {"max_nodes": max_nodes, "time_limit": time_limit}
+        self._messages = multiprocessing.Queue()
+        self._cancel_event = multiprocessing.Event()
+        self._process = None
+
+    def cancel(self):
+        """请求取消，子进程会在下一次检查时退出"""
+        self._cancel_event.set()
+
+    def stop(self, timeout=2000):
+        """取消并等待线程结束（毫秒）；子进程没有及时退出时强制结束"""
+        self.cancel()
+        if not self.wait(timeout):
+            process = self._process
+            if process is not None and process.is_alive():
+                process.terminate()
+            self.wait()
+
+    def isCancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        process = multiprocessing.Process(
+            target=_solveEntry,
+            args=(self.tiles, self.size, self.heuristic, self.options, self._messages, self._cancel_event),
+            daemon=True
+        )
+        self._process = process
+        process.start()
+        result = None
+        while result is None:
+            try:
+                message = self._messages.get(timeout=0.1)
+            except queue.Empty:
+                if not process.is_alive():
+                    break
+                continue
+            if message[0] == "progress":
+                self.progressChanged.emit(message[1], message[2])
+            else:
+                result = message[1]
+        process.join()
+        if result is None:
+            result = SolveResult(False, reason="cancelled" if self.isCancelled() else "error")
+        self.resultReady.emit(result)
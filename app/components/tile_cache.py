@@ -0,0 +1,153 @@
+from PyQt5.QtGui import QImage
+import hashlib
+import json
+import os
+import threading
+import time
+
+from app.common.file_utils import atomicWrite
+from app.common.setting import CONFIG_FOLDER
+
+"""
+磁盘上的棋盘贴图缓存
+
+把已经裁剪、缩放到棋盘大小的图片以原始像素格式保存在 AppData/tile_cache 下，
+index.json 记录每个条目的尺寸、像素格式和最近使用时间。
+键由源文件签名（路径 + 修改时间 + 大小 的哈希）和棋盘像素大小组成，与网格数无关，
+三个难度的棋盘像素大小相同时共用一个条目。源文件变化后键随之改变，旧条目在写入新条目时清除。
+总大小超出上限时按最近使用时间淘汰。
+读取只更新内存中的最近使用时间，索引在写入、淘汰或 flush()（退出时）时才写盘。
+在解码线程中调用，内部加锁。
+"""
+
+TILE_CACHE_FOLDER = CONFIG_FOLDER / "tile_cache"
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+class TileCache:
+    """棋盘贴图的磁盘缓存"""
+
+    def __init__(self, folder=TILE_CACHE_FOLDER, max_bytes=DEFAULT_MAX_BYTES):
+        self.folder = folder
+        self.index_file = folder / "index.json"
+        self.max_bytes = max_bytes
+        self._index = None
+        self._dirty = False  # 内存中的索引有尚未写盘的修改
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def sourceSignature(path):
+        stat = os.stat(path)
+        raw = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def makeKey(self, path, pixels):
+        try:
+            return f"{self.sourceSignature(path)}_{pixels}"
+        except OSError:
+            return None
+
+    def _loadIndex(self):
+        if self._index is None:
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _saveIndex(self):
+        atomicWrite(self.index_file, json.dumps(self._index).encode("utf-8"))
+        self._dirty = False
+
+    def _remove(self, key):
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._dirty = True
+            try:
+                os.remove(self.folder / entry["file"])
+            except OSError:
+                pass
+
+    def get(self, path, pixels):
+        """读取缓存的棋盘贴图（边长 pixels），不存在或已失效时返回 None"""
+        key = self.makeKey(path, pixels)
+        if key is None:
+            return None
+        with self._lock:
+            index = self._loadIndex()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self.folder / entry["file"], "rb") as f:
+                    data = f.read()
+            except OSError:
+                self._remove(key)
+                return None
+            if len(data) != entry["bytes"]:
+                self._remove(key)
+                return None
+            # 只更新内存，命中时不写盘
+            entry["last_used"] = time.time()
+            self._dirty = True
+        image = QImage(data, entry["width"], entry["height"], entry["bytes_per_line"], QImage.Format(entry["format"]))
+        # QImage 不持有 data 的所有权，复制一份
+        return image.copy()
+
+    def put(self, path, pixels, image):
+        """写入贴图，同时清除同一源文件的过期条目并按大小上限淘汰"""
+        key = self.makeKey(path, pixels)
+        if key is None or image.isNull():
+            return
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        data = image.constBits().asstring(size)
+        source = os.path.abspath(path)
+        with self._lock:
+            index = self._loadIndex()
+            for old_key, entry in list(index.items()):
+                if entry.get("source") == source and not old_key.startswith(key.split("_")[0]):
+                    self._remove(old_key)
+
+            file_name = f"{key}.raw"
+            atomicWrite(self.folder / file_name, data)
+            index[key] = {
+                "file": file_name,
+                "source": source,
+                "width": image.width(),
+                "height": image.height(),
+                "bytes_per_line": image.bytesPerLine(),
+                "format": int(image.format()),
+                "bytes": size,
+                "last_used": time.time(),
+            }
+
+            total = sum(entry["bytes"] for entry in index.values())
+            for old_key in sorted(index, key=lambda k: index[k]["last_used"]):
+                if total <= self.max_bytes:
+                    break
+                if old_key == key:
+                    continue
+                total -= index[old_key]["bytes"]
+                self._remove(old_key)
+            self._saveIndex()
+
+    def flush(self):
+        """把内存中的最近使用时间等修改写入索引（退出时调用）"""
+        with self._lock:
+            if self._dirty and self._index is not None:
+                try:
+                    self._saveIndex()
+                except OSError:
+                    pass
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._loadIndex()):
+                self._remove(key)
+            self._saveIndex()
+
+
+tileCache = TileCache()
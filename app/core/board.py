@@ -0,0 +1,214 @@
+"""
+无界面（Qt-free）的拼图状态引擎
+
+棋盘用 bytearray 保存当前排列：tiles[位置] = 拼图块编号，空白块编号为 total - 1。
+同时缓存空白块位置和错位块数量，使移动、合法移动枚举和完成检查都是 O(1)。
+"""
+
+# 空白块的移动方向。取值 0~3，可以用 2 bit 编码；相反方向为 d ^ 1
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DIRECTION_NAMES = ("上", "下", "左", "右")
+
+_NEIGHBOR_CACHE = {}
+_STEP_CACHE = {}
+
+
+def neighborTable(size):
+    """返回每个位置的相邻位置表，按尺寸缓存"""
+    table = _NEIGHBOR_CACHE.get(size)
+    if table is None:
+        table = []
+        for pos in range(size * size):
+            row, col = divmod(pos, size)
+            moves = []
+            if row > 0: moves.append(pos - size)
+            if row < size - 1: moves.append(pos + size)
+            if col > 0: moves.append(pos - 1)
+            if col < size - 1: moves.append(pos + 1)
+            table.append(tuple(moves))
+        table = tuple(table)
+        _NEIGHBOR_CACHE[size] = table
+    return table
+
+
+def stepTable(size):
+    """返回 steps[位置][方向] -> 空白块移动后的位置，越界为 -1"""
+    table = _STEP_CACHE.get(size)
+    if table is None:
+        table = []
+        for pos in range(size * size):
+            row, col = divmod(pos, size)
+            table.append((
+                pos - size if row > 0 else -1,
+                pos + size if row < size - 1 else -1,
+                pos - 1 if col > 0 else -1,
+                pos + 1 if col < size - 1 else -1,
+            ))
+        table = tuple(table)
+        _STEP_CACHE[size] = table
+    return table
+
+
+def directionBetween(size, src, dst):
+    """空白块从 src 移到相邻位置 dst 时的方向"""
+    diff = dst - src
+    if diff == -size:
+        return UP
+    if diff == size:
+        return DOWN
+    if diff == -1:
+        return LEFT
+    if diff == 1:
+        return RIGHT
+    raise ValueError(f"{src} 与 {dst} 不相邻")
+
+
+def isSolvable(tiles, size):
+    """判断排列是否可解（空白块为 size*size-1）"""
+    total = size * size
+    blank_piece = total - 1
+    pieces = [p for p in tiles if p != blank_piece]
+    # 用置换的环分解计算逆序数奇偶性，O(n)
+    seen = bytearray(total)
+    index_of = {p: i for i, p in enumerate(sorted(pieces))}
+    perm = [index_of[p] for p in pieces]
+    parity = 0
+    for start in range(len(perm)):
+        if seen[start]:
+            continue
+        length = 0
+        i = start
+        while not seen[i]:
+            seen[i] = 1
+            i = perm[i]
+            length += 1
+        parity ^= (length - 1) & 1
+    if size % 2 == 1:
+        return parity == 0
+    blank_row_from_bottom = size - list(tiles).index(blank_piece) // size
+    return (parity + blank_row_from_bottom) % 2 == 1
+
+
+class PuzzleBoard:
+    """紧凑的拼图状态，tiles[位置] = 拼图块编号"""
+
+    __slots__ = ("size", "total", "blank_piece", "tiles", "blank", "misplaced",
+                 "_neighbors", "_steps")
+
+    def __init__(self, size, tiles=None):
+        self.size = size
+        self.total = size * size
+        self.blank_piece = self.total - 1
+        self._neighbors = neighborTable(size)
+        self._steps = stepTable(size)
+        self.reset(tiles)
+
+    def reset(self, tiles=None):
+        """重置为给定排列，默认是完成状态"""
+        if tiles is None:
+            self.tiles = bytearray(range(self.total))
+        else:
+            tiles = bytearray(tiles)
+            if len(tiles) != self.total or sorted(tiles) != list(range(self.total)):
+                raise ValueError(f"无效的 {self.size}x{self.size} 排列")
+            self.tiles = tiles
+        self.blank = self.tiles.index(self.blank_piece)
+        self.misplaced = sum(1 for pos, piece in enumerate(self.tiles) if pos != piece)
+
+    def copy(self):
+        board = PuzzleBoard.__new__(PuzzleBoard)
+        board.size = self.size
+        board.total = self.total
+        board.blank_piece = self.blank_piece
+        board._neighbors = self._neighbors
+        board._steps = self._steps
+        board.tiles = bytearray(self.tiles)
+        board.blank = self.blank
+        board.misplaced = self.misplaced
+        return board
+
+    def positions(self):
+        """以列表形式返回当前排列"""
+        return list(self.tiles)
+
+    def isSolved(self):
+        return self.misplaced == 0
+
+    def legalMoves(self):
+        """可以和空白块交换的位置"""
+        return self._neighbors[self.blank]
+
+    def canMove(self, pos):
+        return pos in self._neighbors[self.blank]
+
+    def _swap(self, pos):
+        tiles = self.tiles
+        blank = self.blank
+        piece = tiles[pos]
+        # 增量维护错位块数量：只有两个位置发生变化
+        self.misplaced += (piece != blank) - (piece != pos) \
+            + (self.blank_piece != pos) - (self.blank_piece != blank)
+        tiles[blank] = piece
+        tiles[pos] = self.blank_piece
+        self.blank = pos
+
+    def move(self, pos):
+        """将 pos 处的拼图块移入空白处，不相邻时返回 False"""
+        if pos not in self._neighbors[self.blank]:
+            return False
+        self._swap(pos)
+        return True
+
+    def moveBlank(self, direction):
+        """按方向移动空白块，越界时返回 False"""
+        target = self._steps[self.blank][direction]
+        if target < 0:
+            return False
+        self._swap(target)
+        return True
+
+    def slideTo(self, pos):
+        """
+        把 pos 与空白块之间（同一行或同一列）的一整排拼图块一次性滑向空白块
+
+        返回依次执行的空白块方向列表，不在同一行/列时返回空列表，状态不变。
+        """
+        size = self.size
+        blank_row, blank_col = divmod(self.blank, size)
+        row, col = divmod(pos, size)
+        if row == blank_row and col != blank_col:
+            direction, count, step = (RIGHT, col - blank_col, 1) if col > blank_col else (LEFT, blank_col - col, -1)
+        elif col == blank_col and row != blank_row:
+            direction, count, step = (DOWN, row - blank_row, size) if row > blank_row else (UP, blank_row - row, -size)
+        else:
+            return []
+        # 整排平移：每块前移一格，空白块最后写到 pos；错位数按 _swap 的方式逐格累计
+        tiles = self.tiles
+        blank_piece = self.blank_piece
+        blank = self.blank
+        misplaced = self.misplaced
+        for _ in range(count):
+            target = blank + step
+            piece = tiles[target]
+            misplaced += (piece != blank) - (piece != target) + (blank_piece != target) - (blank_piece != blank)
+            tiles[blank] = piece
+            blank = target
+        tiles[blank] = blank_piece
+        self.blank = blank
+        self.misplaced = misplaced
+        return [direction] * count
+
+    def applyMoves(self, directions):
+        """依次应用一串空白块移动方向"""
+        for direction in directions:
+            if not self.moveBlank(direction):
+                raise ValueError(f"非法移动: {direction}")
+
+    def __eq__(self, other):
+        return isinstance(other, PuzzleBoard) and self.size == other.size and self.tiles == other.tiles
+
+    def __hash__(self):
+        return hash((self.size, bytes(self.tiles)))
+
+    def __repr__(self):
+        return f"PuzzleBoard({self.size}, {list(self.tiles)})"
@@ -0,0 +1,54 @@
+"""
+打乱棋盘生成
+
+randomSolvable 直接均匀采样一个排列（Fisher-Yates，O(n)），若不可解则交换两个非空白块修正奇偶性，
+得到的是所有可解状态上的均匀分布。randomWithLength 额外借助求解器，生成最优步数落在指定范围内的棋盘。
+"""
+
+import random
+
+from app.core.board import PuzzleBoard, isSolvable
+from app.core.solver import solve
+
+
+def randomSolvable(size, rng=random):
+    """均匀随机、保证可解且不是完成状态的排列"""
+    total = size * size
+    blank_piece = total - 1
+    identity = list(range(total))
+    while True:
+        tiles = list(identity)
+        rng.shuffle(tiles)
+        if not isSolvable(tiles, size):
+            # 交换两个非空白块即可翻转奇偶性
+            first, second = [i for i, piece in enumerate(tiles) if piece != blank_piece][:2]
+            tiles[first], tiles[second] = tiles[second], tiles[first]
+        if tiles != identity:
+            return bytearray(tiles)
+
+
+def randomWalk(size, steps, rng=random):
+    """从完成状态出发的不回头随机游走"""
+    board = PuzzleBoard(size)
+    previous = -1
+    for _ in range(steps):
+        moves = [pos for pos in board.legalMoves() if pos != previous]
+        previous = board.blank
+        board.move(rng.choice(moves))
+    return board.tiles
+
+
+def randomWithLength(size, min_moves, max_moves, rng=random, attempts=200, time_limit=2.0, heuristic=None):
+    """
+    生成最优解步数在 [min_moves, max_moves] 内的棋盘，返回 (tiles, 步数)，失败时返回 None
+
+    候选棋盘来自长度在 [min_moves, 3 * max_moves] 之间的随机游走：目标较短时游走能命中，
+    目标较长时游走已经足够混乱，接近均匀分布。每个候选用最优 IDA* 验证，超出预算的候选直接丢弃。
+    """
+    for _ in range(attempts):
+        steps = rng.randint(max(1, min_moves), max(min_moves, 3 * max_moves))
+        tiles = randomWalk(size, steps, rng)
+        result = solve(tiles, size, heuristic=heuristic, max_nodes=None, time_limit=time_limit)
+        if result.solved and min_moves <= result.length <= max_moves:
+            return tiles, result.length
+    return None
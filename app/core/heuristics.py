@@ -0,0 +1,122 @@
+"""
+启发函数插件注册表
+
+每个启发函数都实现同一个接口：name 属性、reset(tiles) 返回初始值、
+delta(tiles, piece, src, dst) 在拼图块从 src 移到 dst 之后返回变化量。
+registerHeuristic 注册新的实现；makeHeuristic 按描述串构造实例，描述串可以是：
+    manhattan / linear_conflict / walking_distance / pdb / auto
+    max:a,b,...   各启发函数取最大值（仍然可采纳）
+    sum:a,b,...   各启发函数相加（只有各部分统计的移动互不重叠时才可采纳）
+pdb 需要先生成表文件，表文件缺失时 makeHeuristic 直接报错而不是悄悄换成其他启发函数。
+"""
+
+from app.core.pattern_db import PARTITIONS, PatternDatabaseHeuristic, isAvailable
+from app.core.solver import LinearConflictHeuristic, ManhattanHeuristic, defaultHeuristic
+from app.core.walking_distance import SUPPORTED_SIZES, WalkingDistanceHeuristic
+
+_registry = {}
+
+
+def registerHeuristic(name, factory, sizes=None, requires=None):
+    """
+    注册启发函数，factory(size) 返回实例，sizes 为支持的尺寸（None 表示不限）
+
+    requires 为可选的 (检查函数, 提示) 元组：检查函数 check(size) 返回 False 时该尺寸暂不可用
+    （例如表文件还没有生成），提示是说明如何使其可用的格式串，可以引用 {size}。
+    """
+    _registry[name] = (factory, tuple(sizes) if sizes is not None else None, requires)
+
+
+def availableHeuristics(size=None):
+    """已注册的启发函数名，给定 size 时只返回支持该尺寸的"""
+    return [name for name, (_, sizes, _) in _registry.items()
+            if size is None or sizes is None or size in sizes]
+
+
+class CombinedHeuristic:
+    """把多个启发函数的值取最大值（max）或相加（sum），各部分分别增量更新"""
+
+    def __init__(self, parts, mode="max"):
+        if mode not in ("max", "sum"):
+            raise ValueError(f"未知的组合方式: {mode}")
+        self.parts = parts
+        self.mode = mode
+        self.name = f"{mode}:" + ",".join(part.name for part in parts)
+        self.values = [0] * len(parts)
+        self.value = 0
+
+    def _combine(self):
+        return max(self.values) if self.mode == "max" else sum(self.values)
+
+    def reset(self, tiles):
+        self.values = [part.reset(tiles) for part in self.parts]
+        self.value = self._combine()
+        return self.value
+
+    def delta(self, tiles, piece, src, dst):
+        values = self.values
+        for i, part in enumerate(self.parts):
+            values[i] += part.delta(tiles, piece, src, dst)
+        old_value = self.value
+        self.value = self._combine()
+        return self.value - old_value
+
+
+def _lookup(name, size):
+    """返回已注册的 factory，名称未注册、不支持该尺寸或暂不可用时抛出 ValueError"""
+    entry = _registry.get(name)
+    if entry is None:
+        raise ValueError(f"未知的启发函数: {name}")
+    factory, sizes, requires = entry
+    if size is not None:
+        if sizes is not None and size not in sizes:
+            raise ValueError(f"启发函数 {name} 不支持 {size}x{size} 棋盘")
+        if requires is not None and not requires[0](size):
+            raise ValueError(f"启发函数 {name} 在 {size}x{size} 棋盘上不可用，" + requires[1].format(size=size))
+    return factory
+
+
+def _parseSpec(spec):
+    """拆分描述串，返回 (组合方式或 None, 名称列表)，格式错误时抛出 ValueError"""
+    mode, sep, rest = spec.strip().partition(":")
+    if not sep:
+        return None, [mode]
+    names = [name.strip() for name in rest.split(",") if name.strip()]
+    if not names:
+        raise ValueError(f"组合启发函数缺少组成部分: {spec}")
+    if mode.strip() not in ("max", "sum"):
+        raise ValueError(f"未知的组合方式: {mode.strip()}")
+    return mode.strip(), names
+
+
+def checkSpec(spec, size=None):
+    """检查描述串，不合法时抛出说明原因的 ValueError；给定 size 时还检查各组成部分在该尺寸上是否可用"""
+    if not isinstance(spec, str):
+        raise ValueError(f"启发函数描述串应为字符串: {spec!r}")
+    for name in _parseSpec(spec)[1]:
+        _lookup(name, size)
+
+
+def makeHeuristic(spec, size):
+    """按描述串构造启发函数，名称未注册、不支持该尺寸或暂不可用时抛出 ValueError"""
+    mode, names = _parseSpec(spec)
+    if mode is not None:
+        return CombinedHeuristic([makeHeuristic(name, size) for name in names], mode)
+    return _lookup(names[0], size)(size)
+
+
+def isValidSpec(spec, size=None):
+    """描述串是否合法；给定 size 时还要求所有组成部分在该尺寸上可用"""
+    try:
+        checkSpec(spec, size)
+    except ValueError:
+        return False
+    return True
+
+
+registerHeuristic("auto", defaultHeuristic)
+registerHeuristic("manhattan", ManhattanHeuristic)
+registerHeuristic("linear_conflict", LinearConflictHeuristic)
+registerHeuristic("walking_distance", WalkingDistanceHeuristic, sizes=SUPPORTED_SIZES)
+registerHeuristic("pdb", PatternDatabaseHeuristic, sizes=PARTITIONS,
+                  requires=(isAvailable, "请先运行 python -m app.core.pattern_db --size {size} 生成表文件"))
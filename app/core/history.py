@@ -0,0 +1,137 @@
+"""
+走子记录：每步保存空白块的移动方向（0~3），4 步打包进 1 个字节
+
+cursor 之前的是已执行的步，之后的是可以重做的步，撤销/重做都是 O(1)；
+撤销后再走新的一步会丢弃重做分支。记录超过 max_moves 时丢弃最早的一半，
+并把这些步应用到起始棋盘上，所以“起始棋盘 + 记录”始终能还原当前局面，内存有上限。
+
+序列化格式（小端）：
+    头部 20 字节：b"PZMH", 版本(u8), 尺寸(u8), 保留(u16), 记录步数(u32), cursor(u32), 已丢弃步数(u32)
+    起始棋盘：尺寸*尺寸 字节
+    走子：(记录步数 + 3) // 4 字节
+"""
+
+import struct
+
+from app.core.board import PuzzleBoard
+
+# 默认最多保留 100 万步（256 KiB）
+DEFAULT_MAX_MOVES = 1 << 20
+# 裁剪按整字节丢弃一半记录，至少要有 2 个字节（8 步）才能每次丢弃 4 步
+MIN_MAX_MOVES = 8
+
+_MAGIC = b"PZMH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBHIII")
+
+
+class MoveHistory:
+    """2 bit 打包的走子记录，支持撤销、重做和序列化"""
+
+    __slots__ = ("size", "max_moves", "origin", "data", "length", "cursor", "dropped")
+
+    def __init__(self, size, tiles=None, max_moves=DEFAULT_MAX_MOVES):
+        if max_moves < MIN_MAX_MOVES:
+            raise ValueError(f"max_moves 至少为 {MIN_MAX_MOVES}")
+        self.size = size
+        self.max_moves = max_moves
+        self.reset(tiles)
+
+    def reset(self, tiles=None):
+        """以 tiles（默认完成状态）为起始棋盘清空记录"""
+        self.origin = PuzzleBoard(self.size, tiles)
+        self.data = bytearray()
+        self.length = 0
+        self.cursor = 0
+        self.dropped = 0
+
+    def __len__(self):
+        """已执行的步数（不含已丢弃的）"""
+        return self.cursor
+
+    @property
+    def total(self):
+        """本局累计执行的步数"""
+        return self.dropped + self.cursor
+
+    def canUndo(self):
+        return self.cursor > 0
+
+    def canRedo(self):
+        return self.cursor < self.length
+
+    def _get(self, index):
+        return (self.data[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def _set(self, index, direction):
+        byte, shift = index >> 2, (index & 3) << 1
+        if byte == len(self.data):
+            self.data.append(0)
+        self.data[byte] = (self.data[byte] & ~(3 << shift)) | (direction << shift)
+
+    def push(self, direction):
+        """记录一步空白块移动，丢弃重做分支"""
+        if self.cursor >= self.max_moves:
+            self._trim()
+        self._set(self.cursor, direction)
+        self.cursor += 1
+        self.length = self.cursor
+        # 重做分支已丢弃，释放多余的字节
+        del self.data[(self.length + 3) >> 2:]
+
+    def undo(self):
+        """撤销一步，返回需要执行的空白块方向（与原方向相反），没有可撤销的步时返回 None"""
+        if self.cursor == 0:
+            return None
+        self.cursor -= 1
+        return self._get(self.cursor) ^ 1
+
+    def redo(self):
+        """重做一步，返回空白块方向，没有可重做的步时返回 None"""
+        if self.cursor >= self.length:
+            return None
+        direction = self._get(self.cursor)
+        self.cursor += 1
+        return direction
+
+    def moves(self):
+        """已执行的方向序列（不含重做分支）"""
+        return [self._get(i) for i in range(self.cursor)]
+
+    def _trim(self):
+        """丢弃最早的一半记录（按整字节），把这些步应用到起始棋盘"""
+        drop = (self.cursor // 2) & ~3
+        self.origin.applyMoves(self._get(i) for i in range(drop))
+        del self.data[:drop >> 2]
+        self.length -= drop
+        self.cursor -= drop
+        self.dropped += drop
+
+    def currentTiles(self):
+        """从起始棋盘重放已执行的步，得到当前排列"""
+        board = self.origin.copy()
+        board.applyMoves(self.moves())
+        return board.tiles
+
+    def toBytes(self):
+        return _HEADER.pack(_MAGIC, _VERSION, self.size, 0, self.length, self.cursor, self.dropped) \
+            + bytes(self.origin.tiles) + bytes(self.data[:(self.length + 3) >> 2])
+
+    @classmethod
+    def fromBytes(cls, data, max_moves=DEFAULT_MAX_MOVES):
+        """从 toBytes 的结果恢复，格式不对时抛出 ValueError"""
+        try:
+            magic, version, size, _, length, cursor, dropped = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("走子记录已损坏")
+        total = size * size
+        packed = (length + 3) >> 2
+        if magic != _MAGIC or version != _VERSION or cursor > length \
+                or len(data) != _HEADER.size + total + packed:
+            raise ValueError("走子记录格式无效")
+        history = cls(size, data[_HEADER.size:_HEADER.size + total], max(max_moves, length, MIN_MAX_MOVES))
+        history.data = bytearray(data[_HEADER.size + total:])
+        history.length = length
+        history.cursor = cursor
+        history.dropped = dropped
+        return history
@@ -0,0 +1,172 @@
+"""
+分级关卡包
+
+按目标步数预先批量生成棋盘（进程池并行），存为紧凑的二进制关卡包，
+游戏中选择子关卡时直接从包里取，不在点击时做任何搜索。
+
+文件格式（小端）：
+    头部 12 字节：b"PZLV", 版本(u8), 尺寸(u8), 标志(u8, bit0=步数为最优解), 保留(u8), 关卡数(u32)
+    每个关卡：尺寸*尺寸 字节的排列 + 步数(u16)
+步数为最优解步数，或（未置 bit0 时）线性冲突启发值估计的步数下界。
+
+命令行：python -m app.core.level_pack --size 4 --count 50
+"""
+
+import argparse
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from app.common.file_utils import atomicWrite
+from app.core.generator import randomWalk, randomWithLength
+from app.core.solver import LinearConflictHeuristic
+
+LEVEL_FOLDER = Path(__file__).resolve().parent.parent / "resource" / "levels"
+
+_MAGIC = b"PZLV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBBBI")
+_FLAG_OPTIMAL = 1
+
+# 各尺寸的子关卡：(名称, 最少步数, 最多步数)
+# 3x3 为最优解步数；4x4/5x5 默认按线性冲突启发值估计
+DIFFICULTY_TIERS = {
+    3: (("入门", 6, 12), ("进阶", 13, 20), ("挑战", 21, 31)),
+    4: (("入门", 10, 25), ("进阶", 26, 40), ("挑战", 41, 60)),
+    5: (("入门", 20, 50), ("进阶", 51, 80), ("挑战", 81, 120)),
+}
+OPTIMAL_BY_DEFAULT = {3: True, 4: False, 5: False}
+# 每个关卡最多提交的生成任务数；步数范围太窄或与尺寸不匹配时避免无限重试
+MAX_TASKS_PER_LEVEL = 20
+
+_packs = {}
+
+
+class LevelPack:
+    """内存中的关卡包"""
+
+    def __init__(self, size, levels, optimal):
+        self.size = size
+        self.levels = levels  # [(tiles: bytes, moves: int)]
+        self.optimal = optimal
+
+    def select(self, min_moves, max_moves):
+        return [level for level in self.levels if min_moves <= level[1] <= max_moves]
+
+    def pick(self, min_moves, max_moves, rng=random):
+        """随机取一个步数在范围内的关卡，没有时返回 None"""
+        candidates = self.select(min_moves, max_moves)
+        return rng.choice(candidates) if candidates else None
+
+
+def packFile(size, folder=LEVEL_FOLDER):
+    return Path(folder) / f"{size}x{size}.pack"
+
+
+def writeLevelPack(path, size, levels, optimal):
+    record = struct.Struct(f"<{size * size}sH")
+    chunks = [_HEADER.pack(_MAGIC, _VERSION, size, _FLAG_OPTIMAL if optimal else 0, 0, len(levels))]
+    chunks.extend(record.pack(bytes(tiles), moves) for tiles, moves in levels)
+    atomicWrite(path, chunks)
+
+
+def readLevelPack(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, size, flags, _, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"关卡包格式无效: {path}")
+    record = struct.Struct(f"<{size * size}sH")
+    if len(data) != _HEADER.size + count * record.size:
+        raise ValueError(f"关卡包已损坏: {path}")
+    levels = [record.unpack_from(data, _HEADER.size + i * record.size) for i in range(count)]
+    return LevelPack(size, levels, bool(flags & _FLAG_OPTIMAL))
+
+
+def loadLevelPack(size):
+    """加载并缓存内置关卡包，不存在或损坏时返回 None"""
+    if size not in _packs:
+        try:
+            _packs[size] = readLevelPack(packFile(size))
+        except (OSError, ValueError, struct.error):
+            _packs[size] = None
+    return _packs[size]
+
+
+def _generateOne(args):
+    """进程池任务：生成一个步数在范围内的关卡，失败返回 None"""
+    size, min_moves, max_moves, optimal, seed = args
+    rng = random.Random(seed)
+    if optimal:
+        found = randomWithLength(size, min_moves, max_moves, rng, attempts=20)
+        return (bytes(found[0]), found[1]) if found else None
+    heuristic = LinearConflictHeuristic(size)
+    for _ in range(50):
+        tiles = randomWalk(size, rng.randint(min_moves, 3 * max_moves), rng)
+        estimate = heuristic.reset(tiles)
+        if min_moves <= estimate <= max_moves:
+            return bytes(tiles), estimate
+    return None
+
+
+def generateLevels(size, min_moves, max_moves, count, optimal, workers=None, seed=0):
+    """
+    用进程池批量生成 count 个关卡（去重）
+
+    总任务数不超过 count * MAX_TASKS_PER_LEVEL，达到上限时返回已生成的部分（可能少于 count）。
+    """
+    levels = {}
+    next_seed = seed
+    task_limit = seed + count * MAX_TASKS_PER_LEVEL
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while len(levels) < count and next_seed < task_limit:
+            batch_size = min(count - len(levels), task_limit - next_seed)
+            batch = [(size, min_moves, max_moves, optimal, next_seed + i) for i in range(batch_size)]
+            next_seed += len(batch)
+            for level in pool.map(_generateOne, batch):
+                if level is not None and len(levels) < count:
+                    levels.setdefault(level[0], level[1])
+    return list(levels.items())
+
+
+def buildLevelPack(size, count, optimal=None, workers=None, seed=0, folder=LEVEL_FOLDER, report=print):
+    """为每个子关卡生成 count 个棋盘并写入关卡包，某个子关卡一个也生成不了时抛出 ValueError"""
+    if optimal is None:
+        optimal = OPTIMAL_BY_DEFAULT[size]
+    levels = []
+    for name, min_moves, max_moves in DIFFICULTY_TIERS[size]:
+        start = time.perf_counter()
+        tier = generateLevels(size, min_moves, max_moves, count, optimal, workers, seed)
+        seed += 1_000_000
+        if not tier:
+            raise ValueError(f"{size}x{size} 的子关卡 {name} ({min_moves}-{max_moves} 步) 无法生成任何棋盘")
+        levels.extend(sorted(tier, key=lambda level: level[1]))
+        report(f"  {name} ({min_moves}-{max_moves} 步): {len(tier)} 个, {time.perf_counter() - start:.1f}s"
+               + (f"，未达到 {count} 个" if len(tier) < count else ""))
+    path = packFile(size, folder)
+    writeLevelPack(path, size, levels, optimal)
+    _packs.pop(size, None)
+    report(f"{size}x{size}: {len(levels)} 个关卡 -> {path} ({path.stat().st_size} 字节)")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="批量生成分级关卡包")
+    parser.add_argument("--size", type=int, choices=sorted(DIFFICULTY_TIERS), required=True)
+    parser.add_argument("--count", type=int, default=50, help="每个子关卡的棋盘数量")
+    parser.add_argument("--optimal", action="store_true", default=None, help="用最优解步数分级（较慢）")
+    parser.add_argument("--estimate", dest="optimal", action="store_false", help="用启发值估计步数分级")
+    parser.add_argument("--workers", type=int, default=None, help="进程数，默认为 CPU 核数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(LEVEL_FOLDER), help="输出目录")
+    args = parser.parse_args(argv)
+    try:
+        buildLevelPack(args.size, args.count, args.optimal, args.workers, args.seed, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+不相交可加模式数据库（additive pattern database）
+
+把非空白拼图块划分成若干互不相交的分组，对每个分组在“只关心组内拼图块”的抽象空间里
+从目标状态做 BFS，记录组内拼图块被移动的最少次数。各分组只计算自身拼图块的移动，
+因此多个分组的值可以直接相加，仍然是可采纳的启发函数。
+
+表按 位置^k 的混合进制直接寻址（每项 1 字节），拼图块移动一步时索引可以 O(1) 增量更新。
+状态空间较小的分组在构建时同时跟踪空白块位置（0-1 BFS，结果更精确），
+较大的分组退化为忽略空白块的松弛版本，以控制构建时的内存。
+表文件保存在 AppData/pdb 下，首次使用时以 mmap 方式只读加载。
+
+表文件与平台无关，但不放进仓库（AppData/pdb 已被忽略），也不会在游戏中自动构建。
+默认方案（4x4 为 5-5-5，约 3 MiB；5x5 为 4-4-4-4-4-4，约 2.2 MiB）按下面的命令各构建一次，
+发布时把生成的 AppData/pdb 目录随程序一起打包；没有表文件时 auto 退回 Walking Distance
+或线性冲突，显式指定 pdb 则报错：
+    python -m app.core.pattern_db --size 4
+    python -m app.core.pattern_db --size 5
+其他方案只用于比较构建时间、文件大小和查表吞吐量（--all 构建该尺寸的全部方案）。
+"""
+
+import argparse
+import mmap
+import random
+import time
+
+from app.common.file_utils import atomicWrite
+from app.common.setting import CONFIG_FOLDER
+from app.core.board import PuzzleBoard, neighborTable
+
+PDB_FOLDER = CONFIG_FOLDER / "pdb"
+
+# 分组方案：拼图块编号按目标位置给出（空白块不参与）
+# 直接寻址的表有 (尺寸^2)^k 项，5x5 的 6 块分组每组约 244 MB，所以 5x5 只提供不超过 5 块的分组
+PARTITIONS = {
+    4: {
+        "5-5-5": ((0, 1, 4, 5, 8), (2, 3, 6, 7, 11), (9, 10, 12, 13, 14)),
+        "6-6-3": ((0, 1, 4, 5, 8, 12), (2, 3, 6, 7, 10, 11), (9, 13, 14)),
+    },
+    5: {
+        "4-4-4-4-4-4": ((0, 1, 5, 6), (2, 3, 7, 8), (4, 9, 14, 19),
+                        (10, 11, 15, 16), (12, 13, 17, 18), (20, 21, 22, 23)),
+        "5-5-5-5-4": ((0, 1, 2, 5, 6), (3, 4, 7, 8, 9), (10, 11, 15, 16, 20),
+                      (12, 13, 14, 17, 18), (19, 21, 22, 23)),
+    },
+}
+DEFAULT_PARTITIONS = {4: "5-5-5", 5: "4-4-4-4-4-4"}
+
+# 跟踪空白块时构建表的项数上限（每项 1 字节）
+BLANK_AWARE_LIMIT = 1 << 25
+
+_MAGIC = b"PZDB"
+_VERSION = 1
+_HEADER_SIZE = 16
+_UNVISITED = 255
+
+_loaded = {}
+
+
+def partitionGroups(size, partition=None):
+    """返回分组方案，partition 为 None 时使用默认方案"""
+    partition = partition or DEFAULT_PARTITIONS.get(size)
+    groups = PARTITIONS.get(size, {}).get(partition)
+    if groups is None:
+        raise ValueError(f"{size}x{size} 没有名为 {partition} 的分组方案")
+    return partition, groups
+
+
+def patternFile(size, pieces):
+    name = "-".join(str(p) for p in pieces)
+    return PDB_FOLDER / f"{size}x{size}_{name}.pdb"
+
+
+def isBlankAware(size, pieces):
+    total = size * size
+    return total ** (len(pieces) + 1) <= BLANK_AWARE_LIMIT
+
+
+def _buildRelaxed(size, pieces):
+    """忽略空白块：组内拼图块每次可移到任意相邻且未被组内占据的格子"""
+    total = size * size
+    k = len(pieces)
+    neighbors = neighborTable(size)
+    weights = [total ** (k - 1 - i) for i in range(k)]
+    table = bytearray([_UNVISITED]) * (total ** k)
+    start = sum(p * w for p, w in zip(pieces, weights))
+    table[start] = 0
+    frontier = [start]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        append = next_frontier.append
+        for index in frontier:
+            positions = []
+            rest = index
+            for w in weights:
+                pos, rest = divmod(rest, w)
+                positions.append(pos)
+            for i, pos in enumerate(positions):
+                w = weights[i]
+                for target in neighbors[pos]:
+                    if target in positions:
+                        continue
+                    new_index = index + (target - pos) * w
+                    if table[new_index] == _UNVISITED:
+                        table[new_index] = depth
+                        append(new_index)
+        frontier = next_frontier
+    return table
+
+
+def _buildBlankAware(size, pieces):
+    """跟踪空白块的 0-1 BFS：空白块与组外拼图块交换代价为 0，与组内拼图块交换代价为 1"""
+    total = size * size
+    k = len(pieces)
+    neighbors = neighborTable(size)
+    # 状态索引 = 组内位置混合进制 * total + 空白块位置
+    weights = [total ** (k - i) for i in range(k)]
+    dist = bytearray([_UNVISITED]) * (total ** (k + 1))
+    current = [sum(p * w for p, w in zip(pieces, weights)) + total - 1]
+    depth = 0
+    while current:
+        next_layer = []
+        while current:
+            index = current.pop()
+            if dist[index] != _UNVISITED:
+                continue
+            dist[index] = depth
+            blank = index % total
+            base = index - blank
+            for target in neighbors[blank]:
+                tile = -1
+                rest = base
+                for i, w in enumerate(weights):
+                    pos, rest = divmod(rest, w)
+                    if pos == target:
+                        tile = i
+                        break
+                if tile < 0:
+                    new_index = base + target
+                    if dist[new_index] == _UNVISITED:
+                        current.append(new_index)
+                else:
+                    new_index = base + (blank - target) * weights[tile] + target
+                    if dist[new_index] == _UNVISITED:
+                        next_layer.append(new_index)
+        current = next_layer
+        depth += 1
+
+    # 对空白块位置取最小值，得到只按组内位置寻址的表
+    table = bytearray([_UNVISITED]) * (total ** k)
+    for index in range(len(table)):
+        start = index * total
+        table[index] = min(dist[start:start + total])
+    return table
+
+
+def buildPattern(size, pieces):
+    """BFS 构建单个分组的表"""
+    if isBlankAware(size, pieces):
+        return _buildBlankAware(size, pieces)
+    return _buildRelaxed(size, pieces)
+
+
+def savePattern(path, size, pieces, table):
+    """写入表文件（先写临时文件再重命名，避免留下半个文件）"""
+    header = bytearray(_HEADER_SIZE)
+    header[:4] = _MAGIC
+    header[4] = _VERSION
+    header[5] = size
+    header[6] = len(pieces)
+    header[7] = isBlankAware(size, pieces)
+    header[8:8 + len(pieces)] = bytes(pieces)
+    atomicWrite(path, (header, table))
+
+
+def loadPattern(path, size, pieces):
+    """以 mmap 只读方式加载表，返回去掉文件头的 memoryview"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header = mapped[:_HEADER_SIZE]
+    k = len(pieces)
+    if header[:4] != _MAGIC or header[4] != _VERSION or header[5] != size or header[6] != k \
+            or tuple(header[8:8 + k]) != tuple(pieces) \
+            or len(mapped) != _HEADER_SIZE + (size * size) ** k:
+        mapped.close()
+        raise ValueError(f"模式数据库文件无效: {path}")
+    return memoryview(mapped)[_HEADER_SIZE:]
+
+
+class PatternDatabase:
+    """一组不相交的模式表"""
+
+    def __init__(self, size, partition, groups, tables):
+        self.size = size
+        self.partition = partition
+        self.groups = groups
+        self.tables = tables
+        total = size * size
+        # 每个拼图块所属分组及其在索引中的权重，空白块为 -1
+        self.group_of = [-1] * total
+        self.weight_of = [0] * total
+        for g, pieces in enumerate(groups):
+            k = len(pieces)
+            for i, piece in enumerate(pieces):
+                self.group_of[piece] = g
+                self.weight_of[piece] = total ** (k - 1 - i)
+
+    def indices(self, tiles):
+        indices = [0] * len(self.groups)
+        for pos, piece in enumerate(tiles):
+            g = self.group_of[piece]
+            if g >= 0:
+                indices[g] += pos * self.weight_of[piece]
+        return indices
+
+    def value(self, tiles):
+        return sum(table[i] for table, i in zip(self.tables, self.indices(tiles)))
+
+
+def isAvailable(size, partition=None):
+    """对应分组方案的表文件是否都已生成"""
+    try:
+        _, groups = partitionGroups(size, partition)
+    except ValueError:
+        return False
+    return all(patternFile(size, pieces).exists() for pieces in groups)
+
+
+def getPatternDatabase(size, partition=None, build=False):
+    """
+    懒加载模式数据库，结果按 (size, partition) 缓存
+
+    表文件不存在时，build=True 会当场构建并保存，否则返回 None。
+    """
+    partition, groups = partitionGroups(size, partition)
+    key = (size, partition)
+    if key in _loaded:
+        return _loaded[key]
+    tables = []
+    for pieces in groups:
+        path = patternFile(size, pieces)
+        if not path.exists():
+            if not build:
+                return None
+            savePattern(path, size, pieces, buildPattern(size, pieces))
+        tables.append(loadPattern(path, size, pieces))
+    db = PatternDatabase(size, partition, groups, tables)
+    _loaded[key] = db
+    return db
+
+
+class PatternDatabaseHeuristic:
+    """模式数据库启发函数，移动一块只更新所属分组的索引"""
+
+    name = "pdb"
+
+    def __init__(self, size, database=None):
+        self.size = size
+        # 不在这里构建：5x5 的表要构建好几分钟，求解子进程里既不能取消也不受时间限制
+        self.db = database or getPatternDatabase(size)
+        if self.db is None:
+            raise ValueError(f"{size}x{size} 的模式数据库尚未生成，请先运行 python -m app.core.pattern_db --size {size}")
+        self.tables = self.db.tables
+        self.group_of = self.db.group_of
+        self.weight_of = self.db.weight_of
+        self.indices = []
+
+    def reset(self, tiles):
+        self.indices = self.db.indices(tiles)
+        return sum(table[i] for table, i in zip(self.tables, self.indices))
+
+    def delta(self, tiles, piece, src, dst):
+        g = self.group_of[piece]
+        if g < 0:
+            return 0
+        table = self.tables[g]
+        old_index = self.indices[g]
+        new_index = old_index + (dst - src) * self.weight_of[piece]
+        self.indices[g] = new_index
+        return table[new_index] - table[old_index]
+
+
+def benchmarkLookups(db, count=200_000, seed=0):
+    """随机游走中做增量查表，返回每秒查表次数"""
+    rng = random.Random(seed)
+    board = PuzzleBoard(db.size)
+    heuristic = PatternDatabaseHeuristic(db.size, db)
+    heuristic.reset(board.tiles)
+    moves = [rng.randrange(4) for _ in range(count)]
+    start = time.perf_counter()
+    lookups = 0
+    for direction in moves:
+        dst = board.blank
+        if board.moveBlank(direction):
+            heuristic.delta(board.tiles, board.tiles[dst], board.blank, dst)
+            lookups += 1
+    return lookups / (time.perf_counter() - start)
+
+
+def buildPartition(size, partition=None, rebuild=False, report=print):
+    """构建整套分组并报告构建时间、文件大小和查表吞吐量"""
+    partition, groups = partitionGroups(size, partition)
+    stats = {"size": size, "partition": partition, "groups": []}
+    for pieces in groups:
+        path = patternFile(size, pieces)
+        elapsed = 0.0
+        if rebuild or not path.exists():
+            start = time.perf_counter()
+            table = buildPattern(size, pieces)
+            elapsed = time.perf_counter() - start
+            savePattern(path, size, pieces, table)
+        group = {
+            "pieces": list(pieces),
+            "blank_aware": isBlankAware(size, pieces),
+            "build_seconds": round(elapsed, 3),
+            "file_bytes": path.stat().st_size,
+        }
+        stats["groups"].append(group)
+        report(f"  分组 {pieces}: 构建 {elapsed:.2f}s, 文件 {group['file_bytes'] / 1024:.0f} KiB, "
+               f"{'跟踪空白块' if group['blank_aware'] else '松弛'}")
+    _loaded.pop((size, partition), None)
+    db = getPatternDatabase(size, partition)
+    stats["build_seconds"] = round(sum(g["build_seconds"] for g in stats["groups"]), 3)
+    stats["file_bytes"] = sum(g["file_bytes"] for g in stats["groups"])
+    stats["lookups_per_second"] = round(benchmarkLookups(db))
+    report(f"{size}x{size} {partition}: 共 {stats['build_seconds']:.2f}s, "
+           f"{stats['file_bytes'] / 1024 / 1024:.1f} MiB, {stats['lookups_per_second']:,} 次查表/秒")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="构建拼图模式数据库")
+    parser.add_argument("--size", type=int, choices=sorted(PARTITIONS), required=True)
+    parser.add_argument("--partition", help="分组方案，默认: " +
+                        ", ".join(f"{s}x{s}={p}" for s, p in DEFAULT_PARTITIONS.items()))
+    parser.add_argument("--all", action="store_true", help="构建该尺寸的全部分组方案，便于比较（随程序发布的只有默认方案）")
+    parser.add_argument("--rebuild", action="store_true", help="忽略已有文件重新构建")
+    args = parser.parse_args(argv)
+
+    partitions = list(PARTITIONS[args.size]) if args.all else [args.partition]
+    for partition in partitions:
+        buildPartition(args.size, partition, rebuild=args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
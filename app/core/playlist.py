@@ -0,0 +1,71 @@
+# coding: utf-8
+import random
+
+"""
+播放列表
+
+只保存曲目下标的播放顺序：顺序播放时为 0..n-1，随机播放时为一次洗牌得到的排列，
+当前曲目总是排在洗牌结果的最前面，切换模式时不打断正在播放的歌。播完一轮后从头循环，
+随机模式下重新洗牌（并避免新一轮的第一首与刚播完的那首相同）。
+"""
+
+
+class Playlist:
+    """ Sequential / shuffled play order over a list of tracks """
+
+    def __init__(self, tracks=(), shuffle=False, rng=None):
+        self.rng = rng or random.Random()
+        self.shuffle = shuffle
+        self.setTracks(tracks)
+
+    def setTracks(self, tracks, current=None):
+        """替换曲目列表，current 为新列表中应当保持为当前曲目的下标"""
+        self.tracks = list(tracks)
+        self.order = list(range(len(self.tracks)))
+        self.position = 0
+        if self.shuffle:
+            self._shuffleOrder(current)
+        elif current is not None and 0 <= current < len(self.tracks):
+            self.position = current
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def currentIndex(self):
+        """当前曲目在 tracks 中的下标，列表为空时为 -1"""
+        return self.order[self.position] if self.tracks else -1
+
+    def current(self):
+        return self.tracks[self.currentIndex()] if self.tracks else None
+
+    def setShuffle(self, shuffle):
+        if shuffle == self.shuffle:
+            return
+        current = self.currentIndex()
+        self.shuffle = shuffle
+        if shuffle:
+            self._shuffleOrder(current)
+        else:
+            self.order = list(range(len(self.tracks)))
+            self.position = max(current, 0)
+
+    def next(self):
+        """前进到下一首并返回它"""
+        if not self.tracks:
+            return None
+        self.position += 1
+        if self.position >= len(self.order):
+            if self.shuffle and len(self.tracks) > 1:
+                last = self.order[-1]
+                self._shuffleOrder()
+                if self.order[0] == last:
+                    self.order[0], self.order[-1] = self.order[-1], self.order[0]
+            self.position = 0
+        return self.current()
+
+    def _shuffleOrder(self, first=None):
+        self.rng.shuffle(self.order)
+        if first is not None and 0 <= first < len(self.order):
+            i = self.order.index(first)
+            self.order[0], self.order[i] = self.order[i], self.order[0]
+        self.position = 0
@@ -0,0 +1,192 @@
+"""
+对局录像
+
+一局游戏 = 打乱种子 + 起始排列 + 带时间戳的空白块移动流，足以确定性地重现整局。
+
+文件格式（小端）：
+    头部 24 字节：b"PZRP", 版本(u8), 尺寸(u8), 标志(u8), 子关卡(u8),
+                  打乱种子(u32), 开始时间(u64, Unix 毫秒), 步数(u32)
+    起始排列：尺寸*尺寸 字节
+    图片路径：长度(u16) + UTF-8
+    走子流：每步一个 LEB128 变长整数 (距上一步的毫秒数 << 2) | 方向，
+            正常操作节奏下每步 1~2 字节
+标志 bit0 = 已完成，bit1 = 使用了自动求解。
+
+读取时每 KEYFRAME_INTERVAL 步生成一个棋盘关键帧，跳转到任意一步只需从最近的关键帧
+重放不超过 KEYFRAME_INTERVAL 步。关键帧只存在于内存中，文件保持紧凑。
+"""
+
+import struct
+import time
+from bisect import bisect_right
+from datetime import datetime
+
+from app.common.file_utils import atomicWrite
+from app.common.setting import CONFIG_FOLDER
+from app.core.board import PuzzleBoard
+
+REPLAY_FOLDER = CONFIG_FOLDER / "replays"
+KEYFRAME_INTERVAL = 256
+
+FLAG_COMPLETED = 1
+FLAG_ASSISTED = 2
+
+_MAGIC = b"PZRP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBBBIQI")
+_PATH_LENGTH = struct.Struct("<H")
+
+
+def _writeVarint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+class ReplayRecorder:
+    """录制一局游戏，record 为 O(1) 且只追加几个字节"""
+
+    def __init__(self, size, tiles, seed=0, tier=0, image_path=""):
+        self.size = size
+        self.start_tiles = bytes(tiles)
+        self.seed = seed
+        self.tier = tier
+        self.image_path = image_path
+        self.flags = 0
+        self.count = 0
+        self.stream = bytearray()
+        self.started_at = int(time.time() * 1000)
+        self._last = time.perf_counter()
+
+    def record(self, direction, now=None):
+        """记录一步空白块移动，now 为 time.perf_counter() 的值"""
+        now = time.perf_counter() if now is None else now
+        delta = max(0, int((now - self._last) * 1000))
+        self._last = now
+        _writeVarint(self.stream, (delta << 2) | direction)
+        self.count += 1
+
+    def markCompleted(self):
+        self.flags |= FLAG_COMPLETED
+
+    def markAssisted(self):
+        self.flags |= FLAG_ASSISTED
+
+    def toBytes(self):
+        # 长度字段为 u16；按字符边界截断，不能切开多字节字符
+        path = self.image_path.encode("utf-8")[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+        return _HEADER.pack(_MAGIC, _VERSION, self.size, self.flags, self.tier, self.seed & 0xFFFFFFFF,
+                            self.started_at, self.count) \
+            + self.start_tiles + _PATH_LENGTH.pack(len(path)) + path + bytes(self.stream)
+
+    def fileName(self):
+        stamp = datetime.fromtimestamp(self.started_at / 1000).strftime("%Y%m%d-%H%M%S")
+        return f"{stamp}{self.started_at % 1000:03d}_{self.size}x{self.size}.pzr"
+
+
+class Replay:
+    """已加载的录像，支持按步或按时间定位"""
+
+    def __init__(self, size, start_tiles, directions, times, seed=0, tier=0, flags=0,
+                 started_at=0, image_path=""):
+        self.size = size
+        self.start_tiles = bytes(start_tiles)
+        self.directions = directions  # bytearray，每步一个方向
+        self.times = times            # 第 i 步发生时距开局的毫秒数
+        self.seed = seed
+        self.tier = tier
+        self.flags = flags
+        self.started_at = started_at
+        self.image_path = image_path
+        self.keyframes = self._buildKeyframes()
+
+    def __len__(self):
+        return len(self.directions)
+
+    @property
+    def duration(self):
+        return self.times[-1] if self.times else 0
+
+    @property
+    def completed(self):
+        return bool(self.flags & FLAG_COMPLETED)
+
+    @property
+    def assisted(self):
+        return bool(self.flags & FLAG_ASSISTED)
+
+    def _buildKeyframes(self):
+        board = PuzzleBoard(self.size, self.start_tiles)
+        keyframes = [bytes(board.tiles)]
+        for i, direction in enumerate(self.directions, 1):
+            if not board.moveBlank(direction):
+                raise ValueError(f"录像第 {i} 步非法")
+            if i % KEYFRAME_INTERVAL == 0:
+                keyframes.append(bytes(board.tiles))
+        return keyframes
+
+    def boardAt(self, index):
+        """执行完前 index 步后的棋盘"""
+        index = max(0, min(index, len(self.directions)))
+        base = index // KEYFRAME_INTERVAL
+        board = PuzzleBoard(self.size, self.keyframes[base])
+        board.applyMoves(self.directions[base * KEYFRAME_INTERVAL:index])
+        return board
+
+    def timeAt(self, index):
+        """执行完前 index 步时的录像时间（毫秒）"""
+        return self.times[index - 1] if index > 0 else 0
+
+    def indexAtTime(self, ms):
+        """录像时间 ms 时已经执行的步数"""
+        return bisect_right(self.times, ms)
+
+    @classmethod
+    def fromBytes(cls, data):
+        try:
+            magic, version, size, flags, tier, seed, started_at, count = _HEADER.unpack_from(data)
+            offset = _HEADER.size
+            start_tiles = data[offset:offset + size * size]
+            offset += size * size
+            (path_length,) = _PATH_LENGTH.unpack_from(data, offset)
+            offset += _PATH_LENGTH.size
+            image_path = bytes(data[offset:offset + path_length]).decode("utf-8")
+            offset += path_length
+        except (struct.error, UnicodeDecodeError):
+            raise ValueError("录像已损坏")
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("录像格式无效")
+
+        directions = bytearray(count)
+        times = [0] * count
+        elapsed = value = shift = 0
+        index = 0
+        for byte in memoryview(data)[offset:]:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            if index >= count:
+                raise ValueError("录像已损坏")
+            elapsed += value >> 2
+            directions[index] = value & 3
+            times[index] = elapsed
+            index += 1
+            value = shift = 0
+        if index != count or shift:
+            raise ValueError("录像已损坏")
+        return cls(size, start_tiles, directions, times, seed, tier, flags, started_at, image_path)
+
+
+def saveReplay(recorder, folder=REPLAY_FOLDER):
+    """写入录像文件（先写临时文件再重命名），返回路径"""
+    path = folder / recorder.fileName()
+    atomicWrite(path, recorder.toBytes())
+    return path
+
+
+def loadReplay(path):
+    """读取录像，格式不对时抛出 ValueError"""
+    with open(path, "rb") as f:
+        return Replay.fromBytes(f.read())
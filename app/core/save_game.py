@@ -0,0 +1,119 @@
+"""
+进行中对局的存档
+
+每个难度一个存档文件（AppData/saves/3x3.sav 等），保存当前排列、计时、图片标识和走子记录，
+启动时直接读回当前排列，不需要重放走子记录。
+
+文件格式（小端）：
+    头部 16 字节：b"PZSV", 版本(u8), 尺寸(u8), 保留(u16), 用时秒数(u32), 元数据长度(u32)
+    元数据：UTF-8 JSON（图片路径、修改时间、文件大小、关卡序号、子关卡序号）
+    当前排列：尺寸*尺寸 字节
+    走子记录：MoveHistory.toBytes() 的结果，直到文件末尾
+写入时先写临时文件再重命名，进程中途退出也不会留下半个存档。
+"""
+
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+
+from app.common.file_utils import atomicWrite
+from app.common.setting import CONFIG_FOLDER
+from app.core.board import PuzzleBoard
+
+SAVE_FOLDER = CONFIG_FOLDER / "saves"
+
+_MAGIC = b"PZSV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBHII")
+
+
+@dataclass
+class SaveGame:
+    size: int
+    tiles: bytes
+    elapsed: int = 0
+    image_path: str = ""
+    image_mtime_ns: int = 0
+    image_size: int = 0
+    level_index: int = -1
+    tier_index: int = 0
+    history: bytes = b""
+    extra: dict = field(default_factory=dict)
+
+    def imageMatches(self):
+        """存档中的图片是否仍然存在且未被修改"""
+        try:
+            stat = os.stat(self.image_path)
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.image_mtime_ns and stat.st_size == self.image_size
+
+
+def imageIdentity(path):
+    """图片标识：(修改时间, 文件大小)，文件不存在时为 (0, 0)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
+
+
+def saveFile(size, folder=SAVE_FOLDER):
+    return folder / f"{size}x{size}.sav"
+
+
+def encodeSave(save):
+    meta = json.dumps({
+        "image_path": save.image_path,
+        "image_mtime_ns": save.image_mtime_ns,
+        "image_size": save.image_size,
+        "level_index": save.level_index,
+        "tier_index": save.tier_index,
+        **save.extra,
+    }, ensure_ascii=False).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, _VERSION, save.size, 0, save.elapsed, len(meta))
+    return header + meta + bytes(save.tiles) + bytes(save.history)
+
+
+def decodeSave(data):
+    """解析存档，格式不对时抛出 ValueError"""
+    try:
+        magic, version, size, _, elapsed, meta_length = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("存档已损坏")
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("存档格式无效")
+    tiles_start = _HEADER.size + meta_length
+    history_start = tiles_start + size * size
+    if len(data) < history_start:
+        raise ValueError("存档已损坏")
+    meta = json.loads(data[_HEADER.size:tiles_start].decode("utf-8"))
+    tiles = bytes(data[tiles_start:history_start])
+    PuzzleBoard(size, tiles)  # 校验排列
+    known = ("image_path", "image_mtime_ns", "image_size", "level_index", "tier_index")
+    return SaveGame(size, tiles, elapsed,
+                    history=bytes(data[history_start:]),
+                    extra={key: value for key, value in meta.items() if key not in known},
+                    **{key: meta[key] for key in known if key in meta})
+
+
+def writeSave(path, data):
+    """原子写入已编码的存档"""
+    atomicWrite(path, data)
+
+
+def readSave(path):
+    """读取存档，不存在或损坏时返回 None"""
+    try:
+        with open(path, "rb") as f:
+            return decodeSave(f.read())
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+
+def deleteSave(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,272 @@
+"""
+拼图求解器：IDA* + 增量启发函数
+
+启发函数对象提供 reset(tiles) 计算初始值，以及 delta(tiles, piece, src, dst)
+在一步移动之后返回启发值的变化量，只重新计算受影响的拼图块/行列，
+因此每个节点的代价与棋盘大小无关（每行最多 5 块）。
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from app.core.board import PuzzleBoard, isSolvable, stepTable
+
+# 交互式求解的默认预算，避免 5x5 棋盘卡死界面
+DEFAULT_MAX_NODES = 2_000_000
+DEFAULT_TIME_LIMIT = 5.0
+
+# 每扩展这么多节点检查一次时间/取消/进度
+_CHECK_INTERVAL = 4096
+
+
+@dataclass
+class SolveResult:
+    """求解结果：moves 为空白块移动方向序列"""
+    solved: bool
+    moves: list = field(default_factory=list)
+    nodes: int = 0
+    elapsed: float = 0.0
+    bound: float = 0
+    reason: str = ""  # solved / unsolvable / node_limit / time_limit / cancelled
+
+    @property
+    def length(self):
+        return len(self.moves)
+
+
+class ManhattanHeuristic:
+    """曼哈顿距离"""
+
+    name = "manhattan"
+
+    def __init__(self, size):
+        self.size = size
+        total = size * size
+        blank_piece = total - 1
+        # dist[piece][pos]，空白块不计入
+        self.dist = [
+            [0 if piece == blank_piece else
+             abs(piece // size - pos // size) + abs(piece % size - pos % size)
+             for pos in range(total)]
+            for piece in range(total)
+        ]
+
+    def reset(self, tiles):
+        dist = self.dist
+        return sum(dist[piece][pos] for pos, piece in enumerate(tiles))
+
+    def delta(self, tiles, piece, src, dst):
+        row = self.dist[piece]
+        return row[dst] - row[src]
+
+
+_LINE_CONFLICT_CACHE = {}
+
+
+def _lineConflict(goals):
+    """一行（列）内目标位置序列的线性冲突代价：2 * (需要移出的块数)"""
+    value = _LINE_CONFLICT_CACHE.get(goals)
+    if value is None:
+        # 最长递增子序列，行内最多 5 块，直接 O(k^2)
+        best = [1] * len(goals)
+        for i in range(len(goals)):
+            for j in range(i):
+                if goals[j] < goals[i] and best[j] + 1 > best[i]:
+                    best[i] = best[j] + 1
+        value = 2 * (len(goals) - max(best, default=0))
+        _LINE_CONFLICT_CACHE[goals] = value
+    return value
+
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    """曼哈顿距离 + 线性冲突，按行列缓存冲突值并增量更新"""
+
+    name = "linear_conflict"
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.row_conflicts = [0] * size
+        self.col_conflicts = [0] * size
+
+    def _rowConflict(self, tiles, row):
+        size = self.size
+        start = row * size
+        goals = tuple(piece % size for piece in tiles[start:start + size]
+                      if piece // size == row and piece != size * size - 1)
+        return _lineConflict(goals)
+
+    def _colConflict(self, tiles, col):
+        size = self.size
+        goals = tuple(piece // size for piece in tiles[col::size]
+                      if piece % size == col and piece != size * size - 1)
+        return _lineConflict(goals)
+
+    def reset(self, tiles):
+        md = super().reset(tiles)
+        self.row_conflicts = [self._rowConflict(tiles, r) for r in range(self.size)]
+        self.col_conflicts = [self._colConflict(tiles, c) for c in range(self.size)]
+        return md + sum(self.row_conflicts) + sum(self.col_conflicts)
+
+    def delta(self, tiles, piece, src, dst):
+        row = self.dist[piece]
+        change = row[dst] - row[src]
+        size = self.size
+        src_row, src_col = divmod(src, size)
+        dst_row, dst_col = divmod(dst, size)
+        if src_row == dst_row:
+            # 横向移动：行内相对顺序不变，只影响两列
+            conflicts = self.col_conflicts
+            for col in (src_col, dst_col):
+                value = self._colConflict(tiles, col)
+                change += value - conflicts[col]
+                conflicts[col] = value
+        else:
+            conflicts = self.row_conflicts
+            for r in (src_row, dst_row):
+                value = self._rowConflict(tiles, r)
+                change += value - conflicts[r]
+                conflicts[r] = value
+        return change
+
+
+def defaultHeuristic(size):
+    """
+    4x4 及以上优先使用已生成的模式数据库；没有时 4x4 使用 Walking Distance，
+    其余尺寸使用曼哈顿距离 + 线性冲突
+    """
+    if size >= 4:
+        from app.core import pattern_db
+        if pattern_db.isAvailable(size):
+            return pattern_db.PatternDatabaseHeuristic(size, pattern_db.getPatternDatabase(size))
+        from app.core import walking_distance
+        if size in walking_distance.SUPPORTED_SIZES:
+            return walking_distance.WalkingDistanceHeuristic(size)
+    return LinearConflictHeuristic(size)
+
+
+class _Abort(Exception):
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def solve(tiles, size, heuristic=None, max_nodes=DEFAULT_MAX_NODES, time_limit=DEFAULT_TIME_LIMIT,
+          weight=1.0, progress=None, should_stop=None):
+    """
+    IDA* 求解，返回 SolveResult
+
+    weight > 1 时为加权 IDA*，不保证最优但快得多，可作为大棋盘的兜底。
+    progress(nodes, bound) 在每轮迭代开始和搜索过程中定期调用；
+    should_stop() 返回 True 时中止搜索。
+    max_nodes / time_limit 为 None 表示不限制。
+    """
+    start_time = time.perf_counter()
+    board = PuzzleBoard(size, tiles)
+    if not isSolvable(board.tiles, size):
+        return SolveResult(False, reason="unsolvable")
+
+    if heuristic is None:
+        heuristic = defaultHeuristic(size)
+    tiles = board.tiles
+    goal = bytes(range(size * size))
+    blank_piece = board.blank_piece
+    steps = stepTable(size)
+    delta = heuristic.delta
+    path = []
+    nodes = 0
+    check_at = _CHECK_INTERVAL
+    next_bound = 0
+
+    def checkBudget():
+        nonlocal check_at
+        check_at = nodes + _CHECK_INTERVAL
+        if max_nodes is not None and nodes >= max_nodes:
+            raise _Abort("node_limit")
+        if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+            raise _Abort("time_limit")
+        if should_stop is not None and should_stop():
+            raise _Abort("cancelled")
+        if progress is not None:
+            progress(nodes, bound)
+
+    def search(blank, g, h, prev):
+        nonlocal nodes, next_bound
+        f = g + weight * h
+        if f > bound:
+            if f < next_bound:
+                next_bound = f
+            return False
+        if h == 0 and tiles == goal:
+            return True
+        nodes += 1
+        if nodes >= check_at:
+            checkBudget()
+        for direction, target in enumerate(steps[blank]):
+            if target < 0 or direction ^ 1 == prev:
+                continue
+            piece = tiles[target]
+            tiles[blank] = piece
+            tiles[target] = blank_piece
+            path.append(direction)
+            if search(target, g + 1, h + delta(tiles, piece, target, blank), direction):
+                return True
+            path.pop()
+            tiles[target] = piece
+            tiles[blank] = blank_piece
+            delta(tiles, piece, blank, target)
+        return False
+
+    h0 = heuristic.reset(tiles)
+    bound = weight * h0
+    try:
+        while True:
+            if progress is not None:
+                progress(nodes, bound)
+            next_bound = float("inf")
+            if search(board.blank, 0, h0, -1):
+                return SolveResult(True, list(path), nodes, time.perf_counter() - start_time, bound, "solved")
+            bound = next_bound
+    except _Abort as e:
+        return SolveResult(False, [], nodes, time.perf_counter() - start_time, bound, e.reason)
+
+
+def solveAnytime(tiles, size, weights=(1.0, 2.0, 3.0), max_nodes=DEFAULT_MAX_NODES,
+                 time_limit=DEFAULT_TIME_LIMIT, heuristic=None, progress=None, should_stop=None):
+    """
+    依次尝试最优和加权 IDA*，共享同一份节点/时间预算
+
+    先求最优解，预算不够时退化为加权搜索，保证大棋盘也能在预算内给出一个解。
+    每次尝试分得剩余预算的 1/(剩余尝试次数)；返回的 nodes/elapsed 为累计值。
+    """
+    start_time = time.perf_counter()
+    if heuristic is None:
+        heuristic = defaultHeuristic(size)
+    nodes = 0
+    result = SolveResult(False, reason="node_limit")
+    for i, weight in enumerate(weights):
+        share = len(weights) - i
+        remaining_nodes = None if max_nodes is None else (max_nodes - nodes) // share
+        remaining_time = None if time_limit is None else \
+            (time_limit - (time.perf_counter() - start_time)) / share
+        if (remaining_nodes is not None and remaining_nodes <= 0) or \
+                (remaining_time is not None and remaining_time <= 0):
+            break
+        result = solve(tiles, size, heuristic=heuristic, max_nodes=remaining_nodes,
+                       time_limit=remaining_time, weight=weight,
+                       progress=progress, should_stop=should_stop)
+        nodes += result.nodes
+        if result.solved or result.reason in ("unsolvable", "cancelled"):
+            break
+    result.nodes = nodes
+    result.elapsed = time.perf_counter() - start_time
+    return result
+
+
+def movesToPositions(size, blank, moves):
+    """将空白块方向序列转换为依次点击的拼图块位置"""
+    steps = stepTable(size)
+    positions = []
+    for direction in moves:
+        blank = steps[blank][direction]
+        positions.append(blank)
+    return positions
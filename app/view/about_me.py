@@ -9,7 +9,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtGui import QFont, QDesktopServices
-import webbrowser
 
 class AboutMeInterface(QFrame):
     def __init__(self):
@@ -191,6 +190,7 @@ class AboutMeInterface(QFrame):
     def openGitHub(self):
         """打开GitHub页面"""
         try:
+            import webbrowser
             webbrowser.open("https://github.com/kahonanami")
         except:
             InfoBar.error(
@@ -206,6 +206,7 @@ class AboutMeInterface(QFrame):
     def openEmail(self):
         """打开邮箱"""
         try:
+            import webbrowser
             webbrowser.open("mailto:azusaq@qq.com")
         except:
             InfoBar.info(
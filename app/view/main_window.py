@@ -1,22 +1,50 @@
-from qfluentwidgets import MSFluentWindow, NavigationItemPosition, Theme, setTheme
+from qfluentwidgets import MSFluentWindow, NavigationItemPosition, setTheme
 from qfluentwidgets import FluentIcon as FIF
-import sys
-import os
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QTimer
-import json
-from app.view.setting import SettingInterface
-from .easy_puzzle import EasyPuzzleInterface
-from .normal_puzzle import NormalPuzzleInterface
-from .hard_puzzle import HardPuzzleInterface
-from .about_me import AboutMeInterface
+from PyQt5.QtCore import QTimer, QEvent
 from app.components.music_manager import MusicManager
-from app.components.base_puzzle import setTimerEnabled
+from app.common.timer_state import setTimerEnabled
+from app.components.lazy_interface import LazyInterface
+from app.components.tile_cache import tileCache
+from app.common.startup_trace import trace
+from app.common.config_store import configStore
+
+# 首帧之后在空闲时依次构建其余页面的间隔（毫秒）
+IDLE_BUILD_DELAY = 200
+
+# 页面模块在页面构建时才导入
+def createEasyPuzzle():
+    from .easy_puzzle import EasyPuzzleInterface
+    return EasyPuzzleInterface()
+
+
+def createNormalPuzzle():
+    from .normal_puzzle import NormalPuzzleInterface
+    return NormalPuzzleInterface()
+
+
+def createHardPuzzle():
+    from .hard_puzzle import HardPuzzleInterface
+    return HardPuzzleInterface()
+
+
+def createAboutMe():
+    from .about_me import AboutMeInterface
+    return AboutMeInterface()
+
+
+def createSetting():
+    from .setting import SettingInterface
+    return SettingInterface()
+
 
 class MainWindow(MSFluentWindow):
-    def __init__(self):
+    def __init__(self, eager=False):
+        """eager=True 时启动时就构建全部页面（用于对比启动耗时）"""
         super().__init__()
+        self.first_painted = False
+        self.music_pending = False  # 首帧绘制后再启动音乐
         
         # 加载游戏设置文件
         # self.game_config = load_game_config()
@@ -35,29 +63,88 @@ class MainWindow(MSFluentWindow):
         # 初始化音乐管理器
         self.music_manager = MusicManager(self)
         
-        self.easy_puzzle = EasyPuzzleInterface(self)
-        self.normal_puzzle = NormalPuzzleInterface(self)
-        self.hard_puzzle = HardPuzzleInterface(self)    
-        self.about_me = AboutMeInterface()
-        self.setting = SettingInterface()
+        # 子界面只创建占位控件，第一次显示或空闲时才真正构建
+        self.easy_puzzle = LazyInterface(createEasyPuzzle, "easy-puzzle-interface", self)
+        self.normal_puzzle = LazyInterface(createNormalPuzzle, "normal-puzzle-interface", self)
+        self.hard_puzzle = LazyInterface(createHardPuzzle, "hard-puzzle-interface", self)
+        self.about_me = LazyInterface(createAboutMe, "AboutMeInterface", self)
+        self.setting = LazyInterface(createSetting, "Setting", self)
+        self.puzzle_interfaces = (self.easy_puzzle, self.normal_puzzle, self.hard_puzzle)
+        self.lazy_interfaces = (*self.puzzle_interfaces, self.setting, self.about_me)
         self.addSubInterface(self.easy_puzzle, FIF.GAME, "简单模式")
         self.addSubInterface(self.normal_puzzle, FIF.PLAY, "普通模式")
         self.addSubInterface(self.hard_puzzle, FIF.FLAG, "困难模式")
         self.addSubInterface(self.about_me, FIF.INFO, "关于我", position = NavigationItemPosition.BOTTOM)
         self.addSubInterface(self.setting, FIF.SETTING, "设置", position = NavigationItemPosition.BOTTOM)
         
-        # 连接设置页面的音乐信号到音乐管理器
-        self.setting.settings_card.musicToggled.connect(self.music_manager.toggle_music)
-        # 连接设置页面的计时器信号
-        self.setting.settings_card.timerToggled.connect(self.toggle_timer)
-        # self.setting.settings_card.volumeChanged.connect(self.music_manager.set_volume) # SimpleMediaPlayBar自带音量调节
+        # 设置页面构建后再连接信号
+        self.setting.materialized.connect(self.on_setting_materialized)
 
         self.load_settings()
+
+        if eager:
+            for interface in self.lazy_interfaces:
+                interface.materialize()
         
         # 延迟定位音乐卡片，确保窗口完全初始化
         QTimer.singleShot(100, self.initial_position_music_card)
+        self.installEventFilter(self)
+        trace.mark("主窗口构建完成")
+
+    def eventFilter(self, obj, event):
+        """记录首帧绘制，之后开始在空闲时构建其余页面"""
+        if obj is self and event.type() == QEvent.Paint and not self.first_painted:
+            self.first_painted = True
+            trace.mark("首帧绘制")
+            if self.music_pending:
+                QTimer.singleShot(0, self.start_music)
+            QTimer.singleShot(IDLE_BUILD_DELAY, self.build_next_interface)
+        return super().eventFilter(obj, event)
+
+    def build_next_interface(self):
+        """空闲时每次只构建一个页面，避免长时间阻塞事件循环"""
+        for interface in self.lazy_interfaces:
+            if not interface.isMaterialized():
+                interface.materialize()
+                QTimer.singleShot(IDLE_BUILD_DELAY, self.build_next_interface)
+                return
+        trace.mark("全部页面构建完成")
+        trace.report()
+
+    def start_music(self):
+        """启动音乐；首帧绘制前只做标记，避免多媒体模块拖慢启动"""
+        if not self.first_painted:
+            self.music_pending = True
+            return
+        self.music_pending = False
+        if not self.music_manager.is_music_enabled():
+            self.music_manager.toggle_music(True)
+
+    def materialized_puzzles(self):
+        """已经构建的拼图界面"""
+        return [interface.widget() for interface in self.puzzle_interfaces if interface.isMaterialized()]
+
+    def on_setting_materialized(self, setting):
+        """设置页面构建完成：同步当前设置并连接信号"""
+        setting.settings_card.update_ui_from_config(
+            configStore.soundEnabled(), configStore.timerEnabled(), configStore.themeIndex())
+        # 连接设置页面的音乐信号到音乐管理器
+        setting.settings_card.musicToggled.connect(self.music_manager.toggle_music)
+        # 连接设置页面的计时器信号
+        setting.settings_card.timerToggled.connect(self.toggle_timer)
+        # setting.settings_card.volumeChanged.connect(self.music_manager.set_volume) # SimpleMediaPlayBar自带音量调节
     
     
+    def closeEvent(self, event):
+        """关闭窗口前停止后台求解并保存所有进行中的对局"""
+        for puzzle in self.materialized_puzzles():
+            puzzle.stopSolver()
+            puzzle.saveGame()
+        configStore.flush()
+        tileCache.flush()
+        self.music_manager.cleanup()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """窗口大小改变时重新定位音乐卡片"""
         super().resizeEvent(event)
@@ -70,46 +157,23 @@ class MainWindow(MSFluentWindow):
     def toggle_timer(self, enabled):
         """切换计时器启用状态"""
         setTimerEnabled(enabled)
-        # 更新所有拼图界面的计时器显示
-        self.easy_puzzle.updateTimerVisibility()
-        self.normal_puzzle.updateTimerVisibility()
-        self.hard_puzzle.updateTimerVisibility()
+        # 更新已构建的拼图界面的计时器显示，之后构建的界面会读取全局状态
+        for puzzle in self.materialized_puzzles():
+            puzzle.updateTimerVisibility()
 
     def load_settings(self):
-        """加载设置"""
-        json_file = "AppData/config.json"
-        if os.path.exists(json_file):
-            with open(json_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                # 获取配置
-                settings = config.get("setting", {})
-                sound = settings.get("sound", True)
-                timer = settings.get("timer", True)
-                theme = settings.get("theme", 0)
-                
-                # 更新设置界面UI（不触发信号，防止更新界面时出现bug）
-                self.setting.settings_card.update_ui_from_config(sound, timer, theme)
-
-                # 应用音乐设置
-                if sound:
-                    self.music_manager.toggle_music(True)
-                
-                # 应用计时器设置
-                setTimerEnabled(timer)
-                # 更新窗口
-                self.easy_puzzle.updateTimerVisibility()
-                self.normal_puzzle.updateTimerVisibility()
-                self.hard_puzzle.updateTimerVisibility()
-                
-                # 应用主题设置
-                themes = {0: Theme.LIGHT, 1: Theme.DARK, 2: Theme.AUTO}
-                setTheme(themes.get(theme, Theme.AUTO))
-        else:
-            # 这里走默认设置
-            self.setting.settings_card.update_ui_from_config(True, True, 0)
-            self.music_manager.toggle_music(True)
-            setTimerEnabled(True)
-            self.easy_puzzle.updateTimerVisibility()
-            self.normal_puzzle.updateTimerVisibility()
-            self.hard_puzzle.updateTimerVisibility()
-            setTheme(Theme.LIGHT)
\ No newline at end of file
+        """应用设置（配置文件只在启动时由 cfg 读取一次）"""
+        # 设置界面构建时再按此更新UI（不触发信号，防止更新界面时出现bug）
+        if self.setting.isMaterialized():
+            self.setting.widget().settings_card.update_ui_from_config(
+                configStore.soundEnabled(), configStore.timerEnabled(), configStore.themeIndex())
+
+        # 应用音乐设置
+        if configStore.soundEnabled():
+            self.start_music()
+
+        # 应用计时器设置
+        self.toggle_timer(configStore.timerEnabled())
+
+        # 应用主题设置
+        setTheme(configStore.theme())
@@ -1,10 +1,9 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QGroupBox, QCheckBox, QSlider
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QGroupBox, QCheckBox, QSlider, QFileDialog
 from PyQt5.QtCore import Qt, pyqtSignal
 from qfluentwidgets import GroupHeaderCardWidget, PushButton, ComboBox, SearchLineEdit, IconWidget, InfoBarIcon, BodyLabel, PrimaryPushButton, FluentIcon, SwitchButton, Slider, Theme, setTheme, Flyout, InfoBar, InfoBarPosition
 from qfluentwidgets import FluentIcon as FIF
-import json
-import os
-from pathlib import Path
+
+from app.common.config_store import configStore
 
 class SettingsCard(GroupHeaderCardWidget):
     '''游戏设置卡片'''
@@ -24,6 +23,7 @@ class SettingsCard(GroupHeaderCardWidget):
         # self.volumeSlider = Slider(Qt.Horizontal)   # 音量大小滑块
         self.timerSwitch = SwitchButton()           # 计时器
         self.themeComboBox = ComboBox()             # 主题选择
+        self.musicFolderButton = PushButton(FIF.FOLDER, "选择文件夹")   # 音乐文件夹
 
         # 底部工具栏
         self.hintIcon = IconWidget(InfoBarIcon.SUCCESS)
@@ -57,6 +57,8 @@ class SettingsCard(GroupHeaderCardWidget):
         # 添加游戏设置组件
         self.addGroup(FIF.RINGER.icon(), "游戏音乐", "开启或关闭游戏音乐", self.soundSwitch)
         # self.addGroup(FIF.VOLUME.icon(), "音量大小", "调节游戏音乐音量", self.volumeSlider)
+        self.musicFolderGroup = self.addGroup(FIF.MUSIC_FOLDER.icon(), "音乐文件夹", "", self.musicFolderButton)
+        self.update_music_folder_hint(configStore.musicFolder())
         self.addGroup(FIF.STOP_WATCH.icon(), "显示计时器", "在游戏中显示计时器", self.timerSwitch)
         group = self.addGroup(FIF.BRUSH.icon(), "界面主题", "选择游戏界面主题风格", self.themeComboBox)
         group.setSeparatorVisible(True)
@@ -71,6 +73,8 @@ class SettingsCard(GroupHeaderCardWidget):
         self.themeComboBox.currentIndexChanged.connect(self.change_theme)   #主题 -> change_theme
         self.saveButton.clicked.connect(self.save_settings)                 #保存设置 -> save_settings
         self.resetButton.clicked.connect(self.reset_settings)               #重置设置 -> reset_settings
+        self.musicFolderButton.clicked.connect(self.choose_music_folder)    #选择音乐文件夹 -> choose_music_folder
+        configStore.musicFolderChanged.connect(self.update_music_folder_hint)
         
         # 连接音乐信号到主窗口
         self.soundSwitch.checkedChanged.connect(self.musicToggled.emit)     # 发送音乐开关信号
@@ -90,6 +94,16 @@ class SettingsCard(GroupHeaderCardWidget):
         # 重新连接信号
         self.themeComboBox.currentIndexChanged.connect(self.change_theme)
 
+    def update_music_folder_hint(self, folder):
+        self.music_folder = folder  # 保存设置时写入配置
+        self.musicFolderGroup.setContent(folder or "未设置，播放自带的音乐")
+
+    def choose_music_folder(self):
+        """选择音乐文件夹（与其他设置一样，保存后生效并在后台扫描）"""
+        folder = QFileDialog.getExistingDirectory(self, "选择音乐文件夹", self.music_folder or configStore.musicFolder())
+        if folder:
+            self.update_music_folder_hint(folder)
+
     def change_theme(self, index):
         """更改主题"""
         themes = {0: Theme.LIGHT, 1: Theme.DARK, 2: Theme.AUTO}
@@ -107,59 +121,20 @@ class SettingsCard(GroupHeaderCardWidget):
         )
 
     def save_settings(self):
-        """保存设置"""
-        settings = {
-            "setting": {
-                "sound": self.soundSwitch.isChecked(),
-                "timer": self.timerSwitch.isChecked(),
-                "theme": self.themeComboBox.currentIndex()
-            }
-        }
-        try:
-            # 获取路径
-            current_file = Path(__file__).resolve()
-            project_root = current_file.parent.parent.parent
-            
-            appdata_dir = project_root / "AppData"
-            appdata_dir.mkdir(exist_ok=True)  # 如果目录不存在则创建
-
-            # 配置文件路径 -> /AppData/config.json
-            config_file = appdata_dir / "config.json"
-            
-            # 读取现有配置
-            existing_config = {}
-            if config_file.exists():
-                try:
-                    with open(config_file, "r", encoding='utf-8') as f:
-                        existing_config = json.load(f)
-                except (json.JSONDecodeError, FileNotFoundError):
-                    existing_config = {}
-            
-            # 更新配置中的 setting 部分
-            existing_config.update(settings)
-            
-            with open(config_file, "w", encoding='utf-8') as f:
-                # 写入json中
-                json.dump(existing_config, f, indent=4, ensure_ascii=False)
-                InfoBar.success(
-                    title='',
-                    content=f"设置已保存到 {config_file}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
-        except Exception as e:
-            InfoBar.error(
-                title='',
-                content=f"保存设置时出错: {e}",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+        """保存设置（只更新内存中的配置，由配置服务在后台写盘）"""
+        configStore.setSoundEnabled(self.soundSwitch.isChecked())
+        configStore.setTimerEnabled(self.timerSwitch.isChecked())
+        configStore.setThemeIndex(self.themeComboBox.currentIndex())
+        configStore.setMusicFolder(self.music_folder)
+        InfoBar.success(
+            title='',
+            content="设置已保存",
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=2000,
+            parent=self
+        )
 
     def reset_settings(self):
         """重置为默认设置"""
@@ -176,6 +151,9 @@ class SettingsCard(GroupHeaderCardWidget):
         
         # 应用浅色主题
         setTheme(Theme.LIGHT)
+
+        # 恢复自带的音乐（与其他设置一样，保存后生效）
+        self.update_music_folder_hint("")
         
         # print("设置已重置为默认值")
         InfoBar.success(
@@ -0,0 +1,144 @@
+"""
+棋盘控件性能对比：逐块 ClickableLabel 网格 vs 自绘 PuzzleBoardWidget
+
+用法（在项目根目录）：QT_QPA_PLATFORM=offscreen python benchmarks/bench_board_widget.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QSizePolicy, QLabel, QWidget, QGridLayout
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QPixmap, QColor, QPainter
+
+from app.core.board import PuzzleBoard
+from app.components.puzzle_board_widget import PuzzleBoardWidget
+
+BOARD_PIXELS = 600
+REPAINTS = 20
+CONSTRUCTS = 5
+
+
+class ClickableLabel(QLabel):
+    """可点击的标签，用于拼图块构造（旧版逐块控件实现，棋盘已改用 PuzzleBoardWidget）"""
+    clicked = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        self.index = -1
+        self.empty = False
+        self.setStyleSheet("""
+            ClickableLabel {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 8px;
+            }
+            ClickableLabel:hover {
+                background-color: rgba(0, 0, 0, 0.1);
+            }
+        """)
+
+    def mousePressEvent(self, event):
+        if not self.empty:
+            self.clicked.emit(self.index)
+
+
+class PuzzleGridWidget(QWidget):
+    """拼图网格容器（旧版）"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.layout = QGridLayout(self)
+        self.layout.setSpacing(2)
+        self.setLayout(self.layout)
+
+
+def makePieces(grid_size, piece_size):
+    pieces = []
+    for i in range(grid_size * grid_size):
+        pixmap = QPixmap(piece_size, piece_size)
+        pixmap.fill(QColor.fromHsv(i * 360 // (grid_size * grid_size), 160, 220))
+        pieces.append(pixmap)
+    return pieces
+
+
+def makeAtlas(pieces, grid_size, piece_size):
+    atlas = QPixmap(piece_size * grid_size, piece_size * grid_size)
+    painter = QPainter(atlas)
+    for i, piece in enumerate(pieces):
+        painter.drawPixmap((i % grid_size) * piece_size, (i // grid_size) * piece_size, piece)
+    painter.end()
+    return atlas
+
+
+def buildLabelGrid(grid_size, piece_size, pieces):
+    """与改造前 BasePuzzleInterface.initUI 相同的构造方式"""
+    grid = PuzzleGridWidget()
+    labels = []
+    for i in range(grid_size * grid_size):
+        label = ClickableLabel(grid)
+        label.setFixedSize(piece_size, piece_size)
+        label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        label.index = i
+        labels.append(label)
+        grid.layout.addWidget(label, i // grid_size, i % grid_size)
+    side = piece_size * grid_size + 2 * (grid_size - 1)
+    grid.setFixedSize(side, side)
+    for i, label in enumerate(labels[:-1]):
+        label.setPixmap(pieces[i])
+    return grid
+
+
+def buildBoardWidget(grid_size, piece_size, pieces):
+    widget = PuzzleBoardWidget(grid_size, piece_size)
+    widget.setBoard(PuzzleBoard(grid_size))
+    widget.setAtlas(makeAtlas(pieces, grid_size, piece_size))
+    return widget
+
+
+def measure(builder, grid_size):
+    """构造和整板重绘都取多次中最快的一次，减少噪声"""
+    piece_size = BOARD_PIXELS // grid_size
+    pieces = makePieces(grid_size, piece_size)
+    construct = float("inf")
+    for _ in range(CONSTRUCTS):
+        start = time.perf_counter()
+        widget = builder(grid_size, piece_size, pieces)
+        construct = min(construct, time.perf_counter() - start)
+        widget.deleteLater()
+    widget = builder(grid_size, piece_size, pieces)
+    widget.grab()  # 预热
+    repaint = float("inf")
+    for _ in range(REPAINTS):
+        start = time.perf_counter()
+        widget.grab()
+        repaint = min(repaint, time.perf_counter() - start)
+    widget_count = 1 + len(widget.findChildren(ClickableLabel))
+    widget.deleteLater()
+    return construct, repaint, widget_count
+
+
+def run(sizes=(3, 4, 5, 10)):
+    results = []
+    for grid_size in sizes:
+        for name, builder in (("labels", buildLabelGrid), ("painted", buildBoardWidget)):
+            construct, repaint, count = measure(builder, grid_size)
+            results.append({
+                "grid_size": grid_size,
+                "widget": name,
+                "widgets": count,
+                "construct_ms": round(construct * 1000, 3),
+                "repaint_ms": round(repaint * 1000, 3),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    print(f"{'网格':>6} {'实现':>8} {'控件数':>6} {'构造(ms)':>10} {'整板重绘(ms)':>12}")
+    for row in run():
+        print(f"{row['grid_size']:>4}x{row['grid_size']:<1} {row['widget']:>8} {row['widgets']:>6} "
+              f"{row['construct_ms']:>10.2f} {row['repaint_ms']:>12.2f}")
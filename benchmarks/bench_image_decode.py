@@ -0,0 +1,66 @@
+"""
+内置图片的加载耗时：QPixmap 全图解码 + 裁剪 + 缩放（旧 loadImage）vs QImageReader 裁剪缩放解码
+
+用法（在项目根目录）：QT_QPA_PLATFORM=offscreen python benchmarks/bench_image_decode.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+
+from app.components.image_loader import decodeSquareImage
+
+IMAGE_FOLDER = Path(ROOT) / "app" / "resource" / "images"
+BOARD_PIXELS = 600
+ROUNDS = 3
+
+
+def loadFullPixmap(path, target_size):
+    """改造前的方式：GUI 线程中解码整张图片再裁剪缩放"""
+    pixmap = QPixmap(path)
+    size = min(pixmap.width(), pixmap.height())
+    pixmap = pixmap.copy((pixmap.width() - size) // 2, (pixmap.height() - size) // 2, size, size)
+    return pixmap.scaled(target_size, target_size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def loadScaledImage(path, target_size):
+    return QPixmap.fromImage(decodeSquareImage(path, target_size))
+
+
+def timeIt(func, path):
+    """预热一次后取 ROUNDS 次中最快的一次"""
+    func(path, BOARD_PIXELS)
+    elapsed = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func(path, BOARD_PIXELS)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def run(folder=IMAGE_FOLDER):
+    results = []
+    for path in sorted(folder.glob("*.jpg")):
+        results.append({
+            "image": path.name,
+            "file_bytes": path.stat().st_size,
+            "full_decode_ms": round(timeIt(loadFullPixmap, str(path)) * 1000, 3),
+            "scaled_decode_ms": round(timeIt(loadScaledImage, str(path)) * 1000, 3),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    print(f"{'图片':>12} {'大小(KiB)':>10} {'全图解码(ms)':>14} {'缩放解码(ms)':>14}")
+    for row in run():
+        print(f"{row['image']:>12} {row['file_bytes'] / 1024:>10.0f} "
+              f"{row['full_decode_ms']:>14.2f} {row['scaled_decode_ms']:>14.2f}")
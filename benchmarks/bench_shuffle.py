@@ -0,0 +1,57 @@
+"""
+打乱方式对比：1000 步随机游走（旧 shufflePuzzle）vs 均匀采样 + 奇偶修正
+
+报告每秒生成的棋盘数以及曼哈顿距离的分布（均值、标准差、最小、最大）。
+用法（在项目根目录）：python benchmarks/bench_shuffle.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.board import PuzzleBoard
+from app.core.generator import randomSolvable
+from app.core.solver import ManhattanHeuristic
+
+SAMPLES = 2000
+
+
+def legacyWalk(size, rng):
+    """改造前 shufflePuzzle 的做法：1000 步随机移动空白块"""
+    board = PuzzleBoard(size)
+    for _ in range(1000):
+        board.move(rng.choice(board.legalMoves()))
+    return board.tiles
+
+
+def run(sizes=(3, 4, 5), samples=SAMPLES, seed=0):
+    results = []
+    for size in sizes:
+        manhattan = ManhattanHeuristic(size)
+        for name, generate in (("walk_1000", legacyWalk), ("uniform", randomSolvable)):
+            rng = random.Random(seed)
+            start = time.perf_counter()
+            boards = [generate(size, rng) for _ in range(samples)]
+            elapsed = time.perf_counter() - start
+            distances = [manhattan.reset(tiles) for tiles in boards]
+            results.append({
+                "grid_size": size,
+                "method": name,
+                "boards_per_second": round(samples / elapsed),
+                "manhattan_mean": round(statistics.mean(distances), 2),
+                "manhattan_stdev": round(statistics.stdev(distances), 2),
+                "manhattan_min": min(distances),
+                "manhattan_max": max(distances),
+            })
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'网格':>5} {'方式':>10} {'棋盘/秒':>10} {'曼哈顿均值':>10} {'标准差':>8} {'最小':>5} {'最大':>5}")
+    for row in run():
+        print(f"{row['grid_size']:>3}x{row['grid_size']} {row['method']:>10} {row['boards_per_second']:>10,} "
+              f"{row['manhattan_mean']:>10} {row['manhattan_stdev']:>8} {row['manhattan_min']:>5} "
+              f"{row['manhattan_max']:>5}")
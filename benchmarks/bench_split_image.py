@@ -0,0 +1,85 @@
+"""
+切图性能对比：逐块 copy + scaled（旧 splitImage）vs 整板缩放一次的贴图
+
+默认使用一张生成的 3840x2160（4K）图片，在 5x5 棋盘上比较耗时和常驻像素内存。
+用法（在项目根目录）：QT_QPA_PLATFORM=offscreen python benchmarks/bench_split_image.py [图片路径]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap, QPainter, QLinearGradient, QColor
+
+BOARD_PIXELS = 600
+ROUNDS = 5
+
+
+def make4kImage():
+    pixmap = QPixmap(3840, 2160)
+    painter = QPainter(pixmap)
+    gradient = QLinearGradient(0, 0, 3840, 2160)
+    gradient.setColorAt(0, QColor(30, 120, 200))
+    gradient.setColorAt(1, QColor(240, 180, 60))
+    painter.fillRect(pixmap.rect(), gradient)
+    painter.end()
+    return pixmap
+
+
+def cropSquare(pixmap):
+    size = min(pixmap.width(), pixmap.height())
+    return pixmap.copy((pixmap.width() - size) // 2, (pixmap.height() - size) // 2, size, size)
+
+
+def splitPerPiece(image, grid_size, piece_size):
+    """改造前的 splitImage：每块单独复制再缩放"""
+    pieces = []
+    piece_image_size = image.width() // grid_size
+    for i in range(grid_size * grid_size):
+        row, col = divmod(i, grid_size)
+        piece = image.copy(col * piece_image_size, row * piece_image_size, piece_image_size, piece_image_size)
+        pieces.append(piece.scaled(piece_size, piece_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    return pieces
+
+
+def splitAtlas(image, grid_size, piece_size):
+    """当前的 splitImage：整板缩放一次"""
+    board_pixels = piece_size * grid_size
+    return [image.scaled(board_pixels, board_pixels, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)]
+
+
+def pixmapBytes(pixmaps):
+    return sum(p.width() * p.height() * p.depth() // 8 for p in pixmaps)
+
+
+def run(image=None, grid_size=5):
+    image = cropSquare(image if image is not None else make4kImage())
+    piece_size = BOARD_PIXELS // grid_size
+    results = []
+    for name, split in (("per_piece", splitPerPiece), ("atlas", splitAtlas)):
+        split(image, grid_size, piece_size)  # 预热
+        elapsed = float("inf")
+        for _ in range(ROUNDS):  # 取最快一次，减少噪声
+            start = time.perf_counter()
+            pixmaps = split(image, grid_size, piece_size)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        results.append({
+            "method": name,
+            "grid_size": grid_size,
+            "pixmaps": len(pixmaps),
+            "split_ms": round(elapsed * 1000, 3),
+            "pixmap_bytes": pixmapBytes(pixmaps),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    source = QPixmap(sys.argv[1]) if len(sys.argv) > 1 else None
+    for row in run(source):
+        print(f"{row['method']:>10}: {row['pixmaps']:>3} 张 pixmap, 切图 {row['split_ms']:.2f} ms, "
+              f"常驻 {row['pixmap_bytes'] / 1024:.0f} KiB")
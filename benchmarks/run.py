@@ -0,0 +1,211 @@
+"""
+拼图热点路径的基准测试套件
+
+覆盖打乱生成、移动、完成检查、固定种子集上的求解器，以及（PyQt5 可用时）切图、内置图片加载和
+3x3/4x4/5x5 棋盘控件构造。结果以 JSON 输出，并与保存的基线比较。
+耗时指标都取多次运行中最快的一次，但仍受机器负载影响，比基线慢出阈值时只在报告中标出；
+只有确定性的指标（求解器扩展节点数）比基线差时才返回非零退出码。
+
+用法（在项目根目录）：
+    python benchmarks/run.py                       # 运行并与 benchmarks/baseline.json 比较
+    python benchmarks/run.py --output result.json  # 同时保存结果
+    python benchmarks/run.py --update-baseline     # 以本次结果作为新基线
+    python benchmarks/run.py --threshold 0.3       # 耗时慢出 30% 以上才标出
+所有指标都是越小越好。
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from app.core.board import PuzzleBoard
+from app.core.generator import randomSolvable, randomWalk
+from app.core.solver import LinearConflictHeuristic, solve
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.2
+REPEATS = 3
+# 与机器负载无关的指标单位，只有这些指标的退化会使运行失败
+DETERMINISTIC_UNITS = {"nodes"}
+
+
+def best(func, repeats=REPEATS):
+    """多次运行取最快一次，减少噪声"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchCore(results):
+    # 打乱生成
+    for size in (3, 4, 5):
+        rng = random.Random(0)
+        count = 2000
+        elapsed = best(lambda: [randomSolvable(size, rng) for _ in range(count)])
+        results[f"shuffle.uniform.{size}x{size}"] = {"value": elapsed / count * 1e6, "unit": "us/board"}
+
+    # 移动与完成检查
+    rng = random.Random(0)
+    directions = [rng.randrange(4) for _ in range(200_000)]
+    board = PuzzleBoard(5)
+
+    def applyMoves():
+        move = board.moveBlank
+        for direction in directions:
+            move(direction)
+
+    results["board.move.5x5"] = {"value": best(applyMoves) / len(directions) * 1e9, "unit": "ns/move"}
+
+    # 整排滑动：在空白块所在行/列中来回滑到两端
+    corners = (4, 24, 20, 0) * 25_000
+
+    def slideRuns():
+        slide = board.slideTo
+        board.reset()
+        for pos in corners:
+            slide(pos)
+
+    results["board.slide.5x5"] = {"value": best(slideRuns) / (len(corners) * 4) * 1e9, "unit": "ns/tile"}
+
+    def checkSolved():
+        solved = board.isSolved
+        for _ in range(200_000):
+            solved()
+
+    results["board.is_solved.5x5"] = {"value": best(checkSolved) / 200_000 * 1e9, "unit": "ns/check"}
+
+    # 固定种子集上的求解器：节点数用于发现启发函数/剪枝的退化，耗时用于发现常数开销的退化
+    solver_sets = {
+        "3x3": (3, [randomSolvable(3, random.Random(seed)) for seed in range(20)]),
+        "4x4": (4, [randomWalk(4, 60, random.Random(seed)) for seed in range(5)]),
+    }
+    for name, (size, boards) in solver_sets.items():
+        def solveAll():
+            return sum(solve(tiles, size, heuristic=LinearConflictHeuristic(size), max_nodes=None,
+                             time_limit=None).nodes for tiles in boards)
+
+        nodes = solveAll()
+        elapsed = best(solveAll)
+        results[f"solver.{name}.seconds"] = {"value": elapsed, "unit": "s"}
+        results[f"solver.{name}.nodes"] = {"value": nodes, "unit": "nodes"}
+
+
+def benchQt(results):
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        return False
+    import bench_board_widget
+    import bench_image_decode
+    import bench_split_image
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    for row in bench_split_image.run():
+        if row["method"] == "atlas":
+            results["image.split.4k.5x5"] = {"value": row["split_ms"], "unit": "ms"}
+
+    for row in bench_image_decode.run():
+        results[f"image.load.{row['image']}"] = {"value": row["scaled_decode_ms"], "unit": "ms"}
+
+    for row in bench_board_widget.run(sizes=(3, 4, 5)):
+        if row["widget"] == "painted":
+            size = row["grid_size"]
+            results[f"widget.construct.{size}x{size}"] = {"value": row["construct_ms"], "unit": "ms"}
+            results[f"widget.repaint.{size}x{size}"] = {"value": row["repaint_ms"], "unit": "ms"}
+    return True
+
+
+def compare(results, baseline, threshold):
+    """
+    返回 (报告行, 是否有退化)
+
+    确定性指标比基线大即为退化；耗时指标比基线慢出 threshold 时标为“变慢”，不算退化。
+    """
+    lines = []
+    regressed = False
+    for name, entry in sorted(results.items()):
+        value = entry["value"]
+        base = baseline.get(name, {}).get("value")
+        if base is None:
+            lines.append(f"  {name:<32} {value:>14.3f} {entry['unit']:<9} (无基线)")
+            continue
+        change = (value - base) / base if base else 0.0
+        status = "OK"
+        if entry["unit"] in DETERMINISTIC_UNITS:
+            if value > base:
+                status = "退化"
+                regressed = True
+        elif change > threshold:
+            status = "变慢"
+        lines.append(f"  {name:<32} {value:>14.3f} {entry['unit']:<9} 基线 {base:>12.3f} "
+                     f"{change:>+8.1%}  {status}")
+    return lines, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="拼图热点路径基准测试")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="基线文件")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="耗时指标比基线慢出该比例时在报告中标出（不影响退出码）")
+    parser.add_argument("--output", help="把结果 JSON 写入文件")
+    parser.add_argument("--update-baseline", action="store_true", help="以本次结果覆盖基线")
+    parser.add_argument("--skip-qt", action="store_true", help="跳过依赖 PyQt5 的测试")
+    args = parser.parse_args(argv)
+
+    results = {}
+    benchCore(results)
+    qt_ran = False if args.skip_qt else benchQt(results)
+    for entry in results.values():
+        entry["value"] = round(entry["value"], 3)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": qt_ran,
+        },
+        "benchmarks": results,
+    }
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("benchmarks", {})
+    lines, regressed = compare(results, baseline, args.threshold)
+
+    if args.update_baseline:
+        # 基线只保存环境和指标，不保存本次比较的结论；缺少界面指标的结果不能作为基线
+        if not qt_ran:
+            print("未运行依赖 PyQt5 的测试，不更新基线", file=sys.stderr)
+            return 1
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"基线已更新: {args.baseline}", file=sys.stderr)
+        return 0
+
+    report["regressed"] = regressed
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    print("\n".join(lines), file=sys.stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if regressed:
+        print("求解器扩展节点数比基线多", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,48 @@
-from app.view.main_window import MainWindow
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from qfluentwidgets import Theme
-from app.common.config import cfg
+# 最先导入，作为启动耗时的起点
+from app.common.startup_trace import trace
 import sys, os
+import multiprocessing
 
-# 设置应用主题
-# cfg.set(cfg.themeMode, Theme.LIGHT)
+# Qt 和界面模块只在 main() 中导入：求解器子进程（spawn）会重新导入本模块，不需要这些
 
-# 设置高DPI缩放
-if cfg.get(cfg.dpiScale) != "Auto":
-    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
-    os.environ["QT_SCALE_FACTOR"] = str(cfg.get(cfg.dpiScale))
-else:
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
 
-if __name__ == "__main__":
+def setupHighDpi(cfg):
+    """设置高DPI缩放"""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    if cfg.get(cfg.dpiScale) != "Auto":
+        os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
+        os.environ["QT_SCALE_FACTOR"] = str(cfg.get(cfg.dpiScale))
+    else:
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+
+
+def main():
+    from PyQt5.QtWidgets import QApplication
+    from app.common.config import cfg
+    from app.view.main_window import MainWindow
+    trace.mark("模块导入完成")
+
+    # 设置应用主题
+    # cfg.set(cfg.themeMode, Theme.LIGHT)
+    setupHighDpi(cfg)
+
     app = QApplication(sys.argv)
-    window = MainWindow()
+    trace.mark("QApplication 创建完成")
+    # --eager-interfaces：启动时构建全部页面，与默认的延迟构建对比启动耗时（配合 --trace-startup）
+    window = MainWindow(eager="--eager-interfaces" in sys.argv)
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    trace.mark("window.show()")
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    # 求解器在子进程中运行，打包成 exe 后需要
+    multiprocessing.freeze_support()
+    # --import-report：列出启动路径上最慢的导入，不启动界面
+    if "--import-report" in sys.argv:
+        from app.common.import_report import main as importReport
+        sys.exit(importReport(sys.argv[sys.argv.index("--import-report") + 1:]))
+    sys.exit(main())
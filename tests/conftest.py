@@ -0,0 +1,24 @@
+from collections import deque
+
+import pytest
+
+from app.core.board import PuzzleBoard
+
+
+@pytest.fixture(scope="session")
+def distances3x3():
+    """3x3 所有可解状态到完成状态的最少步数（从完成状态 BFS）"""
+    goal = PuzzleBoard(3)
+    distances = {bytes(goal.tiles): 0}
+    queue = deque([goal])
+    while queue:
+        board = queue.popleft()
+        depth = distances[bytes(board.tiles)] + 1
+        for pos in board.legalMoves():
+            child = board.copy()
+            child.move(pos)
+            key = bytes(child.tiles)
+            if key not in distances:
+                distances[key] = depth
+                queue.append(child)
+    return distances
@@ -0,0 +1,128 @@
+import itertools
+import random
+
+import pytest
+
+from app.core.board import DOWN, LEFT, RIGHT, UP, PuzzleBoard, isSolvable
+
+
+def countMisplaced(tiles):
+    return sum(1 for pos, piece in enumerate(tiles) if pos != piece)
+
+
+def inversionsSolvable(tiles, size):
+    """按教科书定义（逆序数 + 空白块所在行）判断可解性，用来对照 isSolvable"""
+    blank_piece = size * size - 1
+    pieces = [p for p in tiles if p != blank_piece]
+    inversions = sum(1 for a, b in itertools.combinations(pieces, 2) if a > b)
+    if size % 2 == 1:
+        return inversions % 2 == 0
+    blank_row_from_bottom = size - list(tiles).index(blank_piece) // size
+    return (inversions + blank_row_from_bottom) % 2 == 1
+
+
+def test_move_only_accepts_neighbors_of_blank():
+    board = PuzzleBoard(3)
+    assert board.blank == 8
+    assert not board.move(0)
+    assert board.tiles == bytearray(range(9))
+    assert board.move(5)
+    assert board.blank == 5
+    assert board.tiles[8] == 5
+    assert board.misplaced == 2
+
+
+def test_move_blank_stops_at_edges():
+    board = PuzzleBoard(4)
+    assert not board.moveBlank(DOWN)
+    assert not board.moveBlank(RIGHT)
+    assert board.moveBlank(UP)
+    assert board.moveBlank(LEFT)
+    assert board.blank == 10
+
+
+@pytest.mark.parametrize("size", [3, 4, 5])
+def test_incremental_misplaced_matches_recount(size):
+    rng = random.Random(size)
+    board = PuzzleBoard(size)
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            board.moveBlank(rng.randrange(4))
+        else:
+            board.move(rng.randrange(board.total))
+        assert board.misplaced == countMisplaced(board.tiles)
+        assert board.isSolved() == (board.tiles == bytearray(range(board.total)))
+
+
+def test_reset_rejects_invalid_permutation():
+    with pytest.raises(ValueError):
+        PuzzleBoard(3, [0, 1, 2, 3, 4, 5, 6, 7, 7])
+    with pytest.raises(ValueError):
+        PuzzleBoard(3, range(8))
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5])
+def test_is_solvable_matches_inversion_count(size):
+    rng = random.Random(size)
+    tiles = list(range(size * size))
+    for _ in range(500):
+        rng.shuffle(tiles)
+        assert isSolvable(tiles, size) == inversionsSolvable(tiles, size)
+
+
+@pytest.mark.parametrize("size", [2, 4])
+def test_is_solvable_even_sizes_swap_and_blank_row(size):
+    total = size * size
+    assert isSolvable(range(total), size)
+    # 交换两个拼图块翻转奇偶性
+    swapped = list(range(total))
+    swapped[0], swapped[1] = swapped[1], swapped[0]
+    assert not isSolvable(swapped, size)
+    # 空白块上移一行：偶数尺寸下可解性只取决于逆序数与空白块行号之和的奇偶
+    board = PuzzleBoard(size)
+    board.moveBlank(UP)
+    assert isSolvable(board.tiles, size)
+    first, second = [pos for pos in range(total) if pos != board.blank][:2]
+    board.tiles[first], board.tiles[second] = board.tiles[second], board.tiles[first]
+    assert not isSolvable(board.tiles, size)
+
+
+def test_random_walks_stay_solvable():
+    rng = random.Random(0)
+    for size in (2, 3, 4, 5):
+        board = PuzzleBoard(size)
+        for _ in range(300):
+            board.moveBlank(rng.randrange(4))
+        assert isSolvable(board.tiles, size)
+
+
+def test_slide_to_moves_whole_row_and_column():
+    board = PuzzleBoard(4)
+    assert board.slideTo(12) == [LEFT] * 3
+    assert board.blank == 12
+    assert list(board.tiles[12:16]) == [15, 12, 13, 14]
+    assert board.slideTo(0) == [UP] * 3
+    assert board.blank == 0
+    assert board.misplaced == countMisplaced(board.tiles)
+
+
+def test_slide_to_ignores_unaligned_and_blank_positions():
+    board = PuzzleBoard(4)
+    board.moveBlank(UP)
+    before = bytes(board.tiles)
+    assert board.slideTo(0) == []
+    assert board.slideTo(board.blank) == []
+    assert bytes(board.tiles) == before
+
+
+@pytest.mark.parametrize("size", [3, 4, 5])
+def test_slide_to_matches_single_moves(size):
+    rng = random.Random(size)
+    board = PuzzleBoard(size)
+    reference = PuzzleBoard(size)
+    for _ in range(500):
+        directions = board.slideTo(rng.randrange(board.total))
+        reference.applyMoves(directions)
+        assert board.tiles == reference.tiles
+        assert board.blank == reference.blank
+        assert board.misplaced == reference.misplaced == countMisplaced(board.tiles)
@@ -0,0 +1,38 @@
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+from app.core.board import isSolvable
+from app.core.generator import randomSolvable, randomWalk
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5])
+def test_random_solvable_is_solvable_and_not_solved(size):
+    rng = random.Random(size)
+    identity = bytearray(range(size * size))
+    for _ in range(300):
+        tiles = randomSolvable(size, rng)
+        assert sorted(tiles) == list(identity)
+        assert tiles != identity
+        assert isSolvable(tiles, size)
+
+
+def test_random_solvable_is_uniform_on_2x2():
+    # 2x2 有 12 个可解状态，去掉完成状态后每个状态应当等概率出现
+    states = [bytes(p) for p in itertools.permutations(range(4)) if isSolvable(p, 2)]
+    states.remove(bytes(range(4)))
+    rng = random.Random(0)
+    samples = 11_000
+    counts = Counter(bytes(randomSolvable(2, rng)) for _ in range(samples))
+    assert set(counts) == set(states)
+    expected = samples / len(states)
+    # 标准差约为 30，留出 5 倍余量
+    assert all(abs(count - expected) < 150 for count in counts.values())
+
+
+def test_random_walk_is_solvable():
+    rng = random.Random(1)
+    for size in (3, 4, 5):
+        assert isSolvable(randomWalk(size, 100, rng), size)
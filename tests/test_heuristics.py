@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from app.core import pattern_db
+from app.core.board import PuzzleBoard
+from app.core.heuristics import CombinedHeuristic, isValidSpec, makeHeuristic
+from app.core.solver import LinearConflictHeuristic, ManhattanHeuristic, solve
+from app.core.walking_distance import WalkingDistanceHeuristic, buildTable
+
+
+@pytest.fixture(scope="module")
+def walkingDistance3x3():
+    return WalkingDistanceHeuristic(3, buildTable(3))
+
+
+def heuristics3x3(walking_distance):
+    return [
+        ManhattanHeuristic(3),
+        LinearConflictHeuristic(3),
+        walking_distance,
+        CombinedHeuristic([LinearConflictHeuristic(3), walking_distance]),
+    ]
+
+
+def test_heuristics_are_admissible(distances3x3, walkingDistance3x3):
+    # 组合取最大值，各部分可采纳即可
+    for heuristic in (LinearConflictHeuristic(3), walkingDistance3x3):
+        for key, distance in distances3x3.items():
+            assert heuristic.reset(key) <= distance, heuristic.name
+
+
+def test_incremental_delta_matches_reset(walkingDistance3x3):
+    rng = random.Random(0)
+    for heuristic in heuristics3x3(walkingDistance3x3):
+        board = PuzzleBoard(3)
+        value = heuristic.reset(board.tiles)
+        for _ in range(300):
+            dst = board.blank
+            if board.moveBlank(rng.randrange(4)):
+                value += heuristic.delta(board.tiles, board.tiles[dst], board.blank, dst)
+        assert value == heuristic.reset(board.tiles), heuristic.name
+
+
+def test_solver_is_optimal_on_3x3(distances3x3, walkingDistance3x3):
+    rng = random.Random(0)
+    boards = rng.sample(sorted(distances3x3), 20)
+    for heuristic in heuristics3x3(walkingDistance3x3):
+        for tiles in boards:
+            result = solve(tiles, 3, heuristic=heuristic, max_nodes=None, time_limit=None)
+            assert result.solved
+            assert result.length == distances3x3[tiles]
+            board = PuzzleBoard(3, tiles)
+            board.applyMoves(result.moves)
+            assert board.isSolved()
+
+
+def test_solver_reports_unsolvable():
+    result = solve([1, 0, 2, 3, 4, 5, 6, 7, 8], 3, heuristic=ManhattanHeuristic(3))
+    assert not result.solved
+    assert result.reason == "unsolvable"
+
+
+def test_spec_validation():
+    assert isValidSpec("manhattan", 3)
+    assert isValidSpec("max:manhattan, linear_conflict", 5)
+    assert not isValidSpec("walking_distance", 5)
+    assert not isValidSpec("pdb", 3)
+    assert not isValidSpec("max:", 3)
+    assert not isValidSpec("avg:manhattan", 3)
+    assert not isValidSpec("unknown")
+    assert not isValidSpec(None)
+    assert makeHeuristic("max:manhattan,linear_conflict", 3).name == "max:manhattan,linear_conflict"
+
+
+def test_pdb_without_tables_is_rejected(monkeypatch, tmp_path):
+    monkeypatch.setattr(pattern_db, "PDB_FOLDER", tmp_path)
+    monkeypatch.setattr(pattern_db, "_loaded", {})
+    assert not isValidSpec("pdb", 4)
+    assert not isValidSpec("max:manhattan,pdb", 4)
+    with pytest.raises(ValueError, match="pattern_db --size 4"):
+        makeHeuristic("pdb", 4)
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from app.core.board import PuzzleBoard
+from app.core.history import MIN_MAX_MOVES, MoveHistory
+
+
+def randomWalk(board, count, rng):
+    """在 board 上随机走 count 步，返回实际执行的方向"""
+    directions = []
+    while len(directions) < count:
+        direction = rng.randrange(4)
+        if board.moveBlank(direction):
+            directions.append(direction)
+    return directions
+
+
+def test_rejects_max_moves_too_small_to_trim():
+    with pytest.raises(ValueError):
+        MoveHistory(3, max_moves=MIN_MAX_MOVES - 1)
+
+
+def test_small_max_moves_trims_and_keeps_position():
+    board = PuzzleBoard(3)
+    history = MoveHistory(3, max_moves=MIN_MAX_MOVES)
+    for direction in randomWalk(board, 100, random.Random(1)):
+        history.push(direction)
+        assert len(history) <= MIN_MAX_MOVES
+        assert len(history.data) <= MIN_MAX_MOVES // 4
+    assert history.total == 100
+    assert history.currentTiles() == board.tiles
+
+    # 撤销全部保留的步后回到裁剪后的起始棋盘
+    while history.canUndo():
+        board.moveBlank(history.undo())
+    assert board.tiles == history.origin.tiles
+
+
+def test_round_trip_bytes():
+    board = PuzzleBoard(4)
+    history = MoveHistory(4, max_moves=16)
+    for direction in randomWalk(board, 37, random.Random(2)):
+        history.push(direction)
+    history.undo()
+    restored = MoveHistory.fromBytes(history.toBytes())
+    assert restored.moves() == history.moves()
+    assert restored.canRedo()
+    assert restored.currentTiles() == history.currentTiles()
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from app.core import level_pack
+from app.core.level_pack import buildLevelPack, generateLevels, readLevelPack, writeLevelPack
+
+
+def test_round_trip(tmp_path):
+    rng = random.Random(0)
+    levels = []
+    for moves in range(5, 15):
+        tiles = list(range(16))
+        rng.shuffle(tiles)
+        levels.append((bytes(tiles), moves))
+    path = tmp_path / "4x4.pack"
+    writeLevelPack(path, 4, levels, optimal=False)
+    pack = readLevelPack(path)
+    assert pack.size == 4
+    assert not pack.optimal
+    assert pack.levels == levels
+    assert [moves for _, moves in pack.select(8, 10)] == [8, 9, 10]
+    assert pack.pick(20, 30) is None
+
+
+def test_corrupt_pack_is_rejected(tmp_path):
+    path = tmp_path / "3x3.pack"
+    writeLevelPack(path, 3, [(bytes(range(9)), 0)], optimal=True)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        readLevelPack(path)
+
+
+def test_optimal_levels_have_exact_lengths(distances3x3):
+    levels = generateLevels(3, 6, 12, 4, optimal=True, workers=1)
+    assert len(levels) == 4
+    for tiles, moves in levels:
+        assert 6 <= moves <= 12
+        assert distances3x3[bytes(tiles)] == moves
+
+
+def test_unreachable_tier_stops(monkeypatch, tmp_path):
+    # 3x3 最优解最多 31 步
+    monkeypatch.setattr(level_pack, "MAX_TASKS_PER_LEVEL", 2)
+    assert generateLevels(3, 40, 50, 2, optimal=False, workers=1) == []
+    monkeypatch.setitem(level_pack.DIFFICULTY_TIERS, 3, (("不可能", 40, 50),))
+    with pytest.raises(ValueError):
+        buildLevelPack(3, 2, optimal=False, workers=1, folder=tmp_path, report=lambda line: None)
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from app.core import pattern_db
+from app.core.board import PuzzleBoard
+from app.core.pattern_db import PatternDatabase, PatternDatabaseHeuristic, buildPattern, loadPattern, savePattern
+
+# 3x3 上的小分组，便于和 BFS 得到的真实距离对照
+GROUPS_3X3 = ((0, 1, 2, 3), (4, 5, 6, 7))
+
+
+def makeDatabase(groups=GROUPS_3X3):
+    tables = [buildPattern(3, pieces) for pieces in groups]
+    return PatternDatabase(3, "test", groups, tables)
+
+
+@pytest.mark.parametrize("blank_aware", [True, False])
+def test_pdb_is_admissible(distances3x3, monkeypatch, blank_aware):
+    if not blank_aware:
+        monkeypatch.setattr(pattern_db, "BLANK_AWARE_LIMIT", 0)
+    heuristic = PatternDatabaseHeuristic(3, makeDatabase())
+    tighter = 0
+    for key, distance in distances3x3.items():
+        value = heuristic.reset(key)
+        assert value <= distance
+        tighter += value > 0
+    assert tighter > len(distances3x3) // 2
+
+
+def test_pdb_incremental_delta_matches_reset():
+    heuristic = PatternDatabaseHeuristic(3, makeDatabase())
+    board = PuzzleBoard(3)
+    value = heuristic.reset(board.tiles)
+    rng = random.Random(0)
+    for _ in range(500):
+        dst = board.blank
+        if board.moveBlank(rng.randrange(4)):
+            value += heuristic.delta(board.tiles, board.tiles[dst], board.blank, dst)
+            assert value == PatternDatabaseHeuristic(3, heuristic.db).reset(board.tiles)
+
+
+def test_pattern_file_round_trip(tmp_path):
+    pieces = GROUPS_3X3[0]
+    table = buildPattern(3, pieces)
+    path = tmp_path / "3x3.pdb"
+    savePattern(path, 3, pieces, table)
+    assert bytes(loadPattern(path, 3, pieces)) == bytes(table)
+    with pytest.raises(ValueError):
+        loadPattern(path, 3, GROUPS_3X3[1])
+
+
+def test_missing_tables_are_reported(monkeypatch, tmp_path):
+    monkeypatch.setattr(pattern_db, "PDB_FOLDER", tmp_path)
+    monkeypatch.setattr(pattern_db, "_loaded", {})
+    assert not pattern_db.isAvailable(4)
+    assert pattern_db.getPatternDatabase(4) is None
+    with pytest.raises(ValueError, match="pattern_db --size 4"):
+        PatternDatabaseHeuristic(4)
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from app.core.board import PuzzleBoard
+from app.core.replay import KEYFRAME_INTERVAL, Replay, ReplayRecorder
+
+
+def recordGame(count, seed=0, image_path=""):
+    """随机走 count 步并录制，返回 (录制器, 每步之后的棋盘)"""
+    rng = random.Random(seed)
+    board = PuzzleBoard(4)
+    for _ in range(50):
+        board.moveBlank(rng.randrange(4))
+    recorder = ReplayRecorder(4, board.tiles, seed=seed, tier=2, image_path=image_path)
+    boards = [bytes(board.tiles)]
+    now = recorder._last
+    while len(boards) <= count:
+        direction = rng.randrange(4)
+        if board.moveBlank(direction):
+            now += rng.choice((0.05, 0.3, 2.0))
+            recorder.record(direction, now)
+            boards.append(bytes(board.tiles))
+    return recorder, boards
+
+
+def test_round_trip():
+    recorder, boards = recordGame(100, image_path="images/图片.jpg")
+    recorder.markCompleted()
+    replay = Replay.fromBytes(recorder.toBytes())
+    assert len(replay) == 100
+    assert replay.size == 4
+    assert replay.start_tiles == boards[0]
+    assert (replay.seed, replay.tier) == (0, 2)
+    assert replay.completed and not replay.assisted
+    assert replay.image_path == "images/图片.jpg"
+    assert bytes(replay.boardAt(len(replay)).tiles) == boards[-1]
+
+
+def test_seek_across_keyframes():
+    recorder, boards = recordGame(KEYFRAME_INTERVAL * 2 + 10, seed=1)
+    replay = Replay.fromBytes(recorder.toBytes())
+    assert len(replay.keyframes) == 3
+    for index in (0, 1, KEYFRAME_INTERVAL - 1, KEYFRAME_INTERVAL, KEYFRAME_INTERVAL + 1, len(boards) - 1):
+        assert bytes(replay.boardAt(index).tiles) == boards[index]
+    # 越界时夹到两端
+    assert bytes(replay.boardAt(-5).tiles) == boards[0]
+    assert bytes(replay.boardAt(len(boards) + 5).tiles) == boards[-1]
+
+
+def test_time_index_round_trip():
+    recorder, _ = recordGame(50, seed=2)
+    replay = Replay.fromBytes(recorder.toBytes())
+    assert replay.times == sorted(replay.times)
+    assert replay.duration == replay.times[-1]
+    for index in range(1, len(replay) + 1):
+        ms = replay.timeAt(index)
+        # 同一毫秒内的多步都算作已执行
+        assert replay.indexAtTime(ms) >= index
+        assert replay.indexAtTime(ms - 1) < index
+
+
+def test_long_image_path_is_truncated_on_character_boundary():
+    recorder = ReplayRecorder(3, range(9), image_path="图" * 30000)
+    replay = Replay.fromBytes(recorder.toBytes())
+    assert replay.image_path == "图" * (0xFFFF // 3)
+
+
+def test_corrupt_replay_is_rejected():
+    recorder, _ = recordGame(20)
+    data = recorder.toBytes()
+    with pytest.raises(ValueError):
+        Replay.fromBytes(data[:-1])
+    with pytest.raises(ValueError):
+        Replay.fromBytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        Replay.fromBytes(data[:12])
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from app.core.board import PuzzleBoard
+from app.core.history import MoveHistory
+from app.core.save_game import SaveGame, decodeSave, encodeSave, imageIdentity, readSave, saveFile, writeSave
+
+
+def makeSave(image_path=""):
+    board = PuzzleBoard(4)
+    history = MoveHistory(4)
+    rng = random.Random(0)
+    while len(history) < 40:
+        direction = rng.randrange(4)
+        if board.moveBlank(direction):
+            history.push(direction)
+    mtime_ns, size = imageIdentity(image_path)
+    return SaveGame(4, bytes(board.tiles), elapsed=95, image_path=image_path, image_mtime_ns=mtime_ns,
+                    image_size=size, level_index=2, tier_index=1, history=history.toBytes(),
+                    extra={"note": "存档"})
+
+
+def test_round_trip(tmp_path):
+    save = makeSave(str(tmp_path / "图片.jpg"))
+    path = saveFile(4, tmp_path)
+    writeSave(path, encodeSave(save))
+    restored = readSave(path)
+    assert restored == save
+    history = MoveHistory.fromBytes(restored.history)
+    assert bytes(history.currentTiles()) == restored.tiles
+
+
+def test_image_matches(tmp_path):
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"jpeg")
+    save = makeSave(str(image))
+    assert save.imageMatches()
+    image.write_bytes(b"changed")
+    assert not save.imageMatches()
+    image.unlink()
+    assert not save.imageMatches()
+
+
+def test_corrupt_saves_are_rejected(tmp_path):
+    data = encodeSave(makeSave())
+    with pytest.raises(ValueError):
+        decodeSave(data[:10])
+    with pytest.raises(ValueError):
+        decodeSave(b"XXXX" + data[4:])
+    # 排列被截断
+    with pytest.raises(ValueError):
+        decodeSave(data[:len(data) - len(makeSave().history) - 1])
+    assert readSave(tmp_path / "missing.sav") is None
+    path = tmp_path / "bad.sav"
+    path.write_bytes(data[:20])
+    assert readSave(path) is None